@@ -0,0 +1,275 @@
+"""Programmatic API: generate LookML in memory, one model at a time.
+
+    from dbt2lookml.api import GenerateOptions, generate_views
+
+    for relative_path, lookml_text, stats in generate_views('target/manifest.json', 'target/catalog.json'):
+        ...
+
+    async for relative_path, lookml_text, stats in agenerate_views(manifest, catalog):
+        ...
+
+Nothing is written to disk: every view is yielded as the text the CLI would
+write to relative_path under its output directory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Executor
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncIterator, Dict, Generator, List, NamedTuple, Optional, Union
+
+from dbt2lookml.exceptions import CliError
+
+Artifact = Union[Dict[str, Any], str, 'os.PathLike[str]']
+
+# Models generated per executor call of agenerate_views
+DEFAULT_BATCH_SIZE = 8
+
+
+@dataclass(frozen=True)
+class GenerateOptions:
+    """Options of generate_views, named after the matching command line arguments."""
+
+    select: Optional[str] = None
+    tag: Optional[str] = None
+    include_models: Optional[List[str]] = None
+    exclude_models: Optional[List[str]] = None
+    exposures_only: bool = False
+    exposures_tag: Optional[str] = None
+    use_table_name: bool = False
+    include_iso_fields: bool = False
+    # Timeframes of generated dimension groups by type, e.g. {'date': ['date', 'week']}
+    timeframes: Dict[str, List[str]] = field(default_factory=dict)
+    validate: bool = False
+    continue_on_error: bool = False
+
+    def to_args(self) -> argparse.Namespace:
+        """Get the options as the parsed arguments the parser and generators read."""
+        return argparse.Namespace(**asdict(self))
+
+
+class ViewStats(NamedTuple):
+    """What went into a generated file."""
+
+    unique_id: str
+    model_name: str
+    views: int
+    dimensions: int
+    dimension_groups: int
+    measures: int
+    joins: int
+    seconds: float
+
+
+class GeneratedView(NamedTuple):
+    """A generated file, unpacking as (relative_path, lookml_text, stats)."""
+
+    relative_path: str
+    lookml_text: str
+    stats: ViewStats
+
+
+def _as_list(value: Any) -> List[Dict[str, Any]]:
+    if isinstance(value, dict):
+        return [value]
+    return [item for item in value or [] if isinstance(item, dict)]
+
+
+def _view_stats(model, lookml: Dict[str, Any], seconds: float) -> ViewStats:
+    views = _as_list(lookml.get('view'))
+    return ViewStats(
+        unique_id=model.unique_id,
+        model_name=model.name,
+        views=len(views),
+        dimensions=sum(len(_as_list(view.get('dimensions'))) for view in views),
+        dimension_groups=sum(len(_as_list(view.get('dimension_groups'))) for view in views),
+        measures=sum(len(_as_list(view.get('measures'))) for view in views),
+        joins=sum(len(_as_list(explore.get('joins'))) for explore in _as_list(lookml.get('explore'))),
+        seconds=seconds,
+    )
+
+
+def _read_artifact(artifact: Artifact) -> Dict[str, Any]:
+    if isinstance(artifact, dict):
+        return artifact
+    from dbt2lookml.utils import FileHandler
+
+    return FileHandler().read(os.fspath(artifact))
+
+
+def _render_view(args: argparse.Namespace, model, table_name_suffixes: Dict[str, int], fragment_cache) -> GeneratedView:
+    """Render a model updated with catalog info into the file the CLI writes for it.
+
+    Raises:
+        CliError: With args.validate, if the view fails validation
+    """
+    from dbt2lookml.cli import Cli
+
+    start = time.perf_counter()
+    file_path, lookml, contents = Cli._render_model(args, model, fragment_cache)
+    file_path = Cli._numbered_file_path(file_path, table_name_suffixes.get(model.unique_id, 0))
+    if args.validate:
+        from dbt2lookml.validation import LookMLStructureValidator
+
+        result = LookMLStructureValidator().validate(lookml, file_path)
+        if not result['valid']:
+            raise CliError(f"Generated LookML for {model.name} failed validation", str(result['errors']))
+    # The path as written below the output directory, without the empty segments of model paths
+    relative_path = os.path.normpath(file_path)
+    return GeneratedView(relative_path, contents, _view_stats(model, lookml, time.perf_counter() - start))
+
+
+def generate_views(
+    manifest: Artifact, catalog: Artifact, options: Optional[GenerateOptions] = None
+) -> Generator[GeneratedView, None, None]:
+    """Generate the LookML views of dbt models lazily, without writing files.
+
+    The artifacts are parsed when iteration starts; after that every model is
+    updated with catalog info, generated and released before the next one, so
+    memory does not grow with the number of models. Models come in manifest
+    order, and the files of models sharing a table name are numbered as the CLI
+    numbers them.
+
+    Args:
+        manifest: The dbt manifest as a dict, or the path of manifest.json
+        catalog: The dbt catalog as a dict, or the path of catalog.json
+        options: Model selection and generation options, defaults if None
+
+    Yields:
+        A GeneratedView (relative_path, lookml_text, stats) per model
+
+    Raises:
+        CliError: If an artifact cannot be read, or, unless options.continue_on_error,
+            a generated view fails validation
+        Exception: Unless options.continue_on_error, the error generating a model
+    """
+    from dbt2lookml.cli import Cli
+    from dbt2lookml.generators.fragment_cache import FragmentCache
+    from dbt2lookml.parsers import DbtParser
+
+    args = (options or GenerateOptions()).to_args()
+    parser = DbtParser(args, _read_artifact(manifest), _read_artifact(catalog))
+    try:
+        models = parser.select_models()
+        table_name_suffixes = Cli._table_name_suffixes(args, models) if args.use_table_name else {}
+        # Dimensions and measures of identical columns are shared across models
+        fragment_cache = FragmentCache()
+        for model in parser.iter_models(models):
+            try:
+                view = _render_view(args, model, table_name_suffixes, fragment_cache)
+            except Exception as e:
+                if not args.continue_on_error:
+                    raise
+                logging.error(f"Failed to generate view for model {model.name}: {str(e)}")
+                continue
+            finally:
+                parser.release(model)
+            yield view
+    finally:
+        parser.close()
+
+
+class _Batches:
+    """Takes batches of views from a generate_views generator, in executor threads one at a time."""
+
+    def __init__(self, views: Generator[GeneratedView, None, None], size: int):
+        self._views = views
+        self._size = size
+        # Held while the generator runs: a generator cannot be closed while it is executing
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        # Raised by the generator after some views of a batch, raised with the next batch
+        self.error: Optional[BaseException] = None
+
+    def next(self) -> List[GeneratedView]:
+        """Generate the next batch, shorter than the batch size once all models are generated or one failed.
+
+        Raises:
+            Exception: The error of the generator, if it was raised before any view of the batch
+        """
+        if self.error is not None:
+            error, self.error = self.error, None
+            raise error
+        batch: List[GeneratedView] = []
+        with self._lock:
+            try:
+                while len(batch) < self._size and not self._cancelled.is_set():
+                    view = next(self._views, None)
+                    if view is None:
+                        break
+                    batch.append(view)
+            except Exception as e:
+                if not batch:
+                    raise
+                # The views generated before the error are yielded first
+                self.error = e
+            if self._cancelled.is_set():
+                self._views.close()
+        return batch
+
+    def cancel(self) -> None:
+        """Stop generating; a running batch stops after its current model and closes the generator."""
+        self._cancelled.set()
+        if self._lock.acquire(blocking=False):
+            try:
+                self._views.close()
+            finally:
+                self._lock.release()
+
+
+async def agenerate_views(
+    manifest: Artifact,
+    catalog: Artifact,
+    options: Optional[GenerateOptions] = None,
+    executor: Optional[Executor] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[GeneratedView]:
+    """Generate the LookML views of dbt models without blocking the event loop.
+
+    Parsing and generation run in batches of models in an executor thread, see
+    generate_views. While a batch is consumed the next one is generated, and no
+    further: a slow consumer holds generation back. Cancelling the consuming
+    task, or closing the iterator early, stops generation after the model being
+    generated and releases the parsed artifacts.
+
+    Args:
+        manifest: The dbt manifest as a dict, or the path of manifest.json
+        catalog: The dbt catalog as a dict, or the path of catalog.json
+        options: Model selection and generation options, defaults if None
+        executor: Thread pool to generate in, the loop's default executor if None. Generation
+            keeps the parsed artifacts in this process, so it cannot be a process pool
+        batch_size: Models generated per executor call
+
+    Yields:
+        A GeneratedView (relative_path, lookml_text, stats) per model
+
+    Raises:
+        CliError: If an artifact cannot be read, or, unless options.continue_on_error,
+            a generated view fails validation
+        Exception: Unless options.continue_on_error, the error generating a model, once the
+            views generated before it are yielded
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}")
+    loop = asyncio.get_running_loop()
+    batches = _Batches(generate_views(manifest, catalog, options), batch_size)
+    # The batch being generated, None once the last one was taken
+    pending: Optional[asyncio.Future[List[GeneratedView]]] = loop.run_in_executor(executor, batches.next)
+    try:
+        while pending is not None:
+            batch = await pending
+            done = len(batch) < batch_size and batches.error is None
+            pending = None if done else loop.run_in_executor(executor, batches.next)
+            for view in batch:
+                yield view
+    finally:
+        batches.cancel()
+        if pending is not None:
+            # The batch still being generated is not waited for, nor its result kept
+            pending.cancel()
@@ -1,32 +1,35 @@
 import argparse
+import itertools
 import logging
 import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Tuple
 
-import yaml
+from dbt2lookml.exceptions import CliError, ModelTimeoutError
+from dbt2lookml.output_manifest import OutputManifest
+from dbt2lookml.scheduling import schedule_models
+from dbt2lookml.sharding import SHARD_REPORT_FILE, ShardReport, shard_models, shard_spec
+from dbt2lookml.utils import FileHandler
 
-try:
-    from importlib.metadata import version
-except ImportError:
-    from importlib_metadata import version
-try:
-    import lkml
-except ImportError:
-    lkml = None
-from typing import Any, Dict
+# yaml, rich, lkml, the pydantic models, generators and validators are imported where they are
+# first needed, so --help, --version and small runs from pre-commit hooks start quickly
+if TYPE_CHECKING:
+    from dbt2lookml.parsers import DbtParser
 
-from rich.logging import RichHandler
 
-from dbt2lookml.exceptions import CliError
-from dbt2lookml.generators import LookmlGenerator
-from dbt2lookml.parsers import DbtParser
-from dbt2lookml.utils import FileHandler
+class _VersionAction(argparse.Action):
+    """Print the installed version and exit, only looking it up when --version is given."""
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    datefmt="[%X]",
-    handlers=[RichHandler()],
-)
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        try:
+            from importlib.metadata import version
+        except ImportError:
+            from importlib_metadata import version
+        print(f'dbt2lookml {version("dbt2lookml")}')
+        parser.exit()
 
 
 class Cli:
@@ -45,9 +48,14 @@ class Cli:
         """Initialize CLI with argument parser and file handler."""
         self._args_parser = self._init_argparser()
         self._file_handler = FileHandler()
+        # Unique ids of all nodes in the parsed dbt manifest, to tell deleted models from filtered ones
+        self._dbt_unique_ids = None
+        self._total_models_in_manifest = 0
 
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file."""
+        import yaml
+
         try:
             with open(config_path, 'r') as file:
                 config = yaml.safe_load(file)
@@ -68,6 +76,8 @@ class Cli:
             'output_dir': '.',
             'tag': None,
             'log_level': 'INFO',
+            'log_format': 'rich',
+            'log_rate_limit': 100,
             'remove_schema_string': None,
             'exposures_only': False,
             'exposures_tag': None,
@@ -79,6 +89,12 @@ class Cli:
             'exclude_models': None,
             'timeframes': None,
             'include_iso_fields': False,
+            'remove_stale': False,
+            'workers': 1,
+            'backend': 'processes',
+            'max_tasks_per_worker': None,
+            'memory_limit': None,
+            'model_timeout': None,
         }
 
     def _merge_config_with_args(self, args: argparse.Namespace, config_file: Dict[str, Any]) -> argparse.Namespace:
@@ -112,8 +128,8 @@ class Cli:
         )
         parser.add_argument(
             '--version',
-            action='version',
-            version=f'dbt2lookml {version("dbt2lookml")}',
+            help="show program's version number and exit",
+            action=_VersionAction,
         )
         parser.add_argument(
             '--manifest-path',
@@ -145,6 +161,19 @@ class Cli:
             type=str,
             default='INFO',
         )
+        parser.add_argument(
+            '--log-format',
+            help='Render logs for the terminal (rich, default) or as plain text or JSON lines for CI',
+            choices=['rich', 'plain', 'json'],
+            type=str,
+            default='rich',
+        )
+        parser.add_argument(
+            '--log-rate-limit',
+            help='Log at most this many debug and info records per log statement and minute, 0 for no limit (default: 100)',
+            type=int,
+            default=100,
+        )
         parser.add_argument(
             '--output-dir',
             help='Path to a directory that will contain the generated lookml files',
@@ -180,7 +209,7 @@ class Cli:
         )
         parser.add_argument(
             '--generate-locale',
-            help='Generate locale files for each label on each field in view',
+            help='Generate a locale strings file (en.strings.json) with the labels of all generated views',
             action='store_true',
         )
         parser.add_argument(
@@ -208,9 +237,63 @@ class Cli:
             type=str,
             default=None,
         )
+        parser.add_argument(
+            '--remove-stale',
+            help='Remove files written by earlier runs for models that were deleted or renamed (default: only report them)',
+            action='store_true',
+        )
+        parser.add_argument(
+            '--shard',
+            help='Only generate shard INDEX of COUNT (e.g. 2/4), balanced by estimated cost, for splitting a run across CI nodes',
+            type=shard_spec,
+            default=None,
+            metavar='INDEX/COUNT',
+        )
+        parser.add_argument(
+            '--shard-report',
+            help='Path of the run report, also written without --shard (default: .dbt2lookml_shard_INDEX_of_COUNT.json in the output directory)',
+            type=str,
+            default=None,
+        )
+        parser.add_argument(
+            '--workers',
+            help='Render models in this many worker processes or threads (default: 1, in the main process)',
+            type=int,
+            default=1,
+        )
+        parser.add_argument(
+            '--backend',
+            help='Run the workers as processes, or as threads sharing the parsed artifacts for free-threaded Python (default: processes)',
+            choices=['processes', 'threads'],
+            default='processes',
+        )
+        parser.add_argument(
+            '--max-tasks-per-worker',
+            help='Replace a worker process after it rendered this many models, returning its memory',
+            type=int,
+            default=None,
+        )
+        parser.add_argument(
+            '--memory-limit',
+            help='Memory ceiling of the worker processes in MB: expensive models wait for others to finish rather than exceed it',
+            type=int,
+            default=None,
+            metavar='MB',
+        )
+        parser.add_argument(
+            '--model-timeout',
+            help=(
+                'Give up on a model still rendering this many seconds after a worker started it and record it as timed out; '
+                'renders in worker processes. All worker processes are terminated on a timeout, restarting the other models '
+                'they were rendering. A worker thread cannot be stopped: it finishes the model in the background until the run exits'
+            ),
+            type=float,
+            default=None,
+            metavar='SECONDS',
+        )
         parser.add_argument(
             '--validate',
-            help='Validate generated LookML files for syntax errors',
+            help='Validate generated LookML (required keys, SQL expressions, unique names, join references) before writing',
             action='store_true',
         )
         return parser
@@ -224,13 +307,12 @@ class Cli:
         """Write LookML content to a file."""
         try:
             # Create directory structure
-            file_name = os.path.basename(file_path)
-            file_path = os.path.join(output_dir, file_path.split(file_name)[0]).strip('/')
-            os.makedirs(file_path, exist_ok=True)
-            file_path = f'{file_path}/{file_name}'
+            directory = os.path.join(output_dir, os.path.dirname(file_path))
+            os.makedirs(directory, exist_ok=True)
+            file_path = os.path.join(directory, os.path.basename(file_path))
             # Write contents
             self._file_handler.write(file_path, contents)
-            logging.debug(f'Generated {file_path}')
+            logging.debug('Generated %s', file_path)
             return file_path
         except OSError as e:
             logging.error(f"Failed to write file {file_path}: {str(e)}")
@@ -239,54 +321,128 @@ class Cli:
             logging.error(f"Unexpected error writing file {file_path}: {str(e)}")
             raise CliError(f"Unexpected error writing file {file_path}: {str(e)}") from e
 
-    def generate(self, args, models):
-        """Generate LookML views from dbt models using concurrent processing"""
-        if not models:
+    def generate(self, args, models, shard_report=None, table_name_suffixes=None, pool=None, release=None):
+        """Generate LookML views from dbt models using concurrent processing
+
+        Models may be any iterable, such as DbtParser.iter_models, so only the model
+        being generated needs to be held in memory. With --use-table-name, models
+        sharing a table name get the suffixes in table_name_suffixes (see
+        _table_name_suffixes), or else numbered in the order they are generated.
+        With a GenerationPool, models are rendered in its worker processes or
+        threads and validated, written and indexed here as they finish, so the
+        table name counter, duplicate tracking and indexes stay with this thread.
+        Each model is passed to release, e.g. DbtParser.release, once it is handled.
+        """
+        from dbt2lookml.generators.fragment_cache import FragmentCache
+        from dbt2lookml.locale_strings import LabelTable
+        from dbt2lookml.validation import VALIDATION_CACHE_FILE, FieldReferenceIndex, LookMLStructureValidator, ValidationCache
+
+        models = iter(models)
+        first_model = next(models, None)
+        if first_model is None:
             logging.warning("No models found to process")
             return []
+        models = itertools.chain([first_model], models)
         logging.info('Parsing dbt models (bigquery) and creating lookml views...')
 
         views = []
         failed_count = 0
         validation_failed_count = 0
+        timeout_count = 0
         written_files = {}  # Track unique file paths in main thread
         duplicate_files = []  # Track duplicates
         failed_models = []  # Track which models failed
 
         # Counter for table name duplicates (only used when --use-table-name is set)
-        table_name_counter = {} if args.use_table_name else None
+        table_name_counter = dict(table_name_suffixes or {}) if args.use_table_name else None
+        # Dimensions and measures of identical columns are shared across models
+        fragment_cache = FragmentCache()
+        # Views, fields and the references between them, resolved once all files are generated
+        reference_index = FieldReferenceIndex()
+        # Files written by earlier runs, to find the ones no model owns anymore
+        output_manifest = OutputManifest(args.output_dir, self._file_handler)
+        # Generated files that already validated clean in an earlier run are not validated again
+        validation_cache = (
+            ValidationCache(Path(args.output_dir) / VALIDATION_CACHE_FILE, LookMLStructureValidator.version, self._file_handler)
+            if args.validate
+            else None
+        )
+        # Labels of the written files, for the locale strings file
+        label_table = LabelTable(args.output_dir, file_handler=self._file_handler) if args.generate_locale else None
 
         # Process models sequentially
-        for i, model in enumerate(models):
+        total_attempted = 0
+        rendered_models = pool.render(models) if pool is not None else ((model, None) for model in models)
+        if release is not None:
+            rendered_models = self._released(rendered_models, release)
+        for model, rendered in rendered_models:
+            total_attempted += 1
+            if isinstance(rendered, ModelTimeoutError):
+                logging.error(f"Timed out generating view for model {model.name}: {str(rendered)}")
+                timeout_count += 1
+                failed_models.append(f"{model.name} (timeout)")
+                if shard_report is not None:
+                    shard_report.record(model, 'timeout')
+                if not args.continue_on_error:
+                    raise rendered
+                continue
             try:
-                result = self._generate_single_model(args, model, table_name_counter)
+                result = self._generate_single_model(
+                    args,
+                    model,
+                    table_name_counter,
+                    fragment_cache,
+                    reference_index,
+                    validation_cache,
+                    output_manifest,
+                    label_table,
+                    rendered,
+                )
 
                 if result and result != 'validation_failed':
                     # Debug: Log what we're adding to written_files
-                    logging.debug(f"Model {model.name} returned result: {result}")
+                    logging.debug("Model %s returned result: %s", model.name, result)
                     # Check for duplicate file paths
                     if result in written_files:
                         duplicate_files.append((model.name, result))
-                        logging.debug(f"Duplicate file path detected: {result}")
+                        logging.debug("Duplicate file path detected: %s", result)
                     else:
                         written_files[result] = 1
-                        logging.debug(f"Added to written_files: {result} (total: {len(written_files)})")
+                        logging.debug("Added to written_files: %s (total: %s)", result, len(written_files))
                     views.append(result)
+                    if shard_report is not None:
+                        shard_report.record(model, 'written', os.path.relpath(result, args.output_dir))
                 elif result == 'validation_failed':
                     validation_failed_count += 1
                     failed_models.append(f"{model.name} (validation)")
+                    if shard_report is not None:
+                        shard_report.record(model, 'validation_failed')
                 else:
                     failed_count += 1
                     failed_models.append(f"{model.name} (generation)")
+                    if shard_report is not None:
+                        shard_report.record(model, 'failed')
 
             except Exception as e:
                 logging.error(f"Failed to generate view for model {model.name}: {str(e)}")
                 failed_count += 1
                 failed_models.append(f"{model.name} (exception: {str(e)[:50]}...)")
+                if shard_report is not None:
+                    shard_report.record(model, 'failed')
                 if not args.continue_on_error:
                     raise
 
-        total_attempted = len(models)
+        if validation_cache is not None:
+            validation_cache.save()
+        stale_files = output_manifest.stale_files(self._dbt_unique_ids)
+        if stale_files and args.remove_stale:
+            removed_files = output_manifest.remove_files(stale_files)
+            logging.info(f'Removed {len(removed_files)} stale file(s) of deleted or renamed models')
+            stale_files = [file_path for file_path in stale_files if file_path not in removed_files]
+        output_manifest.save(self._dbt_unique_ids, stale_files)
+        if label_table is not None:
+            self._write_locale_strings(label_table)
+
         files_written = len(views)
         unique_files_written = len(written_files)
         files_generated = files_written + validation_failed_count
@@ -296,6 +452,24 @@ class Cli:
         logging.info(f'  - Models to process: {total_attempted}')
         logging.info(f'  - Files written: {files_written}')
         logging.info(f'  - Unique file paths: {unique_files_written}')
+        if pool is not None and pool.held_back:
+            logging.info(f'  - Models held back by the memory limit: {pool.held_back}')
+        # Workers keep their own fragment caches
+        for kind, kind_stats in (fragment_cache.stats() if pool is None else {}).items():
+            lookups = kind_stats['hits'] + kind_stats['misses']
+            logging.info(
+                f"  - Cached {kind} fragments: {kind_stats['hits']}/{lookups} hits ({kind_stats['hit_rate'] * 100:.1f}%)"
+            )
+
+        dangling_references = reference_index.dangling()
+        if dangling_references:
+            logging.warning(f'  - Dangling field references: {len(dangling_references)}')
+            for dangling_reference in dangling_references[:5]:
+                logging.warning(f'    {dangling_reference}')
+
+        if stale_files:
+            logging.warning(f'  - Stale files of deleted or renamed models: {len(stale_files)} (remove with --remove-stale)')
+            logging.warning(f'    First few stale files: {stale_files[:3]}')
 
         if duplicate_files:
             logging.warning(f'  - Duplicate file paths detected: {len(duplicate_files)}')
@@ -308,6 +482,10 @@ class Cli:
                 logging.warning(
                     f'    Validation failures: {validation_failures[:3]}{", ..." if len(validation_failures) > 3 else ""}'
                 )
+        if timeout_count > 0:
+            logging.warning(f'  - Models timed out: {timeout_count}')
+            timed_out_models = [m for m in failed_models if '(timeout)' in m]
+            logging.warning(f'    Timed out models: {timed_out_models[:5]}{", ..." if len(timed_out_models) > 5 else ""}')
         if failed_count > 0:
             logging.warning(f'  - Files failed to generate: {failed_count}')
             logging.warning(f'    Failed models: {failed_models[:5]}{", ..." if len(failed_models) > 5 else ""}')
@@ -318,7 +496,13 @@ class Cli:
             logging.info(f'  - Success rate: {success_rate:.1f}% ({unique_files_written}/{total_attempted})')
 
         # Only report success if all files were written successfully and no duplicates
-        if failed_count == 0 and validation_failed_count == 0 and not duplicate_files:
+        if (
+            failed_count == 0
+            and validation_failed_count == 0
+            and timeout_count == 0
+            and not duplicate_files
+            and not dangling_references
+        ):
             logging.info('All files generated successfully')
         elif unique_files_written > 0:
             logging.info('Generation completed with some issues')
@@ -326,45 +510,103 @@ class Cli:
             logging.error('Generation failed - no files were written')
         return views
 
-    def _generate_single_model(self, args, model, table_name_counter=None):
-        """Generate and validate LookML for a single model."""
-        try:
-            lookml_generator = LookmlGenerator(args)
-            file_path, lookml = lookml_generator.generate(model=model)
+    @staticmethod
+    def _render_model(args, model, fragment_cache=None) -> Tuple[str, Dict, str]:
+        """Generate the LookML of a model and render it with its header comment.
 
-            # Generate LookML content and prepend header comment
-            lookml_content = lkml.dump(lookml)
+        Args:
+            args: Parsed arguments
+            model: Model updated with catalog info
+            fragment_cache: Cache of dimensions and measures shared across models
 
-            # Generate header comment with model metadata
-            header_comment = lookml_generator.view_generator._generate_model_header_comment(model)
-            contents = header_comment + lookml_content
+        Returns:
+            File path relative to the output directory, the LookML and the file contents
+        """
+        import lkml
 
-            # Handle duplicate file paths when using table names
-            if args.use_table_name and table_name_counter is not None:
-                original_path = file_path
-                counter = table_name_counter.get(original_path, 0)
-                if counter > 0:
-                    # Append number to file name
-                    base_path, ext = os.path.splitext(file_path)
-                    file_path = f"{base_path}_{counter}{ext}"
-                table_name_counter[original_path] = counter + 1
+        from dbt2lookml.generators import LookmlGenerator
+
+        lookml_generator = LookmlGenerator(args)
+        if fragment_cache is not None:
+            lookml_generator.use_fragment_cache(fragment_cache)
+        file_path, lookml = lookml_generator.generate(model=model)
+
+        # Generate LookML content and prepend header comment
+        lookml_content = lkml.dump(lookml)
+
+        # Generate header comment with model metadata
+        header_comment = lookml_generator.view_generator._generate_model_header_comment(model)
+        return file_path, lookml, header_comment + lookml_content
+
+    @staticmethod
+    def _numbered_file_path(file_path: str, counter: int) -> str:
+        """Number the file path of a model sharing its table name with earlier models, 0 for none."""
+        if counter > 0:
+            # Append number to file name
+            base_path, ext = os.path.splitext(file_path)
+            file_path = f"{base_path}_{counter}{ext}"
+        return file_path
+
+    def _generate_single_model(
+        self,
+        args,
+        model,
+        table_name_counter=None,
+        fragment_cache=None,
+        reference_index=None,
+        validation_cache=None,
+        output_manifest=None,
+        label_table=None,
+        rendered=None,
+    ):
+        """Generate and validate LookML for a single model.
+
+        The model is rendered here unless a worker already rendered it, in which case
+        rendered is the result of _render_model or the exception it raised.
+        """
+        from dbt2lookml.validation import LookMLStructureValidator, ValidationCache
 
-            # Validate the generated content before writing (only if --validate flag is set)
-            if args.validate:
-                from dbt2lookml.validation import LookMLValidator
+        try:
+            if rendered is None:
+                file_path, lookml, contents = self._render_model(args, model, fragment_cache)
+            elif isinstance(rendered, BaseException):
+                raise rendered
+            else:
+                file_path, lookml, contents = rendered
 
-                validator = LookMLValidator()
-                validation_result = validator.validate_lookml_string(contents, file_path)
+            # Handle duplicate file paths when using table names
+            if args.use_table_name and table_name_counter is not None:
+                # Suffixes assigned up front by unique_id do not depend on the generation order
+                counter = table_name_counter.get(model.unique_id)
+                if counter is None:
+                    original_path = file_path
+                    counter = table_name_counter.get(original_path, 0)
+                    table_name_counter[original_path] = counter + 1
+                file_path = self._numbered_file_path(file_path, counter)
+
+            # Validate the generated structure before writing (only if --validate flag is set)
+            content_hash = ValidationCache.content_hash(contents) if validation_cache is not None else None
+            if args.validate and not (validation_cache is not None and validation_cache.is_clean(content_hash)):
+                validator = LookMLStructureValidator()
+                validation_result = validator.validate(lookml, file_path)
 
                 if not validation_result['valid']:
                     logging.error(f"Generated LookML for {model.name} failed validation: {validation_result['errors']}")
                     return 'validation_failed'
+                if validation_cache is not None:
+                    validation_cache.mark_clean(content_hash)
 
             written_file_path = self._write_lookml_file(
                 output_dir=args.output_dir,
                 file_path=file_path,
                 contents=contents,
             )
+            if reference_index is not None:
+                reference_index.add(written_file_path, lookml, model)
+            if output_manifest is not None:
+                output_manifest.record(model.unique_id, file_path)
+            if label_table is not None:
+                label_table.add_lookml(lookml)
             return written_file_path
         except Exception as e:
             logging.error(f"Failed to generate view for model {model.name}: {str(e)}")
@@ -378,23 +620,39 @@ class Cli:
         """Legacy method signature for backward compatibility with tests."""
         return self._generate_single_model(args, model, None)
 
+    @staticmethod
+    def _released(rendered_models, release):
+        """Pass each rendered model to release once the consumer asks for the next one or stops."""
+        for model, rendered in rendered_models:
+            try:
+                yield model, rendered
+            finally:
+                release(model)
+
+    def _create_parser(self, args) -> 'DbtParser':
+        """Read the dbt artifacts into a parser, which keeps only what generation needs of them."""
+        from dbt2lookml.parsers import DbtParser
+
+        # Use custom paths if provided, otherwise fall back to target_dir
+        manifest_path = args.manifest_path if args.manifest_path else os.path.join(args.target_dir, 'manifest.json')
+        catalog_path = args.catalog_path if args.catalog_path else os.path.join(args.target_dir, 'catalog.json')
+
+        manifest: Dict = self._file_handler.read(manifest_path)
+        catalog: Dict = self._file_handler.read(catalog_path)
+        self._dbt_unique_ids = set(manifest.get('nodes', {})) if isinstance(manifest, dict) else None
+        self._total_models_in_manifest = len(manifest.get('nodes', {})) if isinstance(manifest, dict) else 0
+        return DbtParser(args, manifest, catalog)
+
     def parse(self, args):
         """parse dbt models"""
         try:
-            # Use custom paths if provided, otherwise fall back to target_dir
-            manifest_path = args.manifest_path if args.manifest_path else os.path.join(args.target_dir, 'manifest.json')
-            catalog_path = args.catalog_path if args.catalog_path else os.path.join(args.target_dir, 'catalog.json')
-
-            manifest: Dict = self._file_handler.read(manifest_path)
-            catalog: Dict = self._file_handler.read(catalog_path)
-            parser = DbtParser(args, manifest, catalog)
+            parser = self._create_parser(args)
             models = parser.get_models()
 
             # Log parsing results
-            total_models_in_manifest = len(manifest.get('nodes', {})) if isinstance(manifest, dict) else 0
             models_after_filtering = len(models)
             logging.info(
-                f'Found {total_models_in_manifest} models in manifest, {models_after_filtering} models after filtering and processing'
+                f'Found {self._total_models_in_manifest} models in manifest, {models_after_filtering} models after filtering and processing'
             )
 
             return models
@@ -403,27 +661,140 @@ class Cli:
         except Exception as e:
             raise CliError(f"Unexpected error parsing dbt models: {str(e)}") from e
 
+    def select(self, args):
+        """Select dbt models to generate, without updating them with catalog info yet.
+
+        Returns:
+            The parser, to update the selected models with catalog info one at a time
+            with DbtParser.iter_models, and the selected models
+        """
+        try:
+            parser = self._create_parser(args)
+            models = parser.select_models()
+            logging.info(f'Found {self._total_models_in_manifest} models in manifest, {len(models)} models after filtering')
+            return parser, models
+        except FileNotFoundError as e:
+            raise CliError(f"Failed to read file: {str(e)}") from e
+        except Exception as e:
+            raise CliError(f"Unexpected error parsing dbt models: {str(e)}") from e
+
+    @staticmethod
+    def _table_name_suffixes(args, models) -> Dict[str, int]:
+        """Number the models sharing a table name file path in their manifest order.
+
+        With --use-table-name, the second and later models writing to the same path
+        get a numbered file name. Numbering them before models are scheduled keeps
+        file names the same whatever order or shard models are generated in.
+
+        Args:
+            args: Parsed arguments
+            models: Selected models, in manifest order
+
+        Returns:
+            Suffix number by unique_id, 0 for no suffix
+        """
+        from dbt2lookml.generators import LookmlGenerator
+
+        lookml_generator = LookmlGenerator(args)
+        counter: Dict[str, int] = {}
+        suffixes = {}
+        for model in models:
+            file_path = lookml_generator._get_file_path(model, model.name)
+            suffixes[model.unique_id] = counter.get(file_path, 0)
+            counter[file_path] = suffixes[model.unique_id] + 1
+        return suffixes
+
+    def _write_locale_strings(self, label_table) -> None:
+        """Write the labels of the generated files to the locale strings file."""
+        try:
+            label_table.write()
+            logging.info(
+                f'Locale strings written to {label_table.path}: {len(label_table)} labels '
+                f'({len(label_table) - label_table.previous_count} new)'
+            )
+        except (OSError, CliError) as e:
+            raise CliError(f"Failed to write locale strings file {label_table.path}: {str(e)}") from e
+
+    def _write_shard_report(self, args, shard_report: ShardReport) -> None:
+        """Write the run report of a shard, for merging with python -m dbt2lookml.sharding."""
+        report_path = args.shard_report or os.path.join(
+            args.output_dir, SHARD_REPORT_FILE.format(index=shard_report.index, count=shard_report.count)
+        )
+        try:
+            os.makedirs(os.path.dirname(report_path) or '.', exist_ok=True)
+            shard_report.write(report_path)
+            logging.info(f'Shard report written to {report_path}')
+        except OSError as e:
+            raise CliError(f"Failed to write shard report {report_path}: {str(e)}") from e
+
     def run(self):
         """Run the CLI"""
+        from dbt2lookml.logs import configure_logging
+
+        queue_logging = None
+        parser = None
         try:
             args = self._args_parser.parse_args()
             # Load and merge configuration if provided
             if args.config:
                 config_file = self._load_config(args.config)
                 args = self._merge_config_with_args(args, config_file)
+            # Records are rendered by a listener thread, so generation never waits on the terminal
+            queue_logging = configure_logging(args.log_format, args.log_rate_limit)
+            if args.config:
                 logging.info(f"Loaded configuration from: {args.config}")
             logging.getLogger().setLevel(args.log_level)
-            models = self.parse(args)
+            parser, models = self.select(args)
             if not models:
                 logging.error('No models found to process. Check your filtering criteria.')
                 return
-            generated_views = self.generate(args, models)
+            table_name_suffixes = self._table_name_suffixes(args, models) if args.use_table_name else None
+            # The most expensive models go first, estimated from the shape of their catalog columns
+            schedule = schedule_models(models, parser.column_types)
+            logging.info(f'Scheduled {len(models)} models, most expensive first: {schedule.summary()}')
+            shard_report = None
+            if args.shard:
+                shard_index, shard_count = args.shard
+                schedule = schedule.only(shard_models(schedule.models, shard_index, shard_count, schedule.cost))
+                logging.info(f'Shard {shard_index}/{shard_count}: {len(schedule.models)} of {len(models)} models')
+            schedule.log_decisions()
+            if args.shard or args.shard_report:
+                shard_report = ShardReport(*(args.shard or (1, 1)), weight=schedule.cost)
+                shard_report.schedule = schedule.decisions()
+            pool = None
+            # A model can only be given up on in a worker process, so a time budget implies at least one
+            if args.workers > 1 or args.model_timeout:
+                from dbt2lookml.parallel import GenerationPool
+
+                pool = GenerationPool(
+                    args,
+                    max(1, args.workers),
+                    schedule.cost,
+                    args.max_tasks_per_worker,
+                    args.memory_limit,
+                    args.model_timeout,
+                    args.backend,
+                )
+                if args.backend == 'processes':
+                    # Models sent to worker processes share an index of the raw catalog instead of each carrying a copy
+                    parser.index_catalog()
+            # Models are updated with catalog info, generated, written and released one at a time
+            generated_views = self.generate(
+                args, parser.iter_models(schedule.models), shard_report, table_name_suffixes, pool, parser.release
+            )
+            if shard_report is not None:
+                self._write_shard_report(args, shard_report)
 
             # Validation is now done inline during generation
 
         except CliError as e:
             # Logs should already be printed by the handler
             logging.error(f'Error occurred during generation. {str(e)}')
+        finally:
+            if parser is not None:
+                parser.close()
+            if queue_logging is not None:
+                queue_logging.stop()
 
 
 def main():
@@ -0,0 +1,334 @@
+"""Local daemon generating single views on demand over a Unix socket.
+
+Editor integrations and pre-commit hooks generate one model at a time. The
+daemon parses the dbt artifacts once, keeps the selected models indexed and the
+generator caches warm, and re-parses the artifacts when their files change:
+
+    python -m dbt2lookml.daemon serve --target-dir target
+    python -m dbt2lookml.daemon generate orders --output-dir lookml
+
+Requests and responses are JSON lines: {"model": NAME_OR_UNIQUE_ID} is answered
+with {"relative_path", "lookml_text", "stats"}, or {"error"}.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import signal
+import socket
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from dbt2lookml.api import GeneratedView, GenerateOptions, ViewStats, _render_view
+from dbt2lookml.exceptions import CliError
+
+if TYPE_CHECKING:
+    from dbt2lookml.generators.fragment_cache import FragmentCache
+    from dbt2lookml.models.dbt import DbtModel
+    from dbt2lookml.parsers import DbtParser
+
+# Socket of the daemon, relative to the directory it is started in unless a path is given
+DEFAULT_SOCKET = '.dbt2lookml.sock'
+# Generated views kept until the artifacts change, least recently requested are evicted first
+CACHED_VIEWS = 512
+
+
+class ViewService:
+    """Generates the views of single models from artifacts parsed once, reparsed when they change."""
+
+    def __init__(self, manifest_path: str, catalog_path: str, options: Optional[GenerateOptions] = None):
+        """Parse the artifacts.
+
+        Args:
+            manifest_path: Path of manifest.json
+            catalog_path: Path of catalog.json
+            options: Model selection and generation options, defaults if None
+
+        Raises:
+            CliError: If an artifact cannot be read or parsed
+        """
+        self._paths = (manifest_path, catalog_path)
+        self._args = (options or GenerateOptions()).to_args()
+        self._parser: Optional[DbtParser] = None
+        self._signature: Optional[Tuple] = None
+        self._models: Dict[str, DbtModel] = {}
+        self._table_name_suffixes: Dict[str, int] = {}
+        self._fragment_cache: Optional[FragmentCache] = None
+        self._views: OrderedDict = OrderedDict()
+        self._load()
+
+    def _artifact_signature(self) -> Tuple:
+        signature: List[Optional[Tuple[int, int]]] = []
+        for path in self._paths:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _load(self) -> None:
+        from dbt2lookml.cli import Cli
+        from dbt2lookml.generators.fragment_cache import FragmentCache
+        from dbt2lookml.parsers import DbtParser
+        from dbt2lookml.utils import FileHandler
+
+        start = time.perf_counter()
+        # Taken before reading, so a file changing while it is read is read again on the next request
+        signature = self._artifact_signature()
+        file_handler = FileHandler()
+        try:
+            parser = DbtParser(self._args, file_handler.read(self._paths[0]), file_handler.read(self._paths[1]))
+            models = parser.select_models()
+        except CliError:
+            raise
+        except Exception as e:
+            # dbt may still be writing the artifacts; the previous ones stay loaded
+            raise CliError("Failed to parse dbt artifacts", str(e)) from e
+        if self._parser is not None:
+            self._parser.close()
+        self._parser = parser
+        self._signature = signature
+        # Models are requested by unique_id or name; a name shared by several models finds the first
+        self._models = {}
+        for model in models:
+            self._models.setdefault(model.name, model)
+        self._models.update((model.unique_id, model) for model in models)
+        self._table_name_suffixes = Cli._table_name_suffixes(self._args, models) if self._args.use_table_name else {}
+        self._fragment_cache = FragmentCache()
+        self._views.clear()
+        logging.info(f'Loaded {len(models)} models in {time.perf_counter() - start:.2f}s')
+
+    def reload_if_changed(self) -> bool:
+        """Parse the artifacts again if their files changed since they were loaded.
+
+        Returns:
+            Whether the artifacts were reloaded
+
+        Raises:
+            CliError: If the changed artifacts cannot be read or parsed
+        """
+        if self._artifact_signature() == self._signature:
+            return False
+        logging.info('dbt artifacts changed, reloading')
+        self._load()
+        return True
+
+    def generate(self, model: str) -> GeneratedView:
+        """Generate the file of a model, as the CLI writes it.
+
+        Args:
+            model: Name or unique_id of a selected model
+
+        Returns:
+            The generated view
+
+        Raises:
+            CliError: If the model is unknown, cannot be generated or fails validation, or the service is closed
+        """
+        self.reload_if_changed()
+        dbt_model = self._models.get(model)
+        if dbt_model is None:
+            raise CliError(f"Unknown model {model}")
+        view = self._views.get(dbt_model.unique_id)
+        if view is not None:
+            self._views.move_to_end(dbt_model.unique_id)
+            return view
+        if self._parser is None:
+            raise CliError("The view service is closed")
+        processed_model = next(self._parser.iter_models([dbt_model]), None)
+        if processed_model is None:
+            raise CliError(f"Model {model} has no columns in the catalog")
+        try:
+            view = _render_view(self._args, processed_model, self._table_name_suffixes, self._fragment_cache)
+        except CliError:
+            raise
+        except Exception as e:
+            raise CliError(f"Failed to generate view for model {model}", str(e)) from e
+        finally:
+            # The manifest model is kept for later requests, without the columns created from the catalog
+            self._parser.release(processed_model)
+        self._views[dbt_model.unique_id] = view
+        if len(self._views) > CACHED_VIEWS:
+            self._views.popitem(last=False)
+        return view
+
+    def close(self) -> None:
+        """Release the parsed artifacts."""
+        if self._parser is not None:
+            self._parser.close()
+            self._parser = None
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    server: ViewServer
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                with self.server.lock:
+                    view = self.server.service.generate(request['model'])
+                response: Dict[str, Any] = {
+                    'relative_path': view.relative_path,
+                    'lookml_text': view.lookml_text,
+                    'stats': view.stats._asdict(),
+                }
+            except CliError as e:
+                response = {'error': str(e)}
+            except (ValueError, KeyError, TypeError) as e:
+                response = {'error': f"Invalid request: {str(e)}"}
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+class ViewServer(socketserver.ThreadingUnixStreamServer):
+    """Serves a ViewService over a Unix socket, generating one request at a time."""
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: str, service: ViewService):
+        """Listen on a socket, replacing a stale socket file left by a daemon that did not shut down.
+
+        Args:
+            socket_path: Path of the socket file, readable and writable by the current user only
+            service: The service answering requests
+
+        Raises:
+            CliError: If another daemon listens on the socket
+        """
+        if os.path.exists(socket_path):
+            if _daemon_listening(socket_path):
+                raise CliError(f"A dbt2lookml daemon is already listening on {socket_path}")
+            os.unlink(socket_path)
+        self.socket_path = socket_path
+        self.service = service
+        # The generators and their caches are not thread-safe
+        self.lock = threading.Lock()
+        # Created private: changing its mode after binding would leave a window for other users to connect
+        previous_umask = os.umask(0o077)
+        try:
+            super().__init__(socket_path, _RequestHandler)
+        finally:
+            os.umask(previous_umask)
+        os.chmod(socket_path, 0o600)
+
+    def server_close(self) -> None:
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def _daemon_listening(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def request_view(model: str, socket_path: str = DEFAULT_SOCKET, timeout: float = 60.0) -> GeneratedView:
+    """Ask a running daemon for the view of a model.
+
+    Args:
+        model: Name or unique_id of the model
+        socket_path: Socket of the daemon
+        timeout: Seconds to wait for the daemon, including reloading changed artifacts
+
+    Returns:
+        The generated view
+
+    Raises:
+        CliError: If no daemon listens on the socket, or it could not generate the view
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        try:
+            client.connect(socket_path)
+            client.sendall(json.dumps({'model': model}).encode('utf-8') + b'\n')
+            with client.makefile('rb') as responses:
+                line = responses.readline()
+        except OSError as e:
+            raise CliError(f"No dbt2lookml daemon on {socket_path}", str(e)) from e
+    if not line:
+        raise CliError(f"The dbt2lookml daemon on {socket_path} closed the connection")
+    response = json.loads(line)
+    if 'error' in response:
+        raise CliError(response['error'])
+    return GeneratedView(response['relative_path'], response['lookml_text'], ViewStats(**response['stats']))
+
+
+if __name__ == "__main__":
+    """CLI interface for running the daemon and requesting views from it."""
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    parser = argparse.ArgumentParser(description="Generate single dbt2lookml views on demand from a local daemon")
+    parser.add_argument('--socket', help=f'Socket of the daemon (default: {DEFAULT_SOCKET})', default=DEFAULT_SOCKET)
+    commands = parser.add_subparsers(dest='command', required=True)
+    serve = commands.add_parser('serve', help='Load the dbt artifacts and answer requests until interrupted')
+    serve.add_argument('--target-dir', help='Path to dbt target directory containing manifest.json and catalog.json', default='.')
+    serve.add_argument('--manifest-path', help='Custom path to manifest.json file')
+    serve.add_argument('--catalog-path', help='Custom path to catalog.json file')
+    serve.add_argument('--tag', help='Filter to dbt models using this tag')
+    serve.add_argument('--include-models', help='List of models to include', nargs='+')
+    serve.add_argument('--exclude-models', help='List of models to exclude', nargs='+')
+    serve.add_argument('--exposures-only', help='Only serve models used in exposures', action='store_true')
+    serve.add_argument('--exposures-tag', help='Filter exposures by tag')
+    serve.add_argument('--use-table-name', help='Use table names instead of model names', action='store_true')
+    serve.add_argument('--include-iso-fields', help='Include ISO year and week fields', action='store_true')
+    serve.add_argument('--validate', help='Validate generated LookML before returning it', action='store_true')
+    generate = commands.add_parser('generate', help='Print the view of a model, or write it to an output directory')
+    generate.add_argument('model', help='Name or unique_id of the model')
+    generate.add_argument('--output-dir', help='Write the file below this directory instead of printing it')
+    args = parser.parse_args()
+
+    try:
+        if args.command == 'serve':
+            options = GenerateOptions(
+                tag=args.tag,
+                include_models=args.include_models,
+                exclude_models=args.exclude_models,
+                exposures_only=args.exposures_only,
+                exposures_tag=args.exposures_tag,
+                use_table_name=args.use_table_name,
+                include_iso_fields=args.include_iso_fields,
+                validate=args.validate,
+            )
+            service = ViewService(
+                args.manifest_path or os.path.join(args.target_dir, 'manifest.json'),
+                args.catalog_path or os.path.join(args.target_dir, 'catalog.json'),
+                options,
+            )
+            with ViewServer(args.socket, service) as server:
+                logging.info(f'Serving on {args.socket}')
+                # Stopped by a service manager or editor: shut down as on Ctrl-C, removing the socket
+                signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+                try:
+                    server.serve_forever()
+                except KeyboardInterrupt:
+                    pass
+                finally:
+                    service.close()
+        else:
+            view = request_view(args.model, args.socket)
+            if args.output_dir:
+                file_path = os.path.join(args.output_dir, view.relative_path)
+                os.makedirs(os.path.dirname(file_path), exist_ok=True)
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.write(view.lookml_text)
+                logging.info(f'Wrote {file_path}')
+            else:
+                sys.stdout.write(view.lookml_text)
+    except CliError as e:
+        logging.error(str(e))
+        sys.exit(1)
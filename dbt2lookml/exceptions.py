@@ -20,6 +20,10 @@ class CliError(Exception):
         return f"{self.message} - {self.details}" if self.details else self.message
 
 
+class ModelTimeoutError(CliError):
+    """Raised for a model whose generation exceeded the per-model time budget."""
+
+
 class NotImplementedError(CliError):
     pass
 
@@ -5,6 +5,7 @@ from typing import Dict, Tuple
 
 from dbt2lookml.generators.dimension import LookmlDimensionGenerator
 from dbt2lookml.generators.explore import LookmlExploreGenerator
+from dbt2lookml.generators.fragment_cache import FragmentCache
 from dbt2lookml.generators.measure import LookmlMeasureGenerator
 from dbt2lookml.generators.view import LookmlViewGenerator
 from dbt2lookml.models.dbt import DbtModel, DbtModelColumn
@@ -20,6 +21,11 @@ class LookmlGenerator:
         self.explore_generator = LookmlExploreGenerator(cli_args)
         self.measure_generator = LookmlMeasureGenerator(cli_args)
 
+    def use_fragment_cache(self, fragment_cache: FragmentCache) -> None:
+        """Share dimension, dimension group and measure fragments with other models through a cache."""
+        self.dimension_generator._fragment_cache = fragment_cache
+        self.measure_generator._fragment_cache = fragment_cache
+
     def _get_view_label(self, model: DbtModel) -> str:
         """Get the view label from the model metadata or name."""
         # Check looker meta view label first
@@ -12,15 +12,17 @@ from dbt2lookml.enums import (
     LookerTimeFrame,
     LookerTimeTimeframes,
 )
+from dbt2lookml.generators.fragment_cache import FragmentCache, cached_fragment, column_signature
+from dbt2lookml.generators.sql_references import get_sql_reference_resolver
 from dbt2lookml.generators.utils import (
     get_array_element_looker_type,
     get_catalog_column_info,
-    get_column_name,
     is_single_value_array,
     map_bigquery_to_looker,
     safe_name,
 )
 from dbt2lookml.models.column_collections import ColumnCollections
+from dbt2lookml.models.column_naming import ColumnNaming, format_label, get_column_naming, group_label, item_label
 from dbt2lookml.models.dbt import DbtModel, DbtModelColumn
 from dbt2lookml.models.looker import DbtMetaLookerDimension
 from dbt2lookml.utils import camel_to_snake
@@ -29,11 +31,12 @@ from dbt2lookml.utils import camel_to_snake
 class LookmlDimensionGenerator:
     """Lookml dimension generator."""
 
-    def __init__(self, args):
-        """Initialize the generator with CLI arguments."""
+    def __init__(self, args, fragment_cache: Optional[FragmentCache] = None):
+        """Initialize the generator with CLI arguments and an optional run-wide fragment cache."""
         self._cli_args = args
         self._custom_timeframes = getattr(args, 'timeframes', {})
         self._include_iso_fields = getattr(args, 'include_iso_fields', False)
+        self._fragment_cache = fragment_cache
 
     def _get_conflicting_timeframes(
         self,
@@ -131,9 +134,9 @@ class LookmlDimensionGenerator:
                 processed_dimensions.append(renamed_dimension)
 
                 if model_name:
-                    logging.debug(f"Renamed conflicting dimension '{original_name}' to '{new_name}' in model '{model_name}'")
+                    logging.debug("Renamed conflicting dimension '%s' to '%s' in model '%s'", original_name, new_name, model_name)
                 else:
-                    logging.debug(f"Renamed conflicting dimension '{original_name}' to '{new_name}'")
+                    logging.debug("Renamed conflicting dimension '%s' to '%s'", original_name, new_name)
             else:
                 # logging.debug(f'6. adding dimensions to process dimensions: {dimension}')
                 processed_dimensions.append(dimension)
@@ -165,19 +168,7 @@ class LookmlDimensionGenerator:
         Returns:
             Formatted label string
         """
-        if name is None:
-            return ""
-
-        # Remove date suffix if requested
-        if remove_date:
-            if name.endswith('Date'):
-                name = name[:-4]
-            elif name.endswith('_date'):
-                name = name[:-5]
-
-        # Convert CamelCase to snake_case first, then to readable format
-        snake_case = camel_to_snake(name)
-        return snake_case.replace("_", " ").title()
+        return format_label(name, remove_date)
 
     def _apply_meta_looker_attributes(self, target_dict: Dict[str, Any], column: DbtModelColumn, attributes: List[str]) -> None:
         """Apply meta attributes from column to target dictionary if they exist.
@@ -186,9 +177,10 @@ class LookmlDimensionGenerator:
             column: Column containing meta attributes
             attributes: List of attribute names to apply
         """
-        if column.meta and column.meta.looker and column.meta.looker.dimension is not None:
+        dimension_meta = column.looker_dimension
+        if dimension_meta is not None:
             for attr in attributes:
-                value = getattr(column.meta.looker.dimension, attr, None)
+                value = getattr(dimension_meta, attr, None)
                 if value is not None:
                     if attr == "value_format_name":
                         meta_value = value.value
@@ -254,6 +246,26 @@ class LookmlDimensionGenerator:
         Returns:
             Dictionary containing dimension definition
         """
+        # Columns without a description fall back to the model's catalog, so only described ones are shared
+        key = None
+        if self._fragment_cache is not None and column.description:
+            key = (column_signature(column), sql, is_hidden, tuple(include_names) if include_names else None)
+        return cached_fragment(
+            self._fragment_cache,
+            'dimension',
+            key,
+            lambda: self._build_dimension(column, sql, model, is_hidden, include_names),
+        )
+
+    def _build_dimension(
+        self,
+        column: DbtModelColumn,
+        sql: str,
+        model: DbtModel = None,
+        is_hidden: bool = False,
+        include_names: Optional[List[str]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Build a dimension dictionary, see create_dimension."""
         data_type = map_bigquery_to_looker(column.data_type)
         if data_type is None:
             return None
@@ -262,7 +274,7 @@ class LookmlDimensionGenerator:
         dimension_name = self._determine_dimension_name(column, include_names)
 
         # Create base dimension structure
-        dimension = self._create_base_dimension(dimension_name, data_type, sql)
+        dimension = self._create_base_dimension(dimension_name, data_type, sql, get_column_naming(column))
 
         # Add group labels for nested fields
         self._add_group_labels(dimension, column)
@@ -320,29 +332,29 @@ class LookmlDimensionGenerator:
         # Extract array model name from include_names (format: "array.model.name.dummy")
         array_model_from_include = include_names[0].rsplit('.', 1)[0]  # Remove ".dummy"
 
-        logging.debug(f"Nested view dimension naming - Column: {column.name}")
-        logging.debug(f"  Original dimension_name: {dimension_name}")
-        logging.debug(f"  Array model from include: {array_model_from_include}")
+        logging.debug("Nested view dimension naming - Column: %s", column.name)
+        logging.debug("  Original dimension_name: %s", dimension_name)
+        logging.debug("  Array model from include: %s", array_model_from_include)
 
         # The array model has N parts, so we need to strip the first N parts from lookml_long_name
         array_parts_count = len(array_model_from_include.split('.'))
         dimension_parts = dimension_name.split('__')
 
-        logging.debug(f"  Array parts count: {array_parts_count}")
-        logging.debug(f"  Dimension parts: {dimension_parts}")
+        logging.debug("  Array parts count: %s", array_parts_count)
+        logging.debug("  Dimension parts: %s", dimension_parts)
 
         # Strip the first N parts that correspond to the array model
         if len(dimension_parts) > array_parts_count:
             stripped_parts = dimension_parts[array_parts_count:]
             dimension_name = '__'.join(stripped_parts)
-            logging.debug(f"  After stripping {array_parts_count} prefix parts: {dimension_name}")
+            logging.debug("  After stripping %s prefix parts: %s", array_parts_count, dimension_name)
         elif '__' in dimension_name:
             # Fallback: strip the first prefix for backward compatibility
             original_name = dimension_name
             dimension_name = re.sub(r'^.*?__', '', dimension_name)
-            logging.debug(f"  Fallback stripping first prefix: {original_name} -> {dimension_name}")
+            logging.debug("  Fallback stripping first prefix: %s -> %s", original_name, dimension_name)
 
-        logging.debug(f"  Final dimension name: {dimension_name}")
+        logging.debug("  Final dimension name: %s", dimension_name)
         return dimension_name
 
     def _apply_standard_naming(self, dimension_name: str, column: DbtModelColumn) -> str:
@@ -355,32 +367,27 @@ class LookmlDimensionGenerator:
         Returns:
             Processed dimension name with camelCase conversion
         """
-        # Use original_name if available to get the proper camelCase format
-        source_name = getattr(column, 'original_name', column.name) or column.name
-
-        if '.' in source_name:
-            # Convert dots to double underscores: Classification.ItemGroup.Code -> classification__item_group__code
-            parts = source_name.split('.')
-            snake_parts = [camel_to_snake(part).lower() for part in parts]
-            dimension_name = '__'.join(snake_parts)
-        else:
-            # Apply camelCase conversion for single names
-            dimension_name = camel_to_snake(source_name).lower()
+        return get_column_naming(column).lookml_long_name
 
-        return dimension_name
-
-    def _create_base_dimension(self, dimension_name: str, data_type: str, sql: str) -> Dict[str, Any]:
+    def _create_base_dimension(
+        self, dimension_name: str, data_type: str, sql: str, naming: Optional[ColumnNaming] = None
+    ) -> Dict[str, Any]:
         """Create the base dimension dictionary with name, type, and SQL.
 
         Args:
             dimension_name: Name for the dimension
             data_type: Looker data type
             sql: SQL expression
+            naming: Naming record of the column, reused when the name is its long name
 
         Returns:
             Base dimension dictionary
         """
-        dimension: Dict[str, Any] = {"name": safe_name(dimension_name)}
+        if naming is not None and dimension_name == naming.lookml_long_name:
+            name = naming.dimension_name
+        else:
+            name = safe_name(dimension_name)
+        dimension: Dict[str, Any] = {"name": name}
 
         # Add type for scalar types (should come before sql)
         if data_type in LookerScalarTypes.values():
@@ -397,24 +404,9 @@ class LookmlDimensionGenerator:
             column: Column being processed
         """
         if column.nested and '.' in column.name:
-            parts = column.name.split('.')
-            if len(parts) >= 2:
-                # Create dynamic group label from all parts except the last one
-                group_parts = parts[:-1]
-                group_label = self._create_group_label(group_parts)
-                dimension["group_label"] = group_label
-
-                # Add group item label from the last part
-                # Use original_name if available to preserve CamelCase, otherwise fall back to name
-                if column.original_name and '.' in column.original_name:
-                    original_parts = column.original_name.split('.')
-                    if len(original_parts) == len(parts):
-                        last_part = original_parts[-1]
-                    else:
-                        last_part = parts[-1]
-                else:
-                    last_part = parts[-1]
-                dimension["group_item_label"] = self._create_item_label(last_part)
+            naming = get_column_naming(column)
+            dimension["group_label"] = naming.group_label
+            dimension["group_item_label"] = naming.item_label
 
     def _apply_visibility_attributes(self, dimension: Dict[str, Any], column: DbtModelColumn, is_hidden: bool) -> None:
         """Apply visibility and special attributes based on column properties.
@@ -476,6 +468,34 @@ class LookmlDimensionGenerator:
         Returns:
             Tuple containing dimension group, dimension group set, and dimensions
         """
+        key = None
+        if self._fragment_cache is not None and column.description:
+            key = (
+                column_signature(column),
+                looker_type,
+                table_format_sql,
+                is_nested_view,
+                array_model_name,
+                repr(self._custom_timeframes),
+                self._include_iso_fields,
+            )
+        return cached_fragment(
+            self._fragment_cache,
+            'dimension_group',
+            key,
+            lambda: self._build_dimension_group(column, looker_type, table_format_sql, model, is_nested_view, array_model_name),
+        )
+
+    def _build_dimension_group(
+        self,
+        column: DbtModelColumn,
+        looker_type: str,
+        table_format_sql: bool,
+        model: DbtModel,
+        is_nested_view: bool = False,
+        array_model_name: str = None,
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Build a dimension group, its set and ISO dimensions, see lookml_dimension_group."""
         if map_bigquery_to_looker(column.data_type) is None:
             return None, None, None
         if looker_type == "date":
@@ -490,25 +510,12 @@ class LookmlDimensionGenerator:
             column_name_adjusted = self.transform_date_column_name(column, is_nested_view, array_model_name)
         else:
             return None, None, None
-        sql = get_column_name(
-            column, table_format_sql, getattr(model, '_catalog_data', None), model.unique_id, is_nested_view, array_model_name
-        )
+        sql = get_sql_reference_resolver(model).resolve(column, is_nested_view, array_model_name)
         dimensions = []
-        # Use original_name for proper formatting if available, otherwise use column name
-        label_source = getattr(column, 'original_name', column.name)
-
-        # For nested fields, separate the label and group_label
-        if '.' in label_source:
-            parts = label_source.split('.')
-            # Label is just the last part (field name)
-            field_label = self._format_label(parts[-1], remove_date=False)
-            # Group label is the parent parts
-            group_parts = parts[:-1]
-            group_label = self._create_group_label(group_parts)
-        else:
-            # For non-nested fields, label and group_label are the same
-            field_label = self._format_label(label_source, remove_date=False)
-            group_label = field_label
+        # Nested fields are labelled by their last part and grouped by their parents
+        naming = get_column_naming(column)
+        field_label = naming.label
+        dimension_group_label = naming.dimension_group_label
 
         dimension_group = {
             "name": safe_name(column_name_adjusted),
@@ -517,7 +524,7 @@ class LookmlDimensionGenerator:
             "sql": sql,
             "datatype": map_bigquery_to_looker(column.data_type),
             "timeframes": timeframes,
-            "group_label": ("D Date" if column_name_adjusted == "d" else group_label),
+            "group_label": ("D Date" if column_name_adjusted == "d" else dimension_group_label),
             "convert_tz": convert_tz,
             "_original_column_name": column.name,  # Store original column name for conflict detection
         }
@@ -554,81 +561,32 @@ class LookmlDimensionGenerator:
             returnable_assets_deposit__returnable_asset_deposit_end -> returnable_asset_deposit_end (nested view)
         """
 
-        column_name = column.original_name or column.name
-
-        if '.' in column_name:
-            result = self._process_nested_field(column_name, camel_to_snake)
-        else:
-            result = self._process_single_field(column_name, camel_to_snake)
-
-        result = result.rstrip('_')
+        result = get_column_naming(column).date_name
 
         if is_nested_view and array_model_name:
             result = self._strip_nested_view_prefix(result, array_model_name, column.name)
 
         return result
 
-    def _process_nested_field(self, column_name: str, camel_to_snake_func) -> str:
-        """Process nested field names (containing dots)."""
-        parts = column_name.split('.')
-        snake_parts = []
-
-        for i, part in enumerate(parts):
-            # Remove date suffix only from the last part
-            if i == len(parts) - 1:
-                part = self._remove_date_suffix(part)
-
-            snake_parts.append(self._convert_part_to_snake(part, camel_to_snake_func))
-
-        return '__'.join(snake_parts)
-
-    def _process_single_field(self, column_name: str, camel_to_snake_func) -> str:
-        """Process single field names (no dots)."""
-        # Special case: exact "Date" or "date"
-        if column_name.lower() == 'date':
-            return 'date'
-
-        base_name = self._remove_date_suffix(column_name).rstrip('_')
-        return self._convert_part_to_snake(base_name, camel_to_snake_func)
-
-    def _remove_date_suffix(self, part: str) -> str:
-        """Remove various date suffixes from a string part."""
-        if part.endswith('Date'):
-            return part[:-4]
-        elif part.endswith('_date'):
-            return part[:-5]
-        elif part.lower().endswith('date') and part != 'Date':
-            return part[:-4]
-        return part
-
-    def _convert_part_to_snake(self, part: str, camel_to_snake_func) -> str:
-        """Convert a part to snake_case if it's not pure lowercase."""
-        if part.islower() and '_' not in part:
-            # Pure lowercase - keep as-is
-            return part
-        else:
-            # CamelCase or snake_case - convert
-            return camel_to_snake_func(part)
-
     def _strip_nested_view_prefix(self, result: str, array_model_name: str, column_name: str) -> str:
         """Strip nested view prefix from dimension group names."""
 
-        logging.debug(f"Dimension group naming - Column: {column_name}")
-        logging.debug(f"  Original result: {result}")
-        logging.debug(f"  Array model name: {array_model_name}")
+        logging.debug("Dimension group naming - Column: %s", column_name)
+        logging.debug("  Original result: %s", result)
+        logging.debug("  Array model name: %s", array_model_name)
 
         array_parts_count = len(array_model_name.split('.'))
         result_parts = result.split('__')
 
-        logging.debug(f"  Array parts count: {array_parts_count}")
-        logging.debug(f"  Result parts: {result_parts}")
+        logging.debug("  Array parts count: %s", array_parts_count)
+        logging.debug("  Result parts: %s", result_parts)
 
         if len(result_parts) > array_parts_count:
             stripped_parts = result_parts[array_parts_count:]
             result = '__'.join(stripped_parts)
-            logging.debug(f"  After stripping {array_parts_count} prefix parts: {result}")
+            logging.debug("  After stripping %s prefix parts: %s", array_parts_count, result)
         else:
-            logging.debug(f"  Not enough parts to strip, keeping original: {result}")
+            logging.debug("  Not enough parts to strip, keeping original: %s", result)
 
         return result
 
@@ -657,19 +615,10 @@ class LookmlDimensionGenerator:
         Returns:
             Formatted group label (e.g., 'Classification Assortment')
         """
-        # Convert each part to title case, handling common patterns
-        formatted_parts = []
-        for part in parts:
-            snake_case = camel_to_snake(part)
-            # Use title() to properly capitalize each word
-            title_case = snake_case.replace('_', ' ').title()
-            formatted_parts.append(title_case)
-
-        return ' '.join(formatted_parts)
+        return group_label(parts)
 
     def _create_item_label(self, item: str) -> str:
-        snake_case = camel_to_snake(item)
-        return snake_case.replace('_', ' ').capitalize()
+        return item_label(item)
 
     def _get_dimension_description(self, column: DbtModelColumn, model: DbtModel) -> str:
         """Get description for dimension from column description or catalog comment.
@@ -797,9 +746,7 @@ class LookmlDimensionGenerator:
                 continue
 
             # Create regular dimension
-            column_name = get_column_name(
-                column, table_format_sql, getattr(model, 'catalog_data', None), model.unique_id, is_nested_view, array_model_name
-            )
+            column_name = get_sql_reference_resolver(model).resolve(column, is_nested_view, array_model_name)
             dimension = self.create_dimension(column, column_name)
             if dimension is not None:
                 # logging.debug(f'4 added dimension to dimensions: {dimensions}')
@@ -844,9 +791,7 @@ class LookmlDimensionGenerator:
                 continue
 
             # Create regular dimension
-            column_name = get_column_name(
-                column, table_format_sql, getattr(model, '_catalog_data', None), model.unique_id, is_nested_view, array_model_name
-            )
+            column_name = get_sql_reference_resolver(model).resolve(column, is_nested_view, array_model_name)
             dimension = self.create_dimension(column, column_name, model)
             if dimension is not None:
                 dimensions.append(dimension)
@@ -895,17 +840,15 @@ class LookmlDimensionGenerator:
                 data_type_str = str(column.data_type).upper()
                 if data_type_str.startswith('ARRAY') and len(hierarchy.get(col_name, {}).get('children', set())) > 0:
                     # This is a nested array within the current array - add as hidden dimension to current view
-                    nested_column_name = get_column_name(
-                        column, table_format_sql, getattr(model, '_catalog_data', None), model.unique_id, True, array_model_name
-                    )
+                    nested_column_name = get_sql_reference_resolver(model).resolve(column, True, array_model_name)
 
                     # Create dimension with prefix stripping for nested views
                     fake_include_names = [f"{array_model_name}.dummy"]  # Simulate include_names with dotted name for naming
                     nested_dimension = self.create_dimension(column, nested_column_name, include_names=fake_include_names)
                     if nested_dimension is not None:
                         if 'dangerous' in nested_dimension.get('name', '').lower():
-                            logging.debug(f'Created nested array dimension in dimension.py: {nested_dimension}')
-                            logging.debug(f'Column name: {col_name}, nested_column_name: {nested_column_name}')
+                            logging.debug('Created nested array dimension in dimension.py: %s', nested_dimension)
+                            logging.debug('Column name: %s, nested_column_name: %s', col_name, nested_column_name)
                         nested_dimension['hidden'] = 'yes'
                         # Add to regular dimensions so they appear in current view
                         dimensions.append(nested_dimension)
@@ -995,9 +938,7 @@ class LookmlDimensionGenerator:
                 continue
 
             # Get column name for SQL
-            column_name = get_column_name(
-                column, table_format_sql, getattr(model, 'catalog_data', None), model.unique_id, True, array_model_name
-            )
+            column_name = get_sql_reference_resolver(model).resolve(column, True, array_model_name)
 
             # For nested views, always use include_names logic to strip the array model prefix
             fake_include_names = [f"{array_model_name}.dummy"]
@@ -1005,8 +946,8 @@ class LookmlDimensionGenerator:
 
             if dimension is not None:
                 if 'dangerous' in dimension.get('name', '').lower():
-                    logging.debug(f'Created regular dimension in nested view: {dimension}')
-                    logging.debug(f'Column: {col_name}, column_name: {column_name}')
+                    logging.debug('Created regular dimension in nested view: %s', dimension)
+                    logging.debug('Column: %s, column_name: %s', col_name, column_name)
                 dimensions.append(dimension)
                 # logging.debug(f'3 added dimension to dimensions {dimension}')
         return dimensions, nested_dimensions
@@ -3,6 +3,8 @@
 import logging
 from typing import Any, Dict, List, Optional
 
+from dbt2lookml.models.column_naming import ColumnNaming
+from dbt2lookml.models.column_record import get_column_records
 from dbt2lookml.models.dbt import DbtModel, DbtModelColumn
 from dbt2lookml.utils import camel_to_snake
 
@@ -143,15 +145,14 @@ class LookmlExploreGenerator:
         # Determine base name
         base_name = self._get_base_name(model)
 
-        # Get original name for CamelCase conversion
-        original_parent_name = self._get_original_name(parent, model)
+        # Get the parent naming record for CamelCase conversion
+        parent_naming = self._get_parent_naming(parent, model)
 
         # Create view name
-        snake_parent = '__'.join([camel_to_snake(part) for part in original_parent_name.split('.')])
-        view_name = f"{base_name}__{snake_parent}"
+        view_name = f"{base_name}__{parent_naming.lookml_long_name}"
 
         # Generate join SQL
-        join_sql = self._generate_join_sql(original_parent_name, base_name, view_name, existing_joins)
+        join_sql = self._generate_join_sql(parent_naming, base_name, view_name, existing_joins)
 
         return {
             'name': view_name,
@@ -176,28 +177,28 @@ class LookmlExploreGenerator:
         else:
             return model.name.lower()
 
-    def _get_original_name(self, parent: str, model: DbtModel) -> str:
-        """Get the original CamelCase name for a parent field.
+    def _get_parent_naming(self, parent: str, model: DbtModel) -> ColumnNaming:
+        """Get the naming record for a parent field.
 
         Args:
             parent: Parent field name
             model: DBT model containing the field
 
         Returns:
-            Original name or fallback to parent name
+            Naming record of the parent column, or one built from the parent name
         """
-        parent_column = model.columns.get(parent)
-        if parent_column and parent_column.original_name:
-            return parent_column.original_name
-        return parent
+        parent_column = get_column_records(model).get(parent)
+        if parent_column is not None:
+            return parent_column.naming
+        return ColumnNaming.from_names(parent)
 
     def _generate_join_sql(
-        self, original_parent_name: str, base_name: str, view_name: str, existing_joins: list[dict[str, Any]]
+        self, parent_naming: ColumnNaming, base_name: str, view_name: str, existing_joins: list[dict[str, Any]]
     ) -> str:
         """Generate the SQL for joining an array.
 
         Args:
-            original_parent_name: Original CamelCase parent name
+            parent_naming: Naming record of the parent array field
             base_name: Base model name
             view_name: Target view name for the join
             existing_joins: List of existing joins for parent detection
@@ -207,7 +208,7 @@ class LookmlExploreGenerator:
         """
 
         # Check for parent view
-        parent_view_info = self._find_parent_view(original_parent_name, base_name, existing_joins)
+        parent_view_info = self._find_parent_view(parent_naming, base_name, existing_joins)
 
         if parent_view_info:
             # Reference parent view
@@ -215,16 +216,15 @@ class LookmlExploreGenerator:
             return f'LEFT JOIN UNNEST(${{{parent_view_name}.{dimension_path}}}) AS {view_name}'
         else:
             # Reference base model
-            snake_parent = '__'.join([camel_to_snake(part) for part in original_parent_name.split('.')])
-            return f'LEFT JOIN UNNEST(${{{base_name}.{snake_parent}}}) AS {view_name}'
+            return f'LEFT JOIN UNNEST(${{{base_name}.{parent_naming.lookml_long_name}}}) AS {view_name}'
 
     def _find_parent_view(
-        self, original_parent_name: str, base_name: str, existing_joins: list[dict[str, Any]]
+        self, parent_naming: ColumnNaming, base_name: str, existing_joins: list[dict[str, Any]]
     ) -> Optional[tuple[str, str]]:
         """Find parent view for nested array references.
 
         Args:
-            original_parent_name: Original CamelCase parent name
+            parent_naming: Naming record of the parent array field
             base_name: Base model name
             existing_joins: List of existing joins
 
@@ -232,22 +232,19 @@ class LookmlExploreGenerator:
             Tuple of (parent_view_name, dimension_path) or None if no parent
         """
 
-        if '.' not in original_parent_name:
+        snake_parts = parent_naming.snake_parts
+        if len(snake_parts) < 2:
             return None
 
         # Find the closest parent ARRAY view by checking progressively shorter paths
-        parent_parts = original_parent_name.split('.')[:-1]
-        for i in range(len(parent_parts), 0, -1):
-            candidate_parts = parent_parts[:i]
-            candidate_view_name = f"{base_name}__{'__'.join([camel_to_snake(part) for part in candidate_parts])}"
+        for i in range(len(snake_parts) - 1, 0, -1):
+            candidate_view_name = f"{base_name}__{'__'.join(snake_parts[:i])}"
 
             # Check if this candidate parent view exists in existing joins
             if any(join['name'] == candidate_view_name for join in existing_joins):
                 # Calculate dimension path from parent view to this field
                 parent_depth = len(candidate_view_name.split('__')) - 1  # Subtract 1 for base_name
-                current_parts = original_parent_name.split('.')
-                dimension_path_parts = current_parts[parent_depth:]
-                dimension_path = '__'.join([camel_to_snake(part) for part in dimension_path_parts])
+                dimension_path = '__'.join(snake_parts[parent_depth:])
                 return candidate_view_name, dimension_path
 
         return None
@@ -290,7 +287,7 @@ class LookmlExploreGenerator:
     def generate(self, model: DbtModel, view_name: str, view_label: str, array_models: list[DbtModelColumn]) -> dict[str, Any]:
         """Create the explore definition."""
         # Get nested structure for joins
-        structure = self._group_strings(list(model.columns.values()), array_models)
+        structure = self._group_strings(list(get_column_records(model).values()), array_models)
         # Create explore
         explore: dict[str, Any] = {
             'name': view_name,
@@ -300,6 +297,6 @@ class LookmlExploreGenerator:
         }
         # Add joins if present
         if joins := self.recurse_joins(structure, model):
-            logging.debug(f"Adding {len(joins)} joins to explore")
+            logging.debug("Adding %s joins to explore", len(joins))
             explore['joins'] = joins
         return explore
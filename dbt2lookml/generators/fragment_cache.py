@@ -0,0 +1,140 @@
+"""Run-wide cache of generated LookML fragments."""
+
+from collections import Counter, OrderedDict
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from dbt2lookml.models.dbt import DbtModelColumn
+
+_MISSING = object()
+
+
+class _FrozenList(tuple):
+    """Read-only stand-in for a list stored in the cache."""
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into read-only equivalents."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return _FrozenList(_freeze(item) for item in value)
+    if isinstance(value, tuple):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Recursively build mutable copies of a frozen value."""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, _FrozenList):
+        return [_thaw(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_thaw(item) for item in value)
+    return value
+
+
+def column_signature(column: DbtModelColumn) -> Tuple[Hashable, ...]:
+    """Build the cache signature of a column.
+
+    Two columns with the same signature produce the same dimensions and
+    measures, whichever model they belong to.
+
+    Args:
+        column: The column (or column record)
+
+    Returns:
+        Hashable tuple of everything generation reads from the column
+    """
+    looker_dimension = column.looker_dimension
+    return (
+        column.name,
+        column.original_name,
+        column.data_type,
+        tuple(column.inner_types or ()),
+        column.nested,
+        column.is_primary_key,
+        column.description,
+        column.lookml_name,
+        column.lookml_long_name,
+        looker_dimension.model_dump_json(exclude_none=True) if looker_dimension is not None else None,
+    )
+
+
+class FragmentCache:
+    """Bounded LRU cache of dimension, dimension group and measure fragments.
+
+    Many models share identical columns (audit timestamps, load metadata,
+    common struct types). Fragments are stored read-only and every lookup
+    returns a fresh mutable copy, so callers may keep editing what they get.
+    Hits and misses are counted per fragment kind for the run report.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        """Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of fragments kept, least recently used are evicted first
+        """
+        self._maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._hits: Counter = Counter()
+        self._misses: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_build(self, kind: str, key: Hashable, build: Callable[[], Any]) -> Any:
+        """Get a fragment from the cache, building and storing it on a miss.
+
+        Args:
+            kind: Fragment kind, e.g. 'dimension', 'dimension_group' or 'measure'
+            key: Hashable key identifying the fragment within its kind
+            build: Callable creating the fragment on a miss
+
+        Returns:
+            A mutable copy of the fragment
+        """
+        cache_key = (kind, key)
+        frozen = self._entries.get(cache_key, _MISSING)
+        if frozen is not _MISSING:
+            self._entries.move_to_end(cache_key)
+            self._hits[kind] += 1
+            return _thaw(frozen)
+
+        self._misses[kind] += 1
+        value = build()
+        self._entries[cache_key] = _freeze(value)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return value
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Get hit and miss counts and hit rates per fragment kind.
+
+        Returns:
+            Mapping of fragment kind to its 'hits', 'misses' and 'hit_rate'
+        """
+        stats = {}
+        for kind in sorted(set(self._hits) | set(self._misses)):
+            hits, misses = self._hits[kind], self._misses[kind]
+            stats[kind] = {'hits': hits, 'misses': misses, 'hit_rate': hits / (hits + misses)}
+        return stats
+
+
+def cached_fragment(fragment_cache: Optional[FragmentCache], kind: str, key: Optional[Hashable], build: Callable[[], Any]) -> Any:
+    """Build a fragment through the cache if there is one and the fragment is cacheable.
+
+    Args:
+        fragment_cache: The run's fragment cache, or None to always build
+        kind: Fragment kind
+        key: Cache key, or None if the fragment depends on more than the key can express
+        build: Callable creating the fragment
+
+    Returns:
+        The fragment
+    """
+    if fragment_cache is None or key is None:
+        return build()
+    return fragment_cache.get_or_build(kind, key, build)
@@ -1,6 +1,7 @@
 from typing import Any, Dict, List, Optional
 
 from dbt2lookml.enums import LookerMeasureType, LookerScalarTypes
+from dbt2lookml.generators.fragment_cache import FragmentCache, cached_fragment
 from dbt2lookml.generators.utils import get_column_name, map_bigquery_to_looker
 from dbt2lookml.models.dbt import DbtModel, DbtModelColumn
 from dbt2lookml.models.looker import DbtMetaLookerMeasure
@@ -9,8 +10,9 @@ from dbt2lookml.models.looker import DbtMetaLookerMeasure
 class LookmlMeasureGenerator:
     """Lookml dimension generator."""
 
-    def __init__(self, args):
+    def __init__(self, args, fragment_cache: Optional[FragmentCache] = None):
         self._cli_args = args
+        self._fragment_cache = fragment_cache
 
     def _apply_measure_attributes(self, measure_dict: Dict[str, Any], measure: DbtMetaLookerMeasure) -> None:
         """Apply measure attributes to the measure dictionary."""
@@ -50,6 +52,24 @@ class LookmlMeasureGenerator:
         if not self._is_valid_measure_type(measure):
             return {}
 
+        key = None
+        if self._fragment_cache is not None:
+            key = (column.name, column.original_name, table_format_sql, measure.model_dump_json(exclude_none=True))
+        return cached_fragment(
+            self._fragment_cache,
+            'measure',
+            key,
+            lambda: self._build_measure(column, measure, table_format_sql, model),
+        )
+
+    def _build_measure(
+        self,
+        column: DbtModelColumn,
+        measure: DbtMetaLookerMeasure,
+        table_format_sql: bool,
+        model: DbtModel,
+    ) -> Dict[str, Any]:
+        """Build a LookML measure dictionary, see _lookml_measure."""
         base_measure = self._create_base_measure(column, measure, table_format_sql, model)
         self._apply_measure_attributes(base_measure, measure)
         self._add_sql_distinct_key(base_measure, measure)
@@ -118,13 +138,7 @@ class LookmlMeasureGenerator:
         lookml_measures: List[Dict[str, Any]] = []
         table_format_sql = True
         for column in columns_subset.values():
-            if (
-                map_bigquery_to_looker(column.data_type) in LookerScalarTypes.values()
-                and hasattr(column.meta, 'looker')
-                and hasattr(column.meta.looker, 'measures')
-                and column.meta.looker.measures
-            ):
-                lookml_measures.extend(
-                    self._lookml_measure(column, measure, table_format_sql, model) for measure in column.meta.looker.measures
-                )
+            measures = column.looker_measures
+            if measures and map_bigquery_to_looker(column.data_type) in LookerScalarTypes.values():
+                lookml_measures.extend(self._lookml_measure(column, measure, table_format_sql, model) for measure in measures)
         return lookml_measures
@@ -0,0 +1,87 @@
+"""Per-model resolution of ${TABLE} SQL references."""
+
+from typing import Dict, Mapping, Optional, Tuple, Union
+
+from dbt2lookml.generators.utils import get_column_name
+from dbt2lookml.models.column_naming import get_column_naming
+from dbt2lookml.models.column_record import ColumnRecord, get_column_records
+from dbt2lookml.models.dbt import DbtModel, DbtModelColumn
+from dbt2lookml.utils import quote_column_name_if_needed
+
+
+class SqlReferenceResolver:
+    """Precomputed ${TABLE} references for every column of a model and view context.
+
+    A view context is either the main view (``None``) or the name of an array
+    column whose nested view contains the column. All references are built in
+    a single pass over the column paths, so lookups during generation are
+    plain dictionary hits. Anything not covered by the pass falls back to
+    ``get_column_name`` and is memoized.
+    """
+
+    def __init__(self, columns: Mapping[str, Union[DbtModelColumn, ColumnRecord]]):
+        """Build the references of all columns.
+
+        Args:
+            columns: Columns of the model (or their records), keyed by lowercased name
+        """
+        self._references: Dict[Tuple[str, Optional[str]], Tuple[str, str]] = {}
+        array_names = {name for name, column in columns.items() if 'ARRAY' in f"{column.data_type}"}
+
+        for name, column in columns.items():
+            original_name = column.original_name or column.name
+            self._references[(name, None)] = (original_name, f"${{TABLE}}.{get_column_naming(column).sql_path}")
+
+            if '.' not in name or original_name.lower() != name:
+                continue
+            name_parts = name.split('.')
+            original_parts = original_name.split('.')
+            # Each enclosing array owns a nested view in which the path is relative to the array
+            for depth in range(1, len(name_parts)):
+                context = '.'.join(name_parts[:depth])
+                if context in array_names:
+                    relative_name = '.'.join(original_parts[depth:])
+                    self._references[(name, context)] = (
+                        original_name,
+                        f"${{TABLE}}.{quote_column_name_if_needed(relative_name)}",
+                    )
+
+    def resolve(self, column: DbtModelColumn, is_nested_view: bool = False, array_model_name: Optional[str] = None) -> str:
+        """Get the SQL reference of a column in a view context.
+
+        Args:
+            column: The column to reference
+            is_nested_view: Whether the reference is made from a nested view
+            array_model_name: Name of the array column owning the nested view
+
+        Returns:
+            Formatted column name for SQL reference with ${TABLE} prefix
+        """
+        context = array_model_name if is_nested_view else None
+        key = (column.name, context)
+        original_name = column.original_name or column.name
+        cached = self._references.get(key)
+        if cached is not None and cached[0] == original_name:
+            return cached[1]
+
+        reference = get_column_name(column, True, None, None, is_nested_view, array_model_name)
+        self._references[key] = (original_name, reference)
+        return reference
+
+
+def get_sql_reference_resolver(model: DbtModel) -> SqlReferenceResolver:
+    """Get the SQL reference resolver of a model, building it once per columns dict.
+
+    Args:
+        model: The dbt model
+
+    Returns:
+        Resolver cached on the model
+    """
+    columns = model.columns
+    cached = getattr(model, '_sql_reference_resolver', None)
+    if cached is not None and cached[0] is columns:
+        return cached[1]
+    resolver = SqlReferenceResolver(get_column_records(model) if isinstance(columns, dict) else {})
+    setattr(model, '_sql_reference_resolver', (columns, resolver))
+    return resolver
@@ -141,27 +141,19 @@ class LookmlViewGenerator:
         if hasattr(model, 'tags'):
             lines.append(f"# Tags: {','.join(getattr(model, 'tags', []))}")
 
-        # Check for metadata stored in various possible locations
-        # Try to get metadata from model attributes or stored manifest data
-        manifest_data = getattr(model, '_manifest_data', None)
-        if manifest_data:
-            # Extract meta fields from stored manifest data
-            meta = manifest_data.get('meta', {})
-
-            # Extract metadata from manifest
-            if owner := meta.get('owner'):
-                lines.append(f"# Owner: {owner}")
-
-            if maturity := meta.get('model_maturity'):
-                lines.append(f"# Maturity: {maturity}")
-
-            if contains_pii := meta.get('contains_pii'):
-                pii_value = "Yes" if contains_pii else "No"
-                lines.append(f"# PII: {pii_value}")
-
-            # Get group from manifest data
-            if group := manifest_data.get('group'):
-                lines.append(f"# Group: {group}")
+        # Metadata extracted from the manifest node at parse time
+        if header_metadata := getattr(model, 'header_metadata', None):
+            if header_metadata.owner:
+                lines.append(f"# Owner: {header_metadata.owner}")
+
+            if header_metadata.maturity:
+                lines.append(f"# Maturity: {header_metadata.maturity}")
+
+            if header_metadata.contains_pii:
+                lines.append("# PII: Yes")
+
+            if header_metadata.group:
+                lines.append(f"# Group: {header_metadata.group}")
 
         if len(lines) > 1:
             return '\n'.join(lines) + "\n\n"
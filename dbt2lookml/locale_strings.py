@@ -0,0 +1,117 @@
+"""Table of the labels in generated LookML, written to a Looker locale strings file."""
+
+import json
+import logging
+import os
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional
+
+if TYPE_CHECKING:
+    from dbt2lookml.utils import FileHandler
+
+# Strings file of the default locale, in the output directory
+DEFAULT_LOCALE = 'en'
+LOCALE_STRINGS_FILE = '{locale}.strings.json'
+# Attributes of views, fields, explores and joins that Looker localizes
+LABEL_KEYS = ('label', 'group_label', 'group_item_label', 'view_label')
+FIELD_PLURALS = ('dimensions', 'dimension_groups', 'measures')
+
+
+def _dicts(value: Any) -> Iterable[Dict[str, Any]]:
+    """Get the dicts of a LookML list, or the value itself if it is a dict."""
+    if isinstance(value, dict):
+        return [value]
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, dict)]
+    return []
+
+
+class LabelTable:
+    """Deduplicated table of labels, mapping each label to its text in the default locale.
+
+    Labels are added as each generated file is written, so views are never read
+    back, and the table is streamed to the strings file in one pass at the end.
+    The strings file of an earlier run is merged in: its entries keep their text,
+    including edits, and models not generated this run keep their labels.
+    """
+
+    def __init__(self, output_dir: str, locale: str = DEFAULT_LOCALE, file_handler: Optional['FileHandler'] = None):
+        """Load the strings file of an earlier run, if any.
+
+        Args:
+            output_dir: Output directory the strings file lives in
+            locale: Locale the strings file is named after
+            file_handler: Handler writing the strings file, a FileHandler if None
+        """
+        if file_handler is None:
+            from dbt2lookml.utils import FileHandler
+
+            file_handler = FileHandler()
+        self._file_handler = file_handler
+        self.path = os.path.join(output_dir, LOCALE_STRINGS_FILE.format(locale=locale))
+        self._strings: Dict[str, str] = {}
+        self.previous_count = 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                previous = json.load(f)
+            if isinstance(previous, dict):
+                self._strings = {key: text for key, text in previous.items() if isinstance(text, str)}
+            self.previous_count = len(self._strings)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable locale strings file {self.path}: {str(e)}")
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    def __contains__(self, label: str) -> bool:
+        return label in self._strings
+
+    def add(self, label: Optional[str]) -> None:
+        """Add a label, unless it is empty or already in the table."""
+        if label and isinstance(label, str) and label not in self._strings:
+            self._strings[label] = label
+
+    def _add_labels(self, element: Dict[str, Any]) -> None:
+        for key in LABEL_KEYS:
+            self.add(element.get(key))
+
+    def add_lookml(self, lookml: Dict[str, Any]) -> None:
+        """Add the labels of a generated file.
+
+        Args:
+            lookml: Generated LookML with 'view' and optionally 'explore'
+        """
+        for view in _dicts(lookml.get('view')):
+            self._add_labels(view)
+            for plural in FIELD_PLURALS:
+                for field in _dicts(view.get(plural)):
+                    self._add_labels(field)
+        for explore in _dicts(lookml.get('explore')):
+            self._add_labels(explore)
+            for join in _dicts(explore.get('joins')):
+                self._add_labels(join)
+
+    def write(self) -> None:
+        """Stream the table, sorted by label, to the strings file.
+
+        Entries are written one per line to a temporary file that then replaces the
+        strings file, so no second copy of the table is built and an interrupted run
+        leaves the previous file in place.
+
+        Raises:
+            CliError: If the strings file cannot be written
+        """
+        self._file_handler.write_atomic(self.path, self._entries())
+
+    def _entries(self) -> Iterator[str]:
+        """Get the lines of the strings file, sorted by label."""
+        yield '{'
+        separator = '\n'
+        for label in sorted(self._strings):
+            text = self._strings[label]
+            key = json.dumps(label, ensure_ascii=False)
+            # Most labels are their own text in the default locale, so they are encoded once
+            yield f'{separator}  {key}: {key if text == label else json.dumps(text, ensure_ascii=False)}'
+            separator = ',\n'
+        yield '\n}\n'
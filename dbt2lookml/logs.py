@@ -0,0 +1,184 @@
+"""Queue-based logging for the CLI, rendered off the generating thread."""
+
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+PLAIN_FORMAT = '%(asctime)s %(levelname)-8s %(message)s'
+# Window of the per-category rate limit
+RATE_LIMIT_INTERVAL = 60.0
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Format each record as a JSON object on one line, for CI log processors."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    """Drop records of a category beyond a number per time window.
+
+    The category of a record is its ``category`` attribute when logged with
+    ``extra={'category': ...}``, otherwise its call site, so one log statement in a
+    loop over a pathological model cannot flood the output. Dropped records are
+    counted per category for a summary at the end of the run. Warnings and errors
+    are never dropped, as they may be all that is reported about a failed model.
+    """
+
+    def __init__(self, limit: int, interval: float = RATE_LIMIT_INTERVAL):
+        """Create the filter.
+
+        Args:
+            limit: Records let through per category and window
+            interval: Length of the window in seconds
+        """
+        super().__init__()
+        self._limit = limit
+        self._interval = interval
+        self._windows: Dict[str, List] = {}
+        self._lock = threading.Lock()
+        self.suppressed: Counter = Counter()
+        # Message template of each suppressed category, to tell what was dropped
+        self.templates: Dict[str, str] = {}
+
+    @staticmethod
+    def category(record: logging.LogRecord) -> str:
+        """Get the category of a record."""
+        return getattr(record, 'category', None) or f'{record.module}:{record.lineno}'
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        category = self.category(record)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(category)
+            if window is None or now - window[0] >= self._interval:
+                self._windows[category] = [now, 1]
+                return True
+            window[1] += 1
+            if window[1] <= self._limit:
+                return True
+            self.suppressed[category] += 1
+            self.templates.setdefault(category, str(record.msg))
+            return False
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener's handler.
+
+    Only the message is rendered here, as its arguments may change after the call
+    returns. The listener runs in the same process, so exception info is passed as is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class QueueLogging:
+    """Route root logging through a queue drained by a listener thread.
+
+    Log calls only put the record on a queue; rendering to the terminal (rich is
+    expensive per record) or to a plain or JSON-lines stream happens in the
+    listener thread, so generation never waits on it.
+    """
+
+    def __init__(self, handler: logging.Handler, rate_limit: int = 0):
+        """Create the logging setup, not started yet.
+
+        Args:
+            handler: Handler rendering the records in the listener thread
+            rate_limit: Records let through per category and minute, 0 for no limit
+        """
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._queue_handler = _QueueHandler(self._queue)
+        self._rate_limit = RateLimitFilter(rate_limit) if rate_limit > 0 else None
+        if self._rate_limit is not None:
+            self._queue_handler.addFilter(self._rate_limit)
+        self._listener = logging.handlers.QueueListener(self._queue, handler, respect_handler_level=True)
+        self._started = False
+
+    def start(self) -> None:
+        """Start the listener and send root logging to the queue."""
+        self._listener.start()
+        logging.getLogger().addHandler(self._queue_handler)
+        self._started = True
+
+    def stop(self) -> None:
+        """Report suppressed records, then render everything still queued and detach."""
+        if not self._started:
+            return
+        self._started = False
+        if self._rate_limit is not None:
+            for category, count in self._rate_limit.suppressed.most_common():
+                logging.getLogger(__name__).warning(
+                    "Suppressed %s log records from %s ('%s'), raise --log-rate-limit to see them",
+                    count,
+                    category,
+                    self._rate_limit.templates[category],
+                    extra={'category': f'rate-limit:{category}'},
+                )
+        logging.getLogger().removeHandler(self._queue_handler)
+        self._listener.stop()
+
+
+def create_handler(log_format: str) -> logging.Handler:
+    """Create the handler rendering records in a log format.
+
+    Args:
+        log_format: 'rich' for the terminal, 'plain' or 'json' (JSON lines) for CI
+
+    Returns:
+        The handler
+    """
+    if log_format == 'rich':
+        from rich.logging import RichHandler
+
+        handler: logging.Handler = RichHandler()
+        handler.setFormatter(logging.Formatter('%(message)s', datefmt='[%X]'))
+        return handler
+    handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(JsonLinesFormatter() if log_format == 'json' else logging.Formatter(PLAIN_FORMAT))
+    return handler
+
+
+def configure_logging(log_format: str = 'rich', rate_limit: int = 0) -> Optional[QueueLogging]:
+    """Send root logging through a queue to a handler of the given format.
+
+    Nothing is changed when the root logger already has handlers, so applications
+    embedding the CLI keep their own logging setup.
+
+    Args:
+        log_format: 'rich', 'plain' or 'json'
+        rate_limit: Records let through per category and minute, 0 for no limit
+
+    Returns:
+        The started QueueLogging, to stop at the end of the run, or None
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+    root.setLevel(logging.INFO)
+    queue_logging = QueueLogging(create_handler(log_format), rate_limit)
+    queue_logging.start()
+    return queue_logging
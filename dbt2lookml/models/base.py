@@ -0,0 +1,13 @@
+"""Base class of the pydantic models."""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class DeferredBaseModel(BaseModel):
+    """Pydantic model whose validation schema is built on first use rather than at import.
+
+    Importing the models is then cheap, so --help, --version and worker processes that
+    never validate dbt artifacts don't pay for building every schema.
+    """
+
+    model_config = ConfigDict(defer_build=True)
@@ -1,18 +1,32 @@
 """Column collections for organizing model columns by their intended use."""
 
 from dataclasses import dataclass
-from typing import Dict, List, Set
+from typing import Dict, List, Mapping, NamedTuple, Optional, Set, Union
 
+from dbt2lookml.models.column_record import ColumnRecord, get_column_records
 from dbt2lookml.models.dbt import DbtModel, DbtModelColumn
 
 
+class ColumnCostStats(NamedTuple):
+    """Shape of a model's columns that drives its generation cost."""
+
+    columns: int
+    arrays: int
+    nested_columns: int
+    max_depth: int
+
+
 @dataclass
 class ColumnCollections:
-    """Pre-structured column collections to avoid filtering during generation."""
+    """Pre-structured column collections to avoid filtering during generation.
 
-    main_view_columns: Dict[str, DbtModelColumn]
-    nested_view_columns: Dict[str, Dict[str, DbtModelColumn]]  # array_name -> columns
-    excluded_columns: Dict[str, DbtModelColumn]  # For reference/debugging
+    Collections hold the model's compact column records rather than the parsed
+    pydantic columns, so generators work on the same records for every view.
+    """
+
+    main_view_columns: Dict[str, ColumnRecord]
+    nested_view_columns: Dict[str, Dict[str, ColumnRecord]]  # array_name -> columns
+    excluded_columns: Dict[str, ColumnRecord]  # For reference/debugging
 
     @classmethod
     def from_model(cls, model: DbtModel, array_models: List[str] = None) -> 'ColumnCollections':
@@ -20,8 +34,8 @@ class ColumnCollections:
         if array_models is None:
             array_models = []
 
-        # Get all columns from the model
-        all_columns = model.columns
+        # Get all columns from the model as compact records (built once per model)
+        all_columns = get_column_records(model)
 
         # Build hierarchy map for proper nested array detection
         hierarchy = cls._build_hierarchy_map(all_columns)
@@ -95,7 +109,32 @@ class ColumnCollections:
         )
 
     @staticmethod
-    def _build_hierarchy_map(columns: Dict[str, DbtModelColumn]) -> Dict[str, Dict]:
+    def cost_stats(column_types: Mapping[str, Optional[str]]) -> ColumnCostStats:
+        """Count what makes a model expensive to generate, from column names and types only.
+
+        Arrays are detected like in the hierarchy map, by a data type starting with
+        ARRAY, and nesting by the dots in column names, so no records are built.
+
+        Args:
+            column_types: Data type of each column name, None if unknown
+
+        Returns:
+            Number of columns, arrays and nested columns, and the deepest nesting
+        """
+        arrays = 0
+        nested_columns = 0
+        max_depth = 0
+        for name, data_type in column_types.items():
+            if data_type and str(data_type).upper().startswith('ARRAY'):
+                arrays += 1
+            depth = name.count('.')
+            if depth:
+                nested_columns += 1
+                max_depth = max(max_depth, depth)
+        return ColumnCostStats(len(column_types), arrays, nested_columns, max_depth)
+
+    @staticmethod
+    def _build_hierarchy_map(columns: Mapping[str, Union[DbtModelColumn, ColumnRecord]]) -> Dict[str, Dict]:
         """Build a map of parent -> children relationships based on dot notation."""
         hierarchy = {}
 
@@ -125,7 +164,7 @@ class ColumnCollections:
         return hierarchy
 
     @staticmethod
-    def _should_exclude_from_all_views(column: DbtModelColumn, hierarchy: Dict) -> bool:
+    def _should_exclude_from_all_views(column: Union[DbtModelColumn, ColumnRecord], hierarchy: Dict) -> bool:
         """Check if a column should be excluded from all views."""
         # Exclude STRUCT parents that have children (but not ARRAY<STRUCT>)
         if column.data_type and "STRUCT" in str(column.data_type).upper():
@@ -0,0 +1,154 @@
+"""Per-column naming record shared by the LookML generators."""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from dbt2lookml.utils import camel_to_snake, quote_column_name_if_needed, safe_name
+
+
+def snake_part(part: str) -> str:
+    """Convert one dotted name part to snake_case, keeping pure lowercase parts as-is."""
+    if part.islower() and '_' not in part:
+        return part
+    return camel_to_snake(part)
+
+
+def remove_date_suffix(part: str) -> str:
+    """Remove a trailing 'Date', '_date' or 'date' from a name part."""
+    if part.endswith('Date'):
+        return part[:-4]
+    elif part.endswith('_date'):
+        return part[:-5]
+    elif part.lower().endswith('date') and part != 'Date':
+        return part[:-4]
+    return part
+
+
+def format_label(name: Optional[str] = None, remove_date: bool = True) -> str:
+    """Format a name into a human-readable title case label.
+
+    Args:
+        name: The name to format
+        remove_date: Whether to remove a 'Date' or '_date' suffix first
+
+    Returns:
+        Formatted label string
+    """
+    if name is None:
+        return ""
+    if remove_date:
+        if name.endswith('Date'):
+            name = name[:-4]
+        elif name.endswith('_date'):
+            name = name[:-5]
+    return camel_to_snake(name).replace("_", " ").title()
+
+
+def group_label(parts: List[str]) -> str:
+    """Create a group label from nested field parts, e.g. ['classification', 'ItemGroup'] -> 'Classification Item Group'."""
+    return ' '.join(camel_to_snake(part).replace('_', ' ').title() for part in parts)
+
+
+def item_label(item: str) -> str:
+    """Create a group item label from the last part of a nested field."""
+    return camel_to_snake(item).replace('_', ' ').capitalize()
+
+
+def date_name(column_name: str) -> str:
+    """Derive the dimension group name of a date/time column.
+
+    Examples:
+        DeliveryStartDate -> delivery_start
+        format.period.EndDate -> format__period__end
+    """
+    if '.' in column_name:
+        parts = column_name.split('.')
+        parts[-1] = remove_date_suffix(parts[-1])
+        result = '__'.join(snake_part(part) for part in parts)
+    elif column_name.lower() == 'date':
+        result = 'date'
+    else:
+        result = snake_part(remove_date_suffix(column_name).rstrip('_'))
+    return result.rstrip('_')
+
+
+@dataclass(frozen=True, slots=True)
+class ColumnNaming:
+    """Every name and label the generators derive from a column's name.
+
+    Computed once per column from ``name`` and ``original_name`` instead of
+    re-splitting and re-converting the names in each generator.
+    """
+
+    name: str
+    original_name: str
+    snake_parts: Tuple[str, ...]
+    lookml_long_name: str
+    lookml_name: str
+    dimension_name: str
+    group_label: Optional[str]
+    item_label: Optional[str]
+    label: str
+    dimension_group_label: str
+    date_name: str
+    sql_path: str
+
+    @classmethod
+    def from_names(cls, name: str, original_name: Optional[str] = None) -> 'ColumnNaming':
+        """Build the naming record of a column.
+
+        Args:
+            name: Lowercased column name (dots separate nested fields)
+            original_name: Column name as found in the warehouse, preserving case
+
+        Returns:
+            ColumnNaming for the column
+        """
+        original_name = original_name or name
+        original_parts = original_name.split('.')
+        snake_parts = tuple(snake_part(part) for part in original_parts)
+        lookml_long_name = '__'.join(snake_parts)
+
+        # Main view group labels come from the lowercased name, item labels keep the original case
+        parts = name.split('.')
+        if len(parts) >= 2:
+            last_part = original_parts[-1] if len(original_parts) == len(parts) else parts[-1]
+            column_group_label = group_label(parts[:-1])
+            column_item_label = item_label(last_part)
+        else:
+            column_group_label = None
+            column_item_label = None
+
+        label = format_label(original_parts[-1], remove_date=False)
+        dimension_group_label = group_label(original_parts[:-1]) if len(original_parts) > 1 else label
+
+        return cls(
+            name=name,
+            original_name=original_name,
+            snake_parts=snake_parts,
+            lookml_long_name=lookml_long_name,
+            lookml_name=camel_to_snake(original_parts[-1]),
+            dimension_name=safe_name(lookml_long_name),
+            group_label=column_group_label,
+            item_label=column_item_label,
+            label=label,
+            dimension_group_label=dimension_group_label,
+            date_name=date_name(original_name),
+            sql_path=quote_column_name_if_needed(original_name),
+        )
+
+    def matches(self, name: str, original_name: Optional[str]) -> bool:
+        """Check whether the record was built from these names."""
+        return self.name == name and self.original_name == (original_name or name)
+
+
+def get_column_naming(column) -> ColumnNaming:
+    """Get the naming record of a column or column record.
+
+    Uses the record precomputed at parse time when it still matches the
+    column's names and builds a fresh one otherwise.
+    """
+    naming = getattr(column, 'naming', None)
+    if isinstance(naming, ColumnNaming) and naming.matches(column.name, column.original_name):
+        return naming
+    return ColumnNaming.from_names(column.name, column.original_name)
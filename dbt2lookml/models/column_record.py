@@ -0,0 +1,116 @@
+"""Compact, immutable column records used on the generation hot path."""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from dbt2lookml.models.column_naming import ColumnNaming
+from dbt2lookml.models.dbt import DbtModel, DbtModelColumn
+from dbt2lookml.models.looker import DbtMetaLookerDimension, DbtMetaLookerMeasure
+
+
+class ColumnRecord:
+    """Slotted, read-only snapshot of a DbtModelColumn.
+
+    Generators read column attributes many times per model. Pydantic attribute
+    access and the ``meta.looker.dimension`` chains add up on wide tables, so the
+    values they need are flattened into a record without a ``__dict__`` and
+    without its own copy of the meta object graph.
+    """
+
+    __slots__ = (
+        'name',
+        'original_name',
+        'description',
+        'data_type',
+        'inner_types',
+        'nested',
+        'is_primary_key',
+        'lookml_name',
+        'lookml_long_name',
+        'looker_dimension',
+        'looker_measures',
+        'naming',
+    )
+    name: str
+    original_name: str
+    description: Optional[str]
+    data_type: Optional[str]
+    inner_types: Tuple[str, ...]
+    nested: bool
+    is_primary_key: bool
+    lookml_name: Optional[str]
+    lookml_long_name: Optional[str]
+    looker_dimension: Optional[DbtMetaLookerDimension]
+    looker_measures: Tuple[DbtMetaLookerMeasure, ...]
+    naming: ColumnNaming
+
+    def __init__(
+        self,
+        name: str,
+        original_name: Optional[str] = None,
+        description: Optional[str] = None,
+        data_type: Optional[str] = None,
+        inner_types: Iterable[str] = (),
+        nested: Optional[bool] = False,
+        is_primary_key: Optional[bool] = False,
+        lookml_name: Optional[str] = None,
+        lookml_long_name: Optional[str] = None,
+        looker_dimension: Optional[DbtMetaLookerDimension] = None,
+        looker_measures: Iterable[DbtMetaLookerMeasure] = (),
+        naming: Optional[ColumnNaming] = None,
+    ):
+        set_slot = object.__setattr__
+        set_slot(self, 'name', name)
+        set_slot(self, 'original_name', original_name or name)
+        set_slot(self, 'description', description)
+        set_slot(self, 'data_type', data_type)
+        set_slot(self, 'inner_types', tuple(inner_types))
+        set_slot(self, 'nested', bool(nested))
+        set_slot(self, 'is_primary_key', bool(is_primary_key))
+        set_slot(self, 'lookml_name', lookml_name)
+        set_slot(self, 'lookml_long_name', lookml_long_name)
+        set_slot(self, 'looker_dimension', looker_dimension)
+        set_slot(self, 'looker_measures', tuple(looker_measures))
+        if naming is None or not naming.matches(name, original_name):
+            naming = ColumnNaming.from_names(name, original_name)
+        set_slot(self, 'naming', naming)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"ColumnRecord is immutable, cannot set '{name}'")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"ColumnRecord is immutable, cannot delete '{name}'")
+
+    def __repr__(self) -> str:
+        return f"ColumnRecord(name={self.name!r}, data_type={self.data_type!r})"
+
+    @classmethod
+    def from_column(cls, column: DbtModelColumn) -> 'ColumnRecord':
+        """Build a record from a parsed dbt column, sharing its meta and naming objects."""
+        return cls(
+            name=column.name,
+            original_name=column.original_name,
+            description=column.description,
+            data_type=column.data_type,
+            inner_types=column.inner_types or (),
+            nested=column.nested,
+            is_primary_key=column.is_primary_key,
+            lookml_name=column.lookml_name,
+            lookml_long_name=column.lookml_long_name,
+            looker_dimension=column.looker_dimension,
+            looker_measures=column.looker_measures,
+            naming=column.naming,
+        )
+
+
+def get_column_records(model: DbtModel) -> Dict[str, ColumnRecord]:
+    """Get the column records of a model, building them once per columns dict.
+
+    The table is cached on the model and rebuilt only if ``model.columns`` has
+    been replaced since it was built.
+    """
+    cached = getattr(model, '_column_records', None)
+    if cached is not None and cached[0] is model.columns:
+        return cached[1]
+    records = {name: ColumnRecord.from_column(column) for name, column in model.columns.items()}
+    setattr(model, '_column_records', (model.columns, records))
+    return records
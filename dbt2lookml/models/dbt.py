@@ -3,15 +3,15 @@ from __future__ import annotations
 import logging
 from typing import Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import Field, PrivateAttr, field_validator, model_validator
 
 from dbt2lookml.enums import DbtResourceType, SupportedDbtAdapters
 from dbt2lookml.exceptions import UnsupportedDbtAdapterError
-from dbt2lookml.models.looker import DbtMetaLooker
+from dbt2lookml.models.base import DeferredBaseModel
+from dbt2lookml.models.column_naming import ColumnNaming
+from dbt2lookml.models.looker import DbtMetaLooker, DbtMetaLookerDimension, DbtMetaLookerMeasure
 from dbt2lookml.models.schema import SchemaParser
 
-schema_parser = SchemaParser()
-
 
 def yes_no_validator(value: Union[bool, str]) -> Optional[str]:
     """Convert booleans or strings to lookml yes/no syntax."""
@@ -26,7 +26,7 @@ def yes_no_validator(value: Union[bool, str]) -> Optional[str]:
         return None
 
 
-class DbtBaseModel(BaseModel):
+class DbtBaseModel(DeferredBaseModel):
     """Base model for dbt objects."""
 
     def _get_meta_looker(self, parent_attr, attr) -> Optional[dict]:
@@ -45,7 +45,7 @@ class DbtNode(DbtBaseModel):
     resource_type: DbtResourceType
 
 
-class DbtExposureRef(BaseModel):
+class DbtExposureRef(DeferredBaseModel):
     """A reference in a dbt exposure."""
 
     name: str
@@ -53,7 +53,7 @@ class DbtExposureRef(BaseModel):
     version: Optional[Union[str, int]] = None
 
 
-class DbtDependsOn(BaseModel):
+class DbtDependsOn(DeferredBaseModel):
     """A model for dependencies between dbt objects.
     Contains lists of macros and nodes that an object depends on.
     """
@@ -70,10 +70,10 @@ class DbtExposure(DbtNode):
     url: Optional[str] = None
     refs: List[DbtExposureRef]
     tags: Optional[List[str]] = []  # Adds exposure tags
-    depends_on: DbtDependsOn = DbtDependsOn()
+    depends_on: DbtDependsOn = Field(default_factory=DbtDependsOn)
 
 
-class DbtCatalogNodeMetadata(BaseModel):
+class DbtCatalogNodeMetadata(DeferredBaseModel):
     """Metadata about a dbt catalog node."""
 
     type: str
@@ -83,7 +83,7 @@ class DbtCatalogNodeMetadata(BaseModel):
     owner: Optional[str] = None
 
 
-class DbtCatalogNodeColumn(BaseModel):
+class DbtCatalogNodeColumn(DeferredBaseModel):
     """A column in a dbt catalog node."""
 
     type: str
@@ -110,13 +110,15 @@ class DbtCatalogNodeColumn(BaseModel):
 
         data_type = truncate_before_character(column_type, '<')
         values['data_type'] = truncate_before_character(data_type, '(')
-        inner_types = schema_parser.parse(column_type)
+        # A parser per column: SchemaParser keeps its parse state on the instance, and
+        # catalogs may be validated in several threads at once
+        inner_types = SchemaParser().parse(column_type)
         if inner_types and inner_types != column_type:
             values['inner_types'] = inner_types
         return values
 
 
-class DbtCatalogNodeRelationship(BaseModel):
+class DbtCatalogNodeRelationship(DeferredBaseModel):
     """A model for nodes containing relationships."""
 
     type: str
@@ -124,31 +126,60 @@ class DbtCatalogNodeRelationship(BaseModel):
     relationships: List[str]  # List of relationships, adjust the type accordingly
 
 
-class DbtCatalogNode(BaseModel):
+class DbtCatalogNode(DeferredBaseModel):
     """A dbt catalog node."""
 
     metadata: DbtCatalogNodeMetadata
     columns: Dict[str, DbtCatalogNodeColumn]
 
-    @field_validator('columns')
+    @field_validator('columns', mode='before')
     @classmethod
-    def case_insensitive_column_names(cls, v: Dict[str, DbtCatalogNodeColumn]):
-        return {
-            name.lower(): column.model_copy(update={'name': column.name.lower(), 'original_name': name})
-            for name, column in v.items()
-        }
+    def case_insensitive_column_names(cls, v):
+        """Key columns by lowercase name and keep the catalog casing in original_name.
+
+        Runs on the raw input so every catalog column is validated exactly once.
+        """
+        if not isinstance(v, dict):
+            return v
+        normalized = {}
+        for name, column in v.items():
+            if isinstance(column, dict):
+                column = dict(column, original_name=name)
+                if isinstance(column.get('name'), str):
+                    column['name'] = column['name'].lower()
+            elif isinstance(column, DbtCatalogNodeColumn):
+                column.name = column.name.lower()
+                column.original_name = name
+            normalized[name.lower()] = column
+        return normalized
 
 
-class DbtCatalog(BaseModel):
+class DbtCatalog(DeferredBaseModel):
     """A dbt catalog."""
 
     nodes: Dict[str, DbtCatalogNode]
 
 
-class DbtModelColumnMeta(BaseModel):
+class DbtModelColumnMeta(DeferredBaseModel):
     """Metadata about a column in a dbt model."""
 
-    looker: Optional[DbtMetaLooker] = DbtMetaLooker()
+    looker: Optional[DbtMetaLooker] = Field(default_factory=DbtMetaLooker)
+
+
+_default_column_meta: Optional[DbtModelColumnMeta] = None
+
+
+def default_column_meta() -> DbtModelColumnMeta:
+    """Get the metadata of columns without Looker metadata, one instance shared by all of them.
+
+    Most columns of a wide table have no Looker metadata, and an empty meta graph of
+    their own would cost more than the rest of the column. The shared instance must
+    not be modified.
+    """
+    global _default_column_meta
+    if _default_column_meta is None:
+        _default_column_meta = DbtModelColumnMeta()
+    return _default_column_meta
 
 
 class DbtModelColumn(DbtBaseModel):
@@ -161,10 +192,12 @@ class DbtModelColumn(DbtBaseModel):
     original_name: Optional[str] = None
     data_type: Optional[str] = None
     inner_types: list[str] = []
-    meta: Optional[DbtModelColumnMeta] = DbtModelColumnMeta()
+    meta: Optional[DbtModelColumnMeta] = Field(default_factory=default_column_meta)
     nested: Optional[bool] = False
     is_primary_key: Optional[bool] = False
 
+    _naming: Optional[ColumnNaming] = PrivateAttr(default=None)
+
     # Root validator
     @model_validator(mode="before")
     @classmethod
@@ -185,29 +218,56 @@ class DbtModelColumn(DbtBaseModel):
         # Lowercase the name for processing, but preserve original case in original_name
         values['name'] = name.lower()
 
-        # Import centralized camel_to_snake function
-        from dbt2lookml.utils import camel_to_snake
-
-        # Use realistic transformation logic for long name with double underscores
-        # Use original_name to preserve CamelCase for proper conversion
-        original_parts = values.get('original_name', name).split('.')
-        snake_parts = []
-        for part in original_parts:
-            # Apply the same realistic conversion logic as dimension generator
-            if part.islower() and '_' not in part:
-                # Pure lowercase - keep as-is
-                snake_parts.append(part)
-            else:
-                # CamelCase or snake_case - convert
-                snake_parts.append(camel_to_snake(part))
-        values['lookml_long_name'] = '__'.join(snake_parts)
-
-        # Use snake_case for the last part as lookml_name, using original_name to preserve case
-        original_name = values.get('original_name', name)
-        values['lookml_name'] = camel_to_snake(original_name.split('.')[-1])
         values['description'] = values.get('description', "This field is missing a description.")
+        # Manifest columns carry a meta dict even when it is empty
+        meta = values.get('meta')
+        if isinstance(meta, dict) and 'looker' not in meta:
+            values['meta'] = default_column_meta()
         return values
 
+    @model_validator(mode="after")
+    def set_naming(self):
+        """Compute the naming record once and derive the lookml names from it."""
+        self._refresh_naming()
+        return self
+
+    def _refresh_naming(self) -> ColumnNaming:
+        naming = ColumnNaming.from_names(self.name, self.original_name)
+        self._naming = naming
+        self.lookml_long_name = naming.lookml_long_name
+        self.lookml_name = naming.lookml_name
+        return naming
+
+    @property
+    def naming(self) -> ColumnNaming:
+        """Precomputed names and labels of the column, rebuilt if its names changed."""
+        naming = self._naming
+        if naming is None or not naming.matches(self.name, self.original_name):
+            naming = ColumnNaming.from_names(self.name, self.original_name)
+            self._naming = naming
+        return naming
+
+    def set_original_name(self, original_name: str) -> None:
+        """Set the warehouse-cased name and keep the derived lookml names in sync."""
+        if original_name == self.original_name:
+            return
+        self.original_name = original_name
+        self._refresh_naming()
+
+    @property
+    def looker_dimension(self) -> Optional[DbtMetaLookerDimension]:
+        """Looker dimension metadata for the column, if any."""
+        if self.meta and self.meta.looker:
+            return self.meta.looker.dimension
+        return None
+
+    @property
+    def looker_measures(self) -> List[DbtMetaLookerMeasure]:
+        """Looker measures configured on the column."""
+        if self.meta and self.meta.looker and self.meta.looker.measures:
+            return self.meta.looker.measures
+        return []
+
     @model_validator(mode="before")
     @classmethod
     def set_primary_key(cls, values):
@@ -219,10 +279,45 @@ class DbtModelColumn(DbtBaseModel):
         return values
 
 
-class DbtModelMeta(BaseModel):
+class DbtModelMeta(DeferredBaseModel):
     """Metadata about a dbt model."""
 
-    looker: Optional[DbtMetaLooker] = DbtMetaLooker()
+    looker: Optional[DbtMetaLooker] = Field(default_factory=DbtMetaLooker)
+
+
+class DbtModelHeaderMetadata(DeferredBaseModel):
+    """Model metadata shown in the header comment of generated files.
+
+    Extracted from the raw manifest node while it is validated, so the raw node
+    (with its compiled SQL and raw code) does not have to be kept for the header.
+    Only set values are kept, as the header omits empty ones.
+    """
+
+    owner: Optional[str] = None
+    maturity: Optional[str] = None
+    contains_pii: bool = False
+    group: Optional[str] = None
+
+    @classmethod
+    def from_node(cls, node: dict) -> DbtModelHeaderMetadata:
+        """Extract the header metadata of a raw manifest node.
+
+        Args:
+            node: Raw manifest node with 'meta' and 'group' keys
+
+        Returns:
+            The header metadata
+        """
+        meta = node.get('meta')
+        if not isinstance(meta, dict):
+            meta = {}
+        owner, maturity, group = meta.get('owner'), meta.get('model_maturity'), node.get('group')
+        return cls(
+            owner=str(owner) if owner else None,
+            maturity=str(maturity) if maturity else None,
+            contains_pii=bool(meta.get('contains_pii')),
+            group=str(group) if group else None,
+        )
 
 
 class DbtModel(DbtNode):
@@ -237,9 +332,18 @@ class DbtModel(DbtNode):
     description: str
     columns: Dict[str, DbtModelColumn]
     tags: List[str]
-    meta: DbtModelMeta = DbtModelMeta()
+    meta: DbtModelMeta = Field(default_factory=DbtModelMeta)
+    header_metadata: DbtModelHeaderMetadata = Field(default_factory=DbtModelHeaderMetadata)
     path: str
 
+    @model_validator(mode='before')
+    @classmethod
+    def extract_header_metadata(cls, values):
+        """Extract the header metadata from the raw node, which is not kept after parsing."""
+        if isinstance(values, dict) and 'header_metadata' not in values:
+            values = {**values, 'header_metadata': DbtModelHeaderMetadata.from_node(values)}
+        return values
+
     @field_validator('columns')
     @classmethod
     def case_insensitive_column_names(cls, v: Dict[str, DbtModelColumn]):
@@ -253,14 +357,16 @@ class DbtModel(DbtNode):
             if isinstance(column, dict):
                 new_columns[name] = column
             elif isinstance(column, DbtModelColumn):
-                # Lowercase the name and update the column name
-                new_columns[name.lower()] = column.model_copy(update={'name': column.name.lower()})
+                # Column validation already lowercases names, so re-key without copying the column
+                if column.name != column.name.lower():
+                    column.name = column.name.lower()
+                new_columns[name.lower()] = column
             else:
                 raise TypeError(f"The value for key {name} is not a DbtModelColumn instance.")
         return new_columns
 
 
-class DbtManifestMetadata(BaseModel):
+class DbtManifestMetadata(DeferredBaseModel):
     """Metadata about a dbt manifest.
     Contains information about the dbt adapter type and ensures it's supported.
     """
@@ -278,7 +384,7 @@ class DbtManifestMetadata(BaseModel):
         return v
 
 
-class DbtManifest(BaseModel):
+class DbtManifest(DeferredBaseModel):
     """A dbt manifest containing nodes, metadata, and exposures.
     The manifest is the main entry point for accessing dbt project information.
     """
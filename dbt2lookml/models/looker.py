@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import List, Optional, Union
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field, model_validator
 
 from dbt2lookml.enums import (
     LookerJoinType,
@@ -11,9 +11,10 @@ from dbt2lookml.enums import (
     LookerTimeFrame,
     LookerValueFormatName,
 )
+from dbt2lookml.models.base import DeferredBaseModel
 
 
-class LookViewFile(BaseModel):
+class LookViewFile(DeferredBaseModel):
     """A file in a looker view directory."""
 
     filename: str
@@ -21,7 +22,7 @@ class LookViewFile(BaseModel):
     db_schema: str = Field(..., alias="schema")
 
 
-class DbtMetaLookerBase(BaseModel):
+class DbtMetaLookerBase(DeferredBaseModel):
     """Base class for Looker metadata."""
 
     label: Optional[str] = None
@@ -51,7 +52,7 @@ class DbtMetaLookerDimension(DbtMetaLookerBase):
     can_filter: Optional[Union[bool, str]] = Field(default=None)
 
 
-class DbtMetaLookerMeasureFilter(BaseModel):
+class DbtMetaLookerMeasureFilter(DeferredBaseModel):
     filter_dimension: str
     filter_expression: str
 
@@ -95,7 +96,7 @@ class DbtMetaLookerMeasure(DbtMetaLookerBase):
         return self
 
 
-class DbtMetaLookerJoin(BaseModel):
+class DbtMetaLookerJoin(DeferredBaseModel):
     """Looker-specific metadata for joins on a dbt model.
     Example:
         meta:
@@ -115,7 +116,7 @@ class DbtMetaLookerJoin(BaseModel):
     relationship: Optional[LookerRelationshipType] = Field(default=None)
 
 
-class DbtMetaLooker(BaseModel):
+class DbtMetaLooker(DeferredBaseModel):
     """Looker metadata for a model."""
 
     # Component fields
@@ -0,0 +1,128 @@
+"""Manifest of the LookML files dbt2lookml owns in an output directory."""
+
+import json
+import logging
+import os
+from typing import Dict, Iterable, List, Optional, Set
+
+from dbt2lookml.exceptions import CliError
+from dbt2lookml.utils import FileHandler
+
+# Sidecar file in the output directory
+OUTPUT_MANIFEST_FILE = '.dbt2lookml_manifest.json'
+
+
+class OutputManifest:
+    """Files written to an output directory, keyed by the dbt unique_id they were generated from.
+
+    The manifest of the previous run is diffed with the files written in this
+    run to find orphaned files, so the output directory (usually a whole Looker
+    repository) is never scanned. A previous file is stale when its model was
+    written to another path this run (renamed model or view), or when its model
+    no longer exists in the dbt project. Models skipped by filters or that failed
+    to generate keep their files. Stale files that are only reported, not removed,
+    stay in the manifest until they are.
+    """
+
+    def __init__(self, output_dir: str, file_handler: Optional[FileHandler] = None):
+        """Load the manifest of the previous run, if any.
+
+        Args:
+            output_dir: Output directory the manifest lives in and paths are relative to
+            file_handler: Handler writing the manifest, a FileHandler if None
+        """
+        self._output_dir = output_dir
+        self._file_handler = file_handler or FileHandler()
+        self._path = os.path.join(output_dir, OUTPUT_MANIFEST_FILE)
+        self._previous: Dict[str, str] = {}
+        self._previous_stale: Set[str] = set()
+        self._current: Dict[str, str] = {}
+        try:
+            with open(self._path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            files = manifest.get('files', {})
+            if isinstance(files, dict):
+                self._previous = {unique_id: path for unique_id, path in files.items() if isinstance(path, str)}
+            self._previous_stale = {path for path in manifest.get('stale', []) if isinstance(path, str)}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError) as e:
+            logging.warning(f"Ignoring unreadable output manifest {self._path}: {str(e)}")
+
+    def record(self, unique_id: str, file_path: str) -> None:
+        """Record a file written in this run.
+
+        Args:
+            unique_id: Unique id of the dbt model the file was generated from
+            file_path: Path of the file relative to the output directory
+        """
+        self._current[unique_id] = os.path.normpath(file_path)
+
+    def stale_files(self, known_unique_ids: Optional[Set[str]] = None) -> List[str]:
+        """Get the files of the previous run that are no longer owned by any model.
+
+        Args:
+            known_unique_ids: Unique ids of all nodes in the dbt project, or None if
+                unknown, in which case only files of models written elsewhere are stale
+
+        Returns:
+            Sorted paths relative to the output directory
+        """
+        owned = set(self._current.values()) | set(self._carried_over(known_unique_ids).values())
+        return sorted({path for path in self._previous.values() if path not in owned} | (self._previous_stale - owned))
+
+    def _carried_over(self, known_unique_ids: Optional[Set[str]]) -> Dict[str, str]:
+        """Get the previous entries of models not written this run that still exist."""
+        return {
+            unique_id: path
+            for unique_id, path in self._previous.items()
+            if unique_id not in self._current and (known_unique_ids is None or unique_id in known_unique_ids)
+        }
+
+    def remove_files(self, file_paths: List[str]) -> List[str]:
+        """Delete files from the output directory.
+
+        Paths come from a manifest that may have been edited by hand, so files
+        that would resolve outside of the output directory are never removed.
+
+        Args:
+            file_paths: Paths relative to the output directory
+
+        Returns:
+            Paths that were removed or were already gone
+        """
+        output_dir = os.path.realpath(self._output_dir)
+        removed = []
+        for file_path in file_paths:
+            full_path = os.path.realpath(os.path.join(output_dir, file_path))
+            try:
+                inside = os.path.commonpath([output_dir, full_path]) == output_dir and full_path != output_dir
+            except ValueError:
+                # On another drive
+                inside = False
+            if not inside:
+                logging.warning(f"Not removing stale file {file_path}: it is outside of the output directory")
+                continue
+            try:
+                os.remove(full_path)
+                removed.append(file_path)
+            except FileNotFoundError:
+                removed.append(file_path)
+            except OSError as e:
+                logging.warning(f"Failed to remove stale file {file_path}: {str(e)}")
+        return removed
+
+    def save(self, known_unique_ids: Optional[Set[str]] = None, stale_files: Iterable[str] = ()) -> None:
+        """Write the files owned after this run.
+
+        Args:
+            known_unique_ids: Unique ids of all nodes in the dbt project, or None if unknown
+            stale_files: Stale files left in place, to report again on the next run
+        """
+        files = {**self._carried_over(known_unique_ids), **self._current}
+        try:
+            self._file_handler.write(
+                self._path, json.dumps({'files': dict(sorted(files.items())), 'stale': sorted(stale_files)}, indent=2)
+            )
+        except CliError as e:
+            logging.warning(f"Failed to write output manifest {self._path}: {str(e)}")
@@ -0,0 +1,396 @@
+"""Parallel rendering of models in a pool of worker processes or threads."""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import logging.handlers
+import multiprocessing
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from dbt2lookml.exceptions import ModelTimeoutError
+
+if TYPE_CHECKING:
+    from dbt2lookml.models.dbt import DbtModel
+
+# Memory of a worker process with dbt2lookml imported, before rendering anything
+WORKER_BASE_MEMORY = 40 * 1024 * 1024
+# Peak transient memory of rendering a model per unit of estimated cost (scheduling.estimate_cost),
+# measured at 0.6-4 KB on synthetic models from 30 flat to 4,000 nested columns
+MEMORY_PER_COST_UNIT = 4 * 1024
+# Seconds between checks for models worker processes started, while some are waiting to start
+START_POLL_INTERVAL = 0.05
+
+BACKENDS = ('processes', 'threads')
+
+Rendered = Tuple[str, Dict[str, Any], str]
+
+# State of a worker process or thread: the fragment cache shared by the models it renders.
+# FragmentCache is not thread-safe, so every worker thread keeps its own
+_worker_state = threading.local()
+# Queue of a worker process, telling the pool which of its tasks started; set with a time budget
+_started_tasks = None
+
+
+def _render_in_worker(args, model: DbtModel) -> Rendered:
+    """Render a model in a worker process or thread, see Cli._render_model."""
+    from dbt2lookml.cli import Cli
+    from dbt2lookml.generators.fragment_cache import FragmentCache
+
+    fragment_cache = getattr(_worker_state, 'fragment_cache', None)
+    if fragment_cache is None:
+        fragment_cache = _worker_state.fragment_cache = FragmentCache()
+    return Cli._render_model(args, model, fragment_cache)
+
+
+def _start_and_render(task: int, render: Callable[[Any, DbtModel], Rendered], args, model: DbtModel) -> Rendered:
+    """Tell the pool that a worker process started a task, then render its model."""
+    if _started_tasks is not None:
+        _started_tasks.put(task)
+    return render(args, model)
+
+
+def _init_worker(log_queue, level: int, started_tasks) -> None:
+    """Send the logging of a worker process to the process that started it, and set up start notices."""
+    global _started_tasks
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+    _started_tasks = started_tasks
+
+
+class _ForwardedRecordHandler(logging.Handler):
+    """Handle the records of worker processes with the logging of this process, e.g. the CLI's log format."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        logging.getLogger(record.name).handle(record)
+
+
+class _DaemonThreadExecutor(Executor):
+    """Worker threads the interpreter does not wait for at exit, unlike those of ThreadPoolExecutor.
+
+    Used for renders with a time budget: a timed out model cannot be stopped,
+    and must not keep the process from exiting once the others are written.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._tasks: queue.SimpleQueue = queue.SimpleQueue()
+        self._shutdown = False
+        self._threads = [
+            threading.Thread(target=self._work, name=f'{thread_name_prefix}_{i}', daemon=True) for i in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self) -> None:
+        while (task := self._tasks.get()) is not None:
+            future, fn, args, kwargs = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        if self._shutdown:
+            raise RuntimeError('cannot schedule new futures after shutdown')
+        future: Future = Future()
+        self._tasks.put((future, fn, args, kwargs))
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        self._shutdown = True
+        if cancel_futures:
+            while True:
+                try:
+                    task = self._tasks.get_nowait()
+                except queue.Empty:
+                    break
+                task[0].cancel()
+        # A thread stuck on a model takes its sentinel when the model finishes, if the process still runs
+        for _ in self._threads:
+            self._tasks.put(None)
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+
+def estimated_memory(cost: int) -> int:
+    """Estimate the peak memory in bytes of rendering a model of a given cost."""
+    return cost * MEMORY_PER_COST_UNIT
+
+
+class GenerationPool:
+    """Render models in worker processes or threads, most expensive first, within a memory ceiling.
+
+    Models are submitted in the order they come in (the schedule order) while
+    the estimated memory of the models being rendered stays below the ceiling.
+    A model that does not fit is held back, and smaller models a few places
+    behind it may go first, until enough running models finish; a model is
+    always admitted when nothing else is running. Workers are replaced after a
+    number of tasks, returning the memory fragmented by large renders.
+
+    A model still rendering when its time budget runs out is given up on. The
+    budget starts when a worker starts the model, so spawning workers does not
+    count. A running task cannot be cancelled, and a pool of processes cannot
+    lose one of them, so all workers are terminated: the other models they were
+    rendering start over in a new pool, with a new budget.
+
+    With the threads backend, meant for free-threaded Python builds, workers
+    share the parsed artifacts instead of receiving pickled models, and are not
+    replaced. A thread cannot be terminated, so a timed out model is reported
+    and left to finish in the background while the others go on in new threads.
+    Timed renders run on daemon threads: the process exits without waiting for
+    a model still rendering in the background.
+    """
+
+    def __init__(
+        self,
+        args,
+        workers: int,
+        cost: Callable[[DbtModel], int],
+        max_tasks_per_worker: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None,
+        model_timeout: Optional[float] = None,
+        backend: str = 'processes',
+    ):
+        """Configure the pool, started by render.
+
+        Args:
+            args: Parsed arguments, sent to the workers
+            workers: Number of worker processes or threads
+            cost: Estimated cost of a model, e.g. Schedule.cost
+            max_tasks_per_worker: Models a worker renders before it is replaced, None for no limit
+            memory_limit_mb: Ceiling for the memory of all workers in MB, None for no limit
+            model_timeout: Seconds a model may render from when a worker starts it, None for no limit
+            backend: 'processes' or 'threads', see BACKENDS
+        """
+        self._args = args
+        self._workers = workers
+        self._cost = cost
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend {backend}, expected one of {', '.join(BACKENDS)}")
+        self._threads = backend == 'threads'
+        # Threads share one process and its memory, so there is nothing to return by replacing them
+        self._max_tasks_per_worker = (max_tasks_per_worker or None) if not self._threads else None
+        self._model_timeout = model_timeout or None
+        self._memory_budget = None
+        if memory_limit_mb:
+            processes = 1 if self._threads else workers
+            self._memory_budget = memory_limit_mb * 1024 * 1024 - processes * WORKER_BASE_MEMORY
+            if self._memory_budget <= 0:
+                logging.warning(
+                    f'Memory limit of {memory_limit_mb} MB does not cover {workers} idle workers, rendering one model at a time'
+                )
+        # Models held back at least once because they would have exceeded the memory ceiling
+        self.held_back = 0
+        # Forwards the records logged by the worker processes of the current executor
+        self._log_forwarder: Optional[logging.handlers.QueueListener] = None
+        # Tasks started by the worker processes of the current executor, with a time budget
+        self._started_tasks: Any = None
+        self._submitted = 0
+
+    def _start_executor(self) -> Executor:
+        self._started_tasks = None
+        if self._threads:
+            if self._model_timeout:
+                return _DaemonThreadExecutor(self._workers, thread_name_prefix='dbt2lookml-worker')
+            return ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix='dbt2lookml-worker')
+        # Fresh interpreters, so workers do not inherit the parsed artifacts of the parent
+        context = multiprocessing.get_context('spawn')
+        # Nor its logging: their records are sent back, at the level of this process.
+        # A queue per executor, as terminating workers may leave the queue they were writing to unusable
+        log_queue = context.Queue()
+        self._log_forwarder = logging.handlers.QueueListener(log_queue, _ForwardedRecordHandler())
+        self._log_forwarder.start()
+        # The time budget of a model starts when a worker starts it, not while the workers spawn and import
+        self._started_tasks = context.SimpleQueue() if self._model_timeout else None
+        kwargs: Dict[str, Any] = {
+            'max_workers': self._workers,
+            'mp_context': context,
+            'initializer': _init_worker,
+            'initargs': (log_queue, logging.getLogger().getEffectiveLevel(), self._started_tasks),
+        }
+        if self._max_tasks_per_worker and sys.version_info >= (3, 11):
+            kwargs['max_tasks_per_child'] = self._max_tasks_per_worker
+        self._submitted = 0
+        return ProcessPoolExecutor(**kwargs)
+
+    @staticmethod
+    def _terminate_executor(executor: Executor) -> None:
+        """Stop a pool without waiting for the models it is rendering."""
+        # ProcessPoolExecutor cannot cancel running tasks, so its worker processes are terminated;
+        # worker threads cannot be stopped and finish their model unobserved
+        for process in list((getattr(executor, '_processes', None) or {}).values()):
+            if process.is_alive():
+                process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def _stop_log_forwarding(self, drain: bool) -> None:
+        """Stop forwarding the records of the workers of the current executor.
+
+        Args:
+            drain: Whether the workers exited and their remaining records are forwarded first. Otherwise
+                the forwarding thread is left alone, forwarding what terminated workers managed to send
+        """
+        if self._log_forwarder is not None and drain:
+            self._log_forwarder.stop()
+        self._log_forwarder = None
+
+    def _recycle_due(self) -> bool:
+        """Whether workers must be replaced before the next model, on Python versions without max_tasks_per_child."""
+        return (
+            self._max_tasks_per_worker is not None
+            and sys.version_info < (3, 11)
+            and self._submitted >= self._max_tasks_per_worker * self._workers
+        )
+
+    def _admissible(self, model: DbtModel, in_flight: int, running: int) -> bool:
+        if running == 0 or self._memory_budget is None:
+            return True
+        return in_flight + estimated_memory(self._cost(model)) <= self._memory_budget
+
+    def render(self, models: Iterable[DbtModel]) -> Iterator[Tuple[DbtModel, Union[Rendered, BaseException]]]:
+        """Render models in the worker processes or threads.
+
+        Args:
+            models: Models updated with catalog info, e.g. from DbtParser.iter_models
+
+        Yields:
+            Each model, in the order they finish, with the result of Cli._render_model
+            or the exception it raised
+        """
+        models = iter(models)
+        # Models taken from the iterator: enough to find smaller ones behind a held back model,
+        # few enough not to hold many models updated with catalog info in memory
+        lookahead = 2 * self._workers
+        pending: Deque[DbtModel] = deque()
+        running: Dict[Future, Tuple[DbtModel, int, Executor, float]] = {}
+        held_back = set()
+        in_flight = 0
+        # Running models a worker process has not started yet, by task
+        tasks = itertools.count()
+        waiting_to_start: Dict[int, Future] = {}
+
+        def submit(model: DbtModel, memory: int) -> None:
+            if self._started_tasks is None:
+                # Worker threads start a model as soon as it is submitted, as no more are submitted than threads run
+                deadline = time.monotonic() + self._model_timeout if self._model_timeout else float('inf')
+                future = executor.submit(_render_in_worker, self._args, model)
+            else:
+                task = next(tasks)
+                deadline = float('inf')
+                future = executor.submit(_start_and_render, task, _render_in_worker, self._args, model)
+                waiting_to_start[task] = future
+            running[future] = (model, memory, executor, deadline)
+            self._submitted += 1
+
+        def start_clocks() -> None:
+            if self._started_tasks is None or self._model_timeout is None:
+                return
+            while not self._started_tasks.empty():
+                future = waiting_to_start.pop(self._started_tasks.get(), None)
+                if future in running:
+                    model, memory, model_executor, _ = running[future]
+                    running[future] = (model, memory, model_executor, time.monotonic() + self._model_timeout)
+
+        def replace_executor() -> Executor:
+            # Models of the previous workers that did not start will not start there
+            waiting_to_start.clear()
+            return self._start_executor()
+
+        executor = self._start_executor()
+        try:
+            while True:
+                if not running and self._recycle_due():
+                    executor.shutdown()
+                    self._stop_log_forwarding(drain=True)
+                    executor = replace_executor()
+
+                while len(running) < self._workers and not self._recycle_due():
+                    while len(pending) < lookahead and (model := next(models, None)) is not None:
+                        pending.append(model)
+                    if not pending:
+                        break
+                    model = None
+                    for candidate in pending:
+                        if self._admissible(candidate, in_flight, len(running)):
+                            model = candidate
+                            break
+                        if candidate.unique_id not in held_back:
+                            held_back.add(candidate.unique_id)
+                            logging.debug('Holding back %s above the memory limit until running models finish', candidate.name)
+                    if model is None:
+                        break
+                    pending.remove(model)
+                    memory = estimated_memory(self._cost(model))
+                    submit(model, memory)
+                    in_flight += memory
+
+                # With nothing running, a model is always admitted, so nothing is left pending either
+                if not running:
+                    break
+                next_deadline = min(deadline for _, _, _, deadline in running.values())
+                timeout = max(0.0, next_deadline - time.monotonic()) if next_deadline != float('inf') else None
+                if waiting_to_start:
+                    timeout = min(timeout, START_POLL_INTERVAL) if timeout is not None else START_POLL_INTERVAL
+                done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+                start_clocks()
+                for future in done:
+                    model, memory, model_executor, _ = running.pop(future)
+                    in_flight -= memory
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool as e:
+                        # A worker died, e.g. killed for running out of memory: the models it was running
+                        # fail and the others go on in a new pool
+                        if model_executor is executor:
+                            executor.shutdown(wait=False)
+                            self._stop_log_forwarding(drain=False)
+                            executor = replace_executor()
+                        result = e
+                    except Exception as e:
+                        result = e
+                    yield model, result
+
+                now = time.monotonic()
+                timed_out = [future for future, (_, _, _, deadline) in running.items() if deadline <= now]
+                if timed_out:
+                    self._terminate_executor(executor)
+                    self._stop_log_forwarding(drain=False)
+                    executor = replace_executor()
+                    interrupted = []
+                    for future in timed_out if self._threads else list(running):
+                        model, memory, _, deadline = running.pop(future)
+                        if future in timed_out:
+                            in_flight -= memory
+                            yield model, ModelTimeoutError(
+                                f"Generation of model {model.name} exceeded the time budget of {self._model_timeout:g}s"
+                            )
+                        else:
+                            # Worker threads were not stopped, so only the models of terminated processes restart
+                            interrupted.append((model, memory))
+                    for model, memory in interrupted:
+                        logging.debug('Restarting %s after terminating the workers of a timed out model', model.name)
+                        submit(model, memory)
+        finally:
+            self.held_back = len(held_back)
+            if running:
+                # Left early, e.g. on an error without --continue-on-error: never wait on a stuck model
+                self._terminate_executor(executor)
+                self._stop_log_forwarding(drain=False)
+            else:
+                executor.shutdown(wait=True, cancel_futures=True)
+                self._stop_log_forwarding(drain=True)
@@ -1,12 +1,17 @@
 """Base DBT parser functionality."""
 
-from typing import Dict, List
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
 
-from dbt2lookml.models.dbt import DbtCatalog, DbtManifest, DbtModel
+from dbt2lookml.models.dbt import DbtCatalog, DbtManifest, DbtModel, DbtModelColumn
 from dbt2lookml.parsers.catalog import CatalogParser
+from dbt2lookml.parsers.catalog_index import CatalogIndex
 from dbt2lookml.parsers.exposure import ExposureParser
 from dbt2lookml.parsers.model import ModelParser
 
+# Tables generators cache on a model, built from its columns, see get_column_records and get_sql_reference_resolver
+GENERATOR_CACHES = ('_column_records', '_sql_reference_resolver')
+
 
 class DbtParser:
     """Main DBT parser that coordinates parsing of manifest and catalog files."""
@@ -14,15 +19,45 @@ class DbtParser:
     def __init__(self, cli_args, raw_manifest: Dict, raw_catalog: Dict):
         """Initialize the parser with raw manifest and catalog data."""
         self._cli_args = cli_args
-        self._raw_manifest = raw_manifest  # Store raw manifest for metadata extraction
         self._catalog = DbtCatalog(**raw_catalog)
         self._manifest = DbtManifest(**raw_manifest)
         self._model_parser = ModelParser(self._manifest)
-        self._catalog_parser = CatalogParser(self._catalog, raw_catalog)
+        self._catalog_parser = CatalogParser(self._catalog)
+        # Generators look up raw catalog columns in the raw catalog, or in a memory-mapped index of it
+        # once models are sent to worker processes, see index_catalog
+        self._raw_catalog: Optional[Dict] = raw_catalog
+        self._catalog_index: Optional[CatalogIndex] = None
+        # Manifest columns of the models yielded by iter_models and not released yet, by unique_id
+        self._manifest_columns: Dict[str, Dict[str, DbtModelColumn]] = {}
         self._exposure_parser = ExposureParser(self._manifest)
 
+    def index_catalog(self) -> None:
+        """Look up raw catalog columns through a memory-mapped index from now on.
+
+        Models yielded afterwards pickle the path of the index instead of a copy of
+        the raw catalog, so call this before sending models to worker processes.
+        The raw catalog is released.
+        """
+        if self._catalog_index is None:
+            self._catalog_index = CatalogIndex.build(self._raw_catalog or {})
+            self._raw_catalog = None
+
+    def close(self) -> None:
+        """Release the catalog index, if any; models already yielded can no longer look up catalog columns."""
+        if self._catalog_index is not None:
+            self._catalog_index.close()
+        self._raw_catalog = None
+
+    @property
+    def _catalog_data(self) -> Optional[Mapping[str, Any]]:
+        return self._catalog_index if self._catalog_index is not None else self._raw_catalog
+
     def get_models(self) -> List[DbtModel]:
         """Parse dbt models from manifest and filter by criteria."""
+        return list(self.iter_models(self.select_models()))
+
+    def select_models(self) -> List[DbtModel]:
+        """Get the models matching the filter criteria, not yet updated with catalog info."""
         # Get all models
         all_models = self._model_parser.get_all_models()
         # Get exposed models if needed
@@ -35,7 +70,7 @@ class DbtParser:
         ):
             exposed_names = self._exposure_parser.get_exposures(self._cli_args.exposures_tag)
         # Filter models based on criteria
-        filtered_models = self._model_parser.filter_models(
+        return self._model_parser.filter_models(
             all_models,
             select_model=self._cli_args.select if hasattr(self._cli_args, 'select') else None,
             tag=self._cli_args.tag if hasattr(self._cli_args, 'tag') else None,
@@ -43,28 +78,58 @@ class DbtParser:
             include_models=getattr(self._cli_args, 'include_models', None),
             exclude_models=getattr(self._cli_args, 'exclude_models', None),
         )
-        # Process models (update with catalog info)
-        processed_models = []
+
+    def iter_models(self, models: Iterable[DbtModel]) -> Iterator[DbtModel]:
+        """Update selected models with catalog info one at a time.
+
+        Models are updated in place rather than copied. Once a model's view is written,
+        pass it to release, which drops the columns created from the catalog, so memory
+        does not grow with the number of models.
+
+        Args:
+            models: Models from select_models
+
+        Yields:
+            Models updated with catalog info
+        """
         failed_models = []
-        for model in filtered_models:
+        for model in models:
+            manifest_columns = model.columns
             if processed_model := self._catalog_parser.process_model_columns(model):
-                # Store catalog data reference for generators
-                processed_model._catalog_data = self._catalog_parser._raw_catalog_data
-                # Store original raw manifest data for metadata extraction
-                # Use the raw manifest dict passed to constructor, not the parsed Pydantic model
-                raw_nodes = self._raw_manifest.get('nodes', {})
-                if model.unique_id in raw_nodes:
-                    processed_model._manifest_data = raw_nodes[model.unique_id]
-                processed_models.append(processed_model)
+                # Store raw catalog reference for generators
+                processed_model._catalog_data = self._catalog_data
+                self._manifest_columns[model.unique_id] = manifest_columns
+                yield processed_model
             else:
                 failed_models.append(model.name)
 
         # Log any models that failed processing
         if failed_models:
-            import logging
-
             logging.warning(
                 f"Failed to process {len(failed_models)} models during catalog parsing: {', '.join(failed_models[:5])}{'...' if len(failed_models) > 5 else ''}"
             )
 
-        return processed_models
+    def release(self, model: DbtModel) -> None:
+        """Give a model yielded by iter_models its manifest columns back, releasing the ones created from the catalog.
+
+        The tables generators cached on the model are dropped along with them. The
+        model can be updated with catalog info again, e.g. to generate it once more.
+
+        Args:
+            model: A model yielded by iter_models, whose view is no longer being generated
+        """
+        manifest_columns = self._manifest_columns.pop(model.unique_id, None)
+        if manifest_columns is not None:
+            model.columns = manifest_columns
+        for name in GENERATOR_CACHES:
+            if getattr(model, name, None) is not None:
+                setattr(model, name, None)
+
+    def column_types(self, model: DbtModel) -> Dict[str, Optional[str]]:
+        """Get the data type of every column a model will have once updated with catalog info, without updating it."""
+        column_types = {name: column.data_type for name, column in model.columns.items()}
+        catalog_node = self._catalog.nodes.get(model.unique_id)
+        if catalog_node is not None:
+            for name, catalog_column in catalog_node.columns.items():
+                column_types[name] = catalog_column.data_type or column_types.get(name)
+        return column_types
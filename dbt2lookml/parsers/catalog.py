@@ -2,7 +2,7 @@
 
 from typing import List, Optional, Tuple
 
-from dbt2lookml.models.dbt import DbtCatalog, DbtModel, DbtModelColumn, DbtModelColumnMeta
+from dbt2lookml.models.dbt import DbtCatalog, DbtCatalogNodeColumn, DbtModel, DbtModelColumn
 
 
 class CatalogParser:
@@ -14,146 +14,68 @@ class CatalogParser:
         self._raw_catalog_data = raw_catalog_data
 
     def process_model_columns(self, model: DbtModel) -> Optional[DbtModel]:
-        """Process a model by updating its columns with catalog information."""
-        processed_columns = {}
-        # First, find the original case mapping from raw catalog data
-        original_case_mapping = {}
-        if self._raw_catalog_data and model.unique_id in self._raw_catalog_data.get('nodes', {}):
-            raw_catalog_node = self._raw_catalog_data['nodes'][model.unique_id]
-            for catalog_col_name in raw_catalog_node.get('columns', {}).keys():
-                original_case_mapping[catalog_col_name.lower()] = catalog_col_name
-        elif model.unique_id in self._catalog.nodes:
-            # Fallback to processed catalog if raw data not available
-            catalog_node = self._catalog.nodes[model.unique_id]
-            for catalog_col_name in catalog_node.columns.keys():
-                original_case_mapping[catalog_col_name.lower()] = catalog_col_name
+        """Process a model by updating its columns with catalog information.
+
+        Catalog types and original-case names are applied to the existing columns in place,
+        and columns that only exist in the catalog are created once each. The model is
+        updated rather than copied.
+        """
+        catalog_node = self._catalog.nodes.get(model.unique_id)
+        if catalog_node is None:
+            return model
 
-        # Process existing columns and preserve original case
+        catalog_columns = catalog_node.columns
+        processed_columns = {}
+        # Update existing columns with catalog types and preserve the original case
         for column_name, column in model.columns.items():
-            processed_column = self._update_column_with_inner_types(column, model.unique_id)
-            if processed_column:
-                # Update original_name if we have the proper case from catalog
-                if column_name in original_case_mapping:
-                    processed_column.original_name = original_case_mapping[column_name]
-                processed_columns[column_name] = processed_column
-            else:
-                # Update original_name for existing column if we have proper case
-                if column_name in original_case_mapping:
-                    # Create new column with updated original_name
-                    updated_column = column.model_copy(update={'original_name': original_case_mapping[column_name]})
-                    processed_columns[column_name] = updated_column
-                else:
-                    processed_columns[column_name] = column
-        # Create missing array and nested struct columns using raw catalog data
-        if self._raw_catalog_data and model.unique_id in self._raw_catalog_data.get('nodes', {}):
-            raw_catalog_node = self._raw_catalog_data['nodes'][model.unique_id]
-            for column_name, column_data in raw_catalog_node.get('columns', {}).items():
-                # Check both original case and lowercase for existing columns
-                if column_name.lower() not in processed_columns and column_data.get('type') is not None:
-                    # Add missing array columns
-                    if 'ARRAY' in f'{column_data.get("type", "")}':
-                        array_column = self._create_missing_array_column(
-                            column_name.lower(), column_data.get('type'), column_data.get('inner_types', []), column_name
-                        )
-                        processed_columns[column_name.lower()] = array_column
-                    # Add nested struct fields (columns with dots in name)
-                    elif '.' in column_name:
-                        # Store with lowercase key but preserve original case in original_name
-                        nested_column = self._create_missing_nested_column(
-                            column_name.lower(), column_data.get('type'), column_data.get('comment'), column_name
-                        )
-                        # Ensure original_name preserves the exact case from catalog
-                        nested_column.original_name = column_name
-                        processed_columns[column_name.lower()] = nested_column
-                    # Add simple columns that exist in catalog but not in manifest
-                    else:
-                        simple_column = self._create_missing_nested_column(
-                            column_name.lower(), column_data.get('type'), column_data.get('comment'), column_name
-                        )
-                        simple_column.original_name = column_name
-                        processed_columns[column_name.lower()] = simple_column
-        elif model.unique_id in self._catalog.nodes:
-            # Fallback to processed catalog if raw data not available
-            catalog_node = self._catalog.nodes[model.unique_id]
-            for column_name, column in catalog_node.columns.items():
-                # Check both original case and lowercase for existing columns
-                if (
-                    column_name not in processed_columns
-                    and column_name.lower() not in processed_columns
-                    and column.data_type is not None
-                ):
-                    # Add missing array columns
-                    if 'ARRAY' in f'{column.data_type}':
-                        processed_columns[column_name] = self._create_missing_array_column(
-                            column_name, column.data_type, column.inner_types or [], column_name
-                        )
-                    # Add nested struct fields (columns with dots in name)
-                    elif '.' in column_name:
-                        # Store with lowercase key but preserve original case in original_name
-                        nested_column = self._create_missing_nested_column(
-                            column_name.lower(), column.data_type, column.comment, column_name
-                        )
-                        # Ensure original_name preserves the exact case from catalog
-                        nested_column.original_name = column_name
-                        processed_columns[column_name.lower()] = nested_column
-                    # Add simple columns that exist in catalog but not in manifest
-                    else:
-                        simple_column = self._create_missing_simple_column(
-                            column_name.lower(), column.data_type, column.comment, column_name
-                        )
-                        processed_columns[column_name.lower()] = simple_column
-        # Always return the model, even if no columns were processed
-        return model.model_copy(update={'columns': processed_columns}) if processed_columns else model
+            self._update_column_with_inner_types(column, model.unique_id)
+            catalog_column = catalog_columns.get(column_name)
+            if catalog_column is not None and catalog_column.original_name:
+                column.set_original_name(catalog_column.original_name)
+            processed_columns[column_name] = column
+
+        # Create missing array, nested struct and simple columns from the catalog
+        for column_name, catalog_column in catalog_columns.items():
+            if column_name not in processed_columns:
+                processed_columns[column_name] = self._create_missing_column(column_name, catalog_column)
+
+        model.columns = processed_columns
+        return model
+
+    def _create_missing_column(self, column_name: str, catalog_column: DbtCatalogNodeColumn) -> DbtModelColumn:
+        """Create a column for a catalog column that is missing from the manifest."""
+        original_name = catalog_column.original_name or column_name
+        if 'ARRAY' in catalog_column.type:
+            return self._create_missing_array_column(
+                column_name, catalog_column.type, catalog_column.inner_types or [], original_name
+            )
+        # Nested struct fields (dotted names) and simple columns are created the same way
+        return self._create_missing_nested_column(column_name, catalog_column.type, catalog_column.comment, original_name)
 
     def _create_missing_array_column(
         self, column_name: str, data_type: str, inner_types: List[str], original_column_name: str = None
     ) -> DbtModelColumn:
         """Create a new column model for array columns missing from manifest."""
-        from dbt2lookml.utils import camel_to_snake
-
-        original_name = original_column_name or column_name
         return DbtModelColumn(
             name=column_name,
             data_type=data_type,
             inner_types=inner_types,
             description=None,
-            meta=DbtModelColumnMeta(),
-            lookml_name=camel_to_snake(original_name.split('.')[-1]),
-            original_name=original_name,
+            original_name=original_column_name or column_name,
         )
 
     def _create_missing_nested_column(
         self, column_name: str, data_type: str, comment: str, original_column_name: str = None
     ) -> DbtModelColumn:
         """Create a new column model for nested struct fields missing from manifest."""
-        from dbt2lookml.utils import camel_to_snake
-
         return DbtModelColumn(
             name=column_name,
             data_type=data_type,
             inner_types=[],
             description=comment,
-            meta=DbtModelColumnMeta(),
-            lookml_name=camel_to_snake(column_name.split('.')[-1]),
             original_name=original_column_name or column_name,
         )
 
-    def _create_missing_simple_column(
-        self, column_name: str, data_type: str, comment: str, original_column_name: str
-    ) -> DbtModelColumn:
-        """Create a new column model for simple fields missing from manifest."""
-        from dbt2lookml.utils import camel_to_snake
-
-        return DbtModelColumn(
-            name=column_name,
-            data_type=data_type,
-            inner_types=[],
-            description=comment,
-            meta=DbtModelColumnMeta(),
-            lookml_name=camel_to_snake(original_column_name),
-            original_name=original_column_name,
-        )
-
     def _get_catalog_column_info(self, model_id: str, column_name: str) -> Tuple[Optional[str], List[str]]:
         """Get column type information from catalog."""
         if model_id not in self._catalog.nodes:
@@ -0,0 +1,178 @@
+"""Read-only, memory-mapped index of the raw dbt catalog."""
+
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional
+
+# File layout: magic, length of the offset table, the offset table as JSON
+# ({unique_id: [offset, length]}, offsets relative to the end of the table), then one
+# JSON blob per catalog node
+_MAGIC = b'DBT2LOOKML-CATALOG-1\n'
+_TABLE_LENGTH = struct.Struct('<Q')
+# Decoded nodes kept per process; models are generated one at a time per worker, so a few suffice
+_DECODED_NODES = 8
+
+# Indexes attached in this process by path, so the models of one run share one mapping
+_attached: 'weakref.WeakValueDictionary[str, CatalogIndex]' = weakref.WeakValueDictionary()
+# Indexes attached to files built by another process, kept for the life of this one: a worker
+# unpickles every model it renders on its own, which would map the file and parse its offset table again
+_kept: Dict[str, 'CatalogIndex'] = {}
+
+
+class _CatalogNodes(Mapping):
+    """The 'nodes' of a catalog index, decoded on lookup."""
+
+    def __init__(self, index: 'CatalogIndex'):
+        self._index = index
+
+    def __getitem__(self, unique_id: str) -> Dict[str, Any]:
+        node = self._index.node(unique_id)
+        if node is None:
+            raise KeyError(unique_id)
+        return node
+
+    def __contains__(self, unique_id: object) -> bool:
+        return unique_id in self._index._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index._offsets)
+
+    def __len__(self) -> int:
+        return len(self._index._offsets)
+
+
+class CatalogIndex(Mapping):
+    """The raw catalog, serialized once into a read-only memory-mapped file.
+
+    Generators read it like the raw catalog dict (``catalog['nodes'][unique_id]``),
+    but every node is stored as its own JSON blob and only decoded when looked up.
+    Pickling an index only pickles the path of its file, so worker processes attach
+    to the same pages instead of each receiving a copy of the catalog with every
+    model. The file is removed when the index that built it is closed or collected.
+    """
+
+    def __init__(self, path: str, owner: bool = False):
+        """Attach to the file of a catalog index.
+
+        Args:
+            path: Path of a file written by build
+            owner: Whether to remove the file when this index is closed
+
+        Raises:
+            ValueError: If the file is not a catalog index
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[: len(_MAGIC)] != _MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{path} is not a catalog index")
+        table_start = len(_MAGIC) + _TABLE_LENGTH.size
+        (table_length,) = _TABLE_LENGTH.unpack_from(self._mmap, len(_MAGIC))
+        self._offsets: Dict[str, list] = json.loads(self._mmap[table_start : table_start + table_length])
+        self._data_start = table_start + table_length
+        self._decoded: OrderedDict = OrderedDict()
+        # Worker threads of --backend threads share the index and its decoded nodes
+        self._decoded_lock = threading.Lock()
+        self._nodes = _CatalogNodes(self)
+        self._finalizer = weakref.finalize(self, CatalogIndex._release, self._mmap, path if owner else None)
+
+    @staticmethod
+    def _release(mapping: mmap.mmap, path: Optional[str]) -> None:
+        mapping.close()
+        if path is not None:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    @classmethod
+    def build(cls, raw_catalog: Dict[str, Any], directory: Optional[str] = None) -> 'CatalogIndex':
+        """Serialize the nodes of a raw catalog into a new index file.
+
+        Args:
+            raw_catalog: The catalog as read from catalog.json
+            directory: Directory of the index file, the temporary directory by default
+
+        Returns:
+            The index, owning its file
+        """
+        nodes = raw_catalog.get('nodes') if isinstance(raw_catalog, dict) else None
+        offsets = {}
+        blobs = []
+        position = 0
+        for unique_id, node in (nodes or {}).items():
+            blob = json.dumps(node, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            offsets[unique_id] = [position, len(blob)]
+            blobs.append(blob)
+            position += len(blob)
+        table = json.dumps(offsets, separators=(',', ':')).encode('utf-8')
+
+        fd, path = tempfile.mkstemp(prefix='dbt2lookml-catalog-', suffix='.idx', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(_MAGIC)
+                f.write(_TABLE_LENGTH.pack(len(table)))
+                f.write(table)
+                f.writelines(blobs)
+            index = cls(path, owner=True)
+        except BaseException:
+            os.remove(path)
+            raise
+        _attached[path] = index
+        return index
+
+    @classmethod
+    def attach(cls, path: str) -> 'CatalogIndex':
+        """Get the index of a file, attaching to it once per process."""
+        index = _attached.get(path)
+        if index is None:
+            index = cls(path)
+            _attached[path] = _kept[path] = index
+        return index
+
+    def __reduce__(self):
+        return CatalogIndex.attach, (self.path,)
+
+    def node(self, unique_id: str) -> Optional[Dict[str, Any]]:
+        """Decode a catalog node, or None if the catalog has no node with this id.
+
+        The decoded node is shared by later lookups and must not be modified.
+        """
+        with self._decoded_lock:
+            node = self._decoded.get(unique_id)
+            if node is not None:
+                self._decoded.move_to_end(unique_id)
+                return node
+        location = self._offsets.get(unique_id)
+        if location is None:
+            return None
+        start = self._data_start + location[0]
+        node = json.loads(self._mmap[start : start + location[1]])
+        with self._decoded_lock:
+            self._decoded[unique_id] = node
+            if len(self._decoded) > _DECODED_NODES:
+                self._decoded.popitem(last=False)
+        return node
+
+    def close(self) -> None:
+        """Unmap the file, and remove it if this index built it."""
+        self._finalizer()
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'nodes':
+            return self._nodes
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(('nodes',))
+
+    def __len__(self) -> int:
+        return 1
@@ -0,0 +1,105 @@
+"""Cost model and largest-first schedule of the models of a run."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional
+
+from dbt2lookml.sharding import stable_hash
+
+if TYPE_CHECKING:
+    from dbt2lookml.models.column_collections import ColumnCostStats
+    from dbt2lookml.models.dbt import DbtModel
+
+# Models listed in the log when a run starts
+LOGGED_MODELS = 5
+
+
+def estimate_cost(stats: ColumnCostStats) -> int:
+    """Estimate the generation cost of a model, in units of roughly 0.1 ms.
+
+    Calibrated on synthetic models: every column costs one unit, nested columns
+    about one more, growing with the nesting depth, and every array adds a nested
+    view and explore join whose cost grows with the columns they are split from.
+
+    Args:
+        stats: Column stats from ColumnCollections.cost_stats
+
+    Returns:
+        Estimated cost, at least 1
+    """
+    nested = stats.nested_columns * (10 + 3 * max(0, stats.max_depth - 1)) // 10
+    arrays = stats.arrays * (16 + stats.columns // 16)
+    return max(1, stats.columns + nested + arrays)
+
+
+class Schedule:
+    """Models ordered most expensive first, with the estimate behind each decision.
+
+    Generating the giant models first keeps them from landing last and dominating
+    the wall time of a run that is split across shards or workers.
+    """
+
+    def __init__(self, models: List[DbtModel], stats: Mapping[str, ColumnCostStats]):
+        """Order models by their estimated cost.
+
+        Args:
+            models: Models after filtering
+            stats: Column stats by unique_id of at least these models
+        """
+        self._stats: Dict[str, ColumnCostStats] = {model.unique_id: stats[model.unique_id] for model in models}
+        self._costs: Dict[str, int] = {unique_id: estimate_cost(model_stats) for unique_id, model_stats in self._stats.items()}
+        self.models: List[DbtModel] = sorted(
+            models, key=lambda model: (-self._costs[model.unique_id], stable_hash(model.unique_id))
+        )
+
+    def cost(self, model: DbtModel) -> int:
+        """Get the estimated cost of a scheduled model."""
+        return self._costs[model.unique_id]
+
+    def only(self, models: List[DbtModel]) -> 'Schedule':
+        """Narrow the schedule down to some of its models, e.g. those of a shard."""
+        return Schedule(models, self._stats)
+
+    def decisions(self) -> List[Dict[str, Any]]:
+        """Get the dispatch position and cost estimate of every model, for the run report."""
+        return [
+            {
+                'position': position,
+                'unique_id': model.unique_id,
+                'name': model.name,
+                'cost': self._costs[model.unique_id],
+                **self._stats[model.unique_id]._asdict(),
+            }
+            for position, model in enumerate(self.models, start=1)
+        ]
+
+    def log_decisions(self) -> None:
+        """Log the dispatch position, cost estimate and column stats of every model at debug level."""
+        if not logging.getLogger().isEnabledFor(logging.DEBUG):
+            return
+        for decision in self.decisions():
+            logging.debug(
+                'Schedule %(position)d: %(name)s, cost %(cost)d (%(columns)d columns, %(arrays)d arrays, '
+                '%(nested_columns)d nested columns, depth %(max_depth)d)',
+                decision,
+            )
+
+    def summary(self, limit: int = LOGGED_MODELS) -> str:
+        """Describe the first models of the schedule for the log."""
+        return ', '.join(f'{model.name} ({self._costs[model.unique_id]})' for model in self.models[:limit])
+
+
+def schedule_models(models: List[DbtModel], column_types: Callable[[DbtModel], Mapping[str, Optional[str]]]) -> Schedule:
+    """Schedule models most expensive first by the shape of their columns.
+
+    Args:
+        models: Models after filtering
+        column_types: Data type of each column of a model, e.g. DbtParser.column_types
+
+    Returns:
+        The schedule
+    """
+    from dbt2lookml.models.column_collections import ColumnCollections
+
+    return Schedule(models, {model.unique_id: ColumnCollections.cost_stats(column_types(model)) for model in models})
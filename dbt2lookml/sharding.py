@@ -0,0 +1,230 @@
+"""Deterministic sharding of generation across CI nodes, with mergeable per-shard reports."""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import heapq
+import json
+import logging
+import sys
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from dbt2lookml.models.dbt import DbtModel
+
+# Per-shard report written to the output directory unless --shard-report is given
+SHARD_REPORT_FILE = '.dbt2lookml_shard_{index}_of_{count}.json'
+
+
+def shard_spec(value: str) -> Tuple[int, int]:
+    """Parse a 1-based INDEX/COUNT shard specification for argparse.
+
+    Args:
+        value: Shard specification, e.g. '2/4'
+
+    Returns:
+        Tuple of shard index and shard count
+
+    Raises:
+        argparse.ArgumentTypeError: If the specification is malformed
+    """
+    try:
+        index, count = (int(part) for part in value.split('/'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{value}', expected INDEX/COUNT, e.g. 1/4")
+    if count < 1 or not 1 <= index <= count:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{value}', INDEX must be between 1 and COUNT")
+    return index, count
+
+
+def stable_hash(unique_id: str) -> str:
+    """Hash a unique_id identically across processes and machines, unlike hash()."""
+    return hashlib.sha256(unique_id.encode('utf-8')).hexdigest()
+
+
+def model_weight(model: DbtModel) -> int:
+    """Estimate the generation cost of a model by its number of columns."""
+    return max(1, len(model.columns or {}))
+
+
+def assign_shards(models: List[DbtModel], count: int, weight: Callable[[DbtModel], int] = model_weight) -> Dict[str, int]:
+    """Partition models into shards of balanced total weight.
+
+    Models are placed heaviest first onto the lightest shard so far, ties broken
+    by the stable hash of their unique_id and the lowest shard index. Every node
+    running with the same model list computes the same assignment.
+
+    Args:
+        models: Models after filtering
+        count: Number of shards
+        weight: Weight of a model, model_weight by default
+
+    Returns:
+        Mapping of unique_id to 0-based shard index
+    """
+    weights = {model.unique_id: max(1, weight(model)) for model in models}
+    ordered = sorted(models, key=lambda model: (-weights[model.unique_id], stable_hash(model.unique_id)))
+    loads = [(0, shard) for shard in range(count)]
+    assignment = {}
+    for model in ordered:
+        load, shard = heapq.heappop(loads)
+        assignment[model.unique_id] = shard
+        heapq.heappush(loads, (load + weights[model.unique_id], shard))
+    return assignment
+
+
+def shard_models(
+    models: List[DbtModel], index: int, count: int, weight: Callable[[DbtModel], int] = model_weight
+) -> List[DbtModel]:
+    """Get the models of one shard, in their original order.
+
+    Args:
+        models: Models after filtering
+        index: 1-based shard index
+        count: Number of shards
+        weight: Weight of a model, model_weight by default
+
+    Returns:
+        The models assigned to the shard
+    """
+    assignment = assign_shards(models, count, weight)
+    return [model for model in models if assignment[model.unique_id] == index - 1]
+
+
+class ShardReport:
+    """Run report of one shard: which models it generated and where their files went."""
+
+    def __init__(self, index: int, count: int, weight: Callable[[DbtModel], int] = model_weight):
+        """Create an empty report.
+
+        Args:
+            index: 1-based shard index
+            count: Number of shards
+            weight: Weight of a model, the one the shards were balanced by, model_weight by default
+        """
+        self.index = index
+        self.count = count
+        self._weight = weight
+        self.models: List[Dict[str, Any]] = []
+        # Dispatch position and cost estimate of each model, from Schedule.decisions
+        self.schedule: List[Dict[str, Any]] = []
+
+    def record(self, model: DbtModel, status: str, file_path: Optional[str] = None) -> None:
+        """Record the outcome of a model.
+
+        Args:
+            model: The model
+            status: 'written', 'validation_failed', 'failed' or 'timeout'
+            file_path: Path of the written file relative to the output directory
+        """
+        self.models.append(
+            {
+                'unique_id': model.unique_id,
+                'name': model.name,
+                'weight': max(1, self._weight(model)),
+                'status': status,
+                'file_path': file_path,
+            }
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the report as a JSON-serializable dict."""
+        statuses: Dict[str, int] = defaultdict(int)
+        for model in self.models:
+            statuses[model['status']] += 1
+        return {
+            'shard': {'index': self.index, 'count': self.count},
+            'totals': {'models': len(self.models), 'weight': sum(model['weight'] for model in self.models), **statuses},
+            'models': self.models,
+            'schedule': self.schedule,
+        }
+
+    def write(self, path: str) -> None:
+        """Write the report as JSON."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def merge_shard_reports(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine shard reports and check that together they form one consistent run.
+
+    Args:
+        reports: Reports written by ShardReport.write
+
+    Returns:
+        Merged report with all models, plus 'collisions' (output paths written by
+        more than one model), 'duplicate_models', 'missing_shards', 'duplicate_shards'
+        and the 'schedule' of every shard
+    """
+    counts = {report['shard']['count'] for report in reports}
+    count = max(counts) if counts else 0
+    indexes = [report['shard']['index'] for report in reports]
+
+    models = [model for report in sorted(reports, key=lambda report: report['shard']['index']) for model in report['models']]
+    owners_by_path = defaultdict(list)
+    shards_by_model = defaultdict(list)
+    for report in reports:
+        for model in report['models']:
+            shards_by_model[model['unique_id']].append(report['shard']['index'])
+            if model['file_path']:
+                owners_by_path[model['file_path']].append(model['unique_id'])
+
+    statuses: Dict[str, int] = defaultdict(int)
+    for model in models:
+        statuses[model['status']] += 1
+    return {
+        'shards': {'count': count, 'merged': sorted(indexes)},
+        'totals': {'models': len(models), **statuses},
+        'missing_shards': sorted(set(range(1, count + 1)) - set(indexes)),
+        'duplicate_shards': sorted({index for index in indexes if indexes.count(index) > 1}),
+        'inconsistent_counts': len(counts) > 1,
+        'duplicate_models': {unique_id: shards for unique_id, shards in sorted(shards_by_model.items()) if len(shards) > 1},
+        'collisions': {path: owners for path, owners in sorted(owners_by_path.items()) if len(owners) > 1},
+        'models': models,
+        'schedule': [
+            {'shard': report['shard']['index'], **decision}
+            for report in sorted(reports, key=lambda report: report['shard']['index'])
+            for decision in report.get('schedule', [])
+        ],
+    }
+
+
+if __name__ == "__main__":
+    """CLI interface for merging shard reports."""
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    parser = argparse.ArgumentParser(description="Merge the run reports of a sharded dbt2lookml run")
+    parser.add_argument("reports", nargs='+', help="Shard report files")
+    parser.add_argument("--output", "-o", help="Write the merged report to this file")
+    args = parser.parse_args()
+
+    shard_reports = []
+    for report_path in args.reports:
+        with open(report_path, 'r', encoding='utf-8') as f:
+            shard_reports.append(json.load(f))
+    merged = merge_shard_reports(shard_reports)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, indent=2)
+
+    logging.info(f"Merged {len(shard_reports)} of {merged['shards']['count']} shards: {merged['totals']}")
+    problems = False
+    if merged['inconsistent_counts']:
+        logging.error("Shard reports were written with different shard counts")
+        problems = True
+    if merged['missing_shards']:
+        logging.error(f"Missing shards: {merged['missing_shards']}")
+        problems = True
+    if merged['duplicate_shards']:
+        logging.error(f"Shards reported more than once: {merged['duplicate_shards']}")
+        problems = True
+    for unique_id, shards in merged['duplicate_models'].items():
+        logging.error(f"Model {unique_id} was generated by shards {shards}")
+        problems = True
+    for path, owners in merged['collisions'].items():
+        logging.error(f"Output path collision: {path} written by {', '.join(owners)}")
+        problems = True
+    sys.exit(1 if problems else 0)
@@ -1,10 +1,14 @@
 """Utility classes for file handling and SQL validation."""
 
+import hashlib
 import json
 import logging
+import os
 import re
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, Iterable, Optional, Union
+
+from unidecode import unidecode
 
 from dbt2lookml.exceptions import CliError
 
@@ -45,6 +49,96 @@ def camel_to_snake(name: str) -> str:
     return s4.lower()
 
 
+def quote_column_name_if_needed(col_name: str) -> str:
+    """Quote column name with backticks if it contains spaces, special characters, or non-ASCII characters.
+
+    Args:
+        col_name: The column name to potentially quote
+
+    Returns:
+        Quoted column name if needed, otherwise original name
+    """
+    # Check for spaces, special characters, or non-ASCII characters (like Swedish ä, ö, å)
+    if ' ' in col_name or any(char in col_name for char in ['-', '+', '/', '*', '(', ')', '[', ']']) or not col_name.isascii():
+        return f"`{col_name}`"
+    return col_name
+
+
+def safe_name(name: str) -> str:
+    """Create a safe name for LookML by removing invalid characters and handling Unicode.
+
+    This function converts Unicode characters to ASCII equivalents, replaces common
+    separators with underscores, removes invalid characters, and ensures the result
+    is a valid LookML identifier. Dots are preserved for nested field names.
+
+    Args:
+        name: The input name to make safe
+
+    Returns:
+        A safe name suitable for use in LookML
+
+    Examples:
+        >>> safe_name("My Field Name")
+        'My_Field_Name'
+        >>> safe_name("field-name@test")
+        'field_name_test'
+        >>> safe_name("åäö-test@123")
+        'aao_test_123'
+        >>> safe_name("Москва")
+        'Moskva'
+        >>> safe_name("")
+        'unnamed_d41d8cd9'
+    """
+    # Convert Unicode to ASCII equivalents
+    safe = _transliterate_unicode(name)
+    # Replace common separators with underscores
+    safe = _replace_separators(safe)
+    # Remove invalid characters
+    safe = _remove_invalid_characters(safe)
+    # Clean up consecutive underscores
+    safe = _clean_consecutive_underscores(safe)
+    # Remove leading/trailing underscores
+    safe = _strip_boundary_underscores(safe)
+    # Handle empty results
+    return _handle_empty_result(safe, name)
+
+
+def _transliterate_unicode(name: str) -> str:
+    """Convert Unicode characters to ASCII equivalents."""
+    return unidecode(name)
+
+
+def _replace_separators(text: str) -> str:
+    """Replace common separators with underscores (preserve dots for nested fields)."""
+    return re.sub(r'[ \-@]+', '_', text)
+
+
+def _remove_invalid_characters(text: str) -> str:
+    """Remove invalid characters, keeping only alphanumeric, underscores, and dots."""
+    return re.sub(r'[^0-9A-Za-z_.]', '_', text)
+
+
+def _clean_consecutive_underscores(text: str) -> str:
+    """Clean up multiple consecutive underscores, preserving double underscores."""
+    # First replace 3+ underscores with double underscores
+    text = re.sub(r'_{3,}', '__', text)
+    # Then replace single underscores that aren't part of double underscores
+    return re.sub(r'(?<!_)_(?!_)', '_', text)
+
+
+def _strip_boundary_underscores(text: str) -> str:
+    """Remove leading and trailing underscores."""
+    return text.strip('_')
+
+
+def _handle_empty_result(safe: str, original_name: str) -> str:
+    """Handle empty results by generating error hash."""
+    if not safe:
+        hash_suffix = hashlib.md5(original_name.encode('utf-8')).hexdigest()[:8]
+        return f"error_{hash_suffix}"
+    return safe
+
+
 class FileHandler:
     """Handles file operations for reading and writing files."""
 
@@ -94,6 +188,26 @@ class FileHandler:
             msg = f"Could not write file at {path}"
             raise CliError(msg, str(e)) from e
 
+    def write_atomic(self, file_path: Union[str, Path], chunks: Iterable[str]) -> None:
+        """Stream contents to a temporary file that then replaces a file.
+        An interrupted write leaves the previous file in place.
+        Args:
+            file_path: Path where to write the file
+            chunks: Contents to write, in order
+        Raises:
+            CliError: If the file cannot be written
+        """
+        path = Path(file_path)
+        tmp_path = path.with_name(f'{path.name}.tmp')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("w", encoding="utf-8") as f:
+                f.writelines(chunks)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            msg = f"Could not write file at {path}"
+            raise CliError(msg, str(e)) from e
+
 
 class Sql:
     """Handles SQL validation and formatting."""
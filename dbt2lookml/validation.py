@@ -1,21 +1,36 @@
 """LookML validation module."""
 
 import argparse
+import bisect
+import hashlib
 import json
 import logging
 import os
 import re
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Union
 
-from dbt2lookml.models.dbt import DbtModel
+from lkml.keys import EXPR_BLOCK_KEYS
 
-# Pure regex-based validation - no external dependencies needed
+from dbt2lookml.exceptions import CliError
+
+if TYPE_CHECKING:
+    # Imported where needed, so validation worker processes don't import the pydantic models
+    from dbt2lookml.models.dbt import DbtModel
+    from dbt2lookml.utils import FileHandler
+
+# Pure Python validation - no Looker instance needed
 
 logger = logging.getLogger(__name__)
 
+# Below this many files per worker, process start-up costs more than it saves
+MIN_FILES_PER_JOB = 8
+# Sidecar file of content hashes that validated clean, next to the validated files
+VALIDATION_CACHE_FILE = '.dbt2lookml_validation_cache.json'
+
 
 class LookMLValidationError(Exception):
     """Exception raised when LookML validation fails."""
@@ -23,99 +38,274 @@ class LookMLValidationError(Exception):
     pass
 
 
+class ValidationCache:
+    """Sidecar file of content hashes that already validated clean.
+
+    Entries are grouped by validator version, so changing the validation rules
+    (and bumping the version) invalidates them. Only hashes seen in the current
+    run are written back, which drops entries of deleted or changed files.
+    """
+
+    def __init__(self, path: Path, validator_version: str, file_handler: Optional['FileHandler'] = None):
+        """Load the cache entries of a validator version.
+
+        Args:
+            path: Path of the sidecar file
+            validator_version: Version of the validator whose results are cached
+            file_handler: Handler writing the sidecar file, a FileHandler if None
+        """
+        if file_handler is None:
+            from dbt2lookml.utils import FileHandler
+
+            file_handler = FileHandler()
+        self._file_handler = file_handler
+        self._path = path
+        self._version = validator_version
+        self._entries: Dict[str, List[str]] = {}
+        try:
+            self._entries = json.loads(path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable validation cache %s: %s", path, e)
+        if not isinstance(self._entries, dict):
+            self._entries = {}
+        self._clean = set(self._entries.get(validator_version) or [])
+        self._seen: set = set()
+
+    @staticmethod
+    def content_hash(content: Union[str, bytes]) -> str:
+        """Hash content as stored on disk."""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        return hashlib.sha256(content).hexdigest()
+
+    def file_hash(self, file_path: Path) -> Optional[str]:
+        """Hash a file, or None if it cannot be read."""
+        try:
+            return self.content_hash(file_path.read_bytes())
+        except OSError:
+            return None
+
+    def is_clean(self, content_hash: Optional[str]) -> bool:
+        """Check whether content with this hash already validated clean."""
+        if content_hash is None or content_hash not in self._clean:
+            return False
+        self._seen.add(content_hash)
+        return True
+
+    def mark_clean(self, content_hash: Optional[str]) -> None:
+        """Record that content with this hash validated clean."""
+        if content_hash is not None:
+            self._clean.add(content_hash)
+            self._seen.add(content_hash)
+
+    def save(self) -> None:
+        """Write the hashes seen in this run back to the sidecar file."""
+        self._entries[self._version] = sorted(self._seen)
+        try:
+            self._file_handler.write(self._path, json.dumps(self._entries))
+        except CliError as e:
+            logger.warning(f"Failed to write validation cache {self._path}: {e}")
+
+
 class LookMLValidator:
-    """Validates LookML syntax using modular Python functions and regex patterns."""
+    """Validates LookML syntax with a single-pass state machine.
+
+    The validator walks the content once, token by token, tracking strings,
+    comments, ``;;``-terminated SQL/HTML/expression blocks and brace/bracket
+    nesting. Tokens are matched by compiled patterns: a run of well-formed
+    statements, a statement opening a block or list, a run of list items or a
+    closing brace. Expression blocks are handed to a scanner that steps through
+    their special characters up to the ``;;``. Only malformed input falls back
+    to finer-grained tokens that pinpoint the error. Validation is therefore
+    linear in the size of the content and nothing is read twice.
+    """
+
+    # Bump when the validation rules change, so cached results are discarded
+    version = 'state-machine-2'
+
+    # Building blocks of the token patterns
+    _skip = r'\s*(?:#[^\n]*\s*)*(?![\s#])'
+    _string = r'"[^"\\]*(?:\\.[^"\\]*)*"'
+    _atom = r'[^\s:,{}\[\]"#]+'
+    _expression_key = r'(?:sql|html|expr)[-_a-zA-Z0-9]*\s*:'
+    # A plain 'key: value' statement that does not open a block or list
+    _value = rf'(?!sql|html|expr)[_a-zA-Z0-9+]+\s*:[ \t]*(?:{_string}|{_atom})(?=\s)(?![ \t]*[{{\[])'
+    # A statement opening a block or list, e.g. 'dimension: name {' or 'fields: ['
+    _opener = rf'(?!sql|html|expr)[_a-zA-Z0-9+]+\s*:\s*(?:(?:{_string}|{_atom})\s*)?[{{\[]'
 
     patterns = {
-        'atom': re.compile(r'^[-+_a-zA-Z0-9\.]+$'),
-        'quoted_string': re.compile(r'^"([^"\\]|\\.)*"$'),
-        'comment': re.compile(r'^\s*#.*$'),
-        'whitespace': re.compile(r'^\s*$'),
-        'block_type': re.compile(r'^(sql|html|expr)[-_a-zA-Z0-9]*$'),
-        'object_declaration': re.compile(r'^\s*(\w+)\s*:\s*([^{]+)?\s*\{'),
-        'block_declaration': re.compile(r'^\s*(sql|html|expr)[_\w]*\s*:'),
-        'property_declaration': re.compile(r'^\s*(\w+)\s*:\s*(.+)$'),
-        'list_element': re.compile(r'^\s*\[.*\]\s*$', re.DOTALL),
-        'double_semicolon': re.compile(r'.*;;', re.DOTALL),
-        'closing_brace': re.compile(r'^\s*\}\s*$'),
-        'sql_table_name': re.compile(r'^\s*sql_table_name\s*:'),
+        # State: inside a block or at top level. Runs of well-formed statements are consumed
+        # by a single match; everything else is handled token by token.
+        'block': re.compile(
+            _skip
+            + rf'(?:(?P<opener>{_opener})'
+            + rf'|(?P<run>(?:{_value}{_skip})+)'
+            + rf'|(?P<expression>{_expression_key})'
+            + rf'|(?P<statement>(?P<name>[_a-zA-Z0-9+]+)\s*:\s*(?:(?P<value>{_string}|{_atom})\s*)?(?P<opening>[{{\[])?)'
+            + r'|(?P<closing>[}\]])|(?P<end>\Z)|(?P<key>[_a-zA-Z0-9+]+)|(?P<unexpected>.))',
+            re.DOTALL,
+        ),
+        # State: inside a list of atoms, strings and filter-style key: value pairs
+        'list': re.compile(
+            _skip
+            + rf'(?:(?P<items>(?:{_atom}|{_string}|[,:]|\s+)+)'
+            + r'|(?P<closing>[}\]])|(?P<opening>[{\[])|(?P<end>\Z)|(?P<unexpected>.))',
+            re.DOTALL,
+        ),
+        # Inside an unterminated expression: the characters that change the scanner state
+        'expression_special': re.compile(r'[${}\'"\\]'),
+        'newline': re.compile(r'\n'),
     }
 
-    def __init__(self):
-        """Initialize the LookML validator with regex patterns."""
-        self.regex_patterns_compiled = True
+    @classmethod
+    def _line_counter(cls, content: str):
+        """Get a function of a position to its 1-based line number, indexing the lines on first use."""
+        newlines: List[int] = []
 
-    def _validate_with_regex(self, content: str, file_path: Optional[str] = None) -> Dict[str, Any]:
-        """Validate using regex patterns for basic syntax checking."""
-        errors = []
-        lines = content.split('\n')
+        def line(position: int) -> int:
+            if not newlines:
+                newlines.extend(match.start() for match in cls.patterns['newline'].finditer(content))
+                newlines.append(len(content))
+            return bisect.bisect_left(newlines, position) + 1
 
-        brace_stack = []
-        in_sql_block = False
-        current_block_type = None
+        return line
 
-        for line_num, line in enumerate(lines, 1):
-            stripped = line.strip()
+    def _validate_with_state_machine(self, content: str, file_path: Optional[str] = None) -> Dict[str, Any]:
+        """Validate LookML syntax in a single pass over the content.
 
-            # Skip empty lines and comments
-            if not stripped or self.patterns['comment'].match(line):
-                continue
+        Args:
+            content: LookML content to validate
+            file_path: Optional file path for error reporting
 
-            # Check for top-level object declarations (view, explore, etc.)
-            if '{' in stripped and not in_sql_block:
-                # This is likely an object declaration
-                if ':' in stripped:
-                    parts = stripped.split(':', 1)
-                    obj_type = parts[0].strip()
-                    # Only count as object if it's a known LookML object type
-                    if obj_type in ['view', 'explore', 'dashboard', 'dimension', 'measure', 'filter', 'dimension_group', 'join']:
-                        # Check if this is an empty declaration (e.g., "view: name {}")
-                        if stripped.endswith('{}'):
-                            # Empty declaration - valid, no need to track braces
-                            continue
-                        else:
-                            brace_stack.append((line_num, obj_type))
-                            current_block_type = obj_type
-                            continue
-
-            # Check for closing braces
-            if self.patterns['closing_brace'].match(stripped):
-                if not brace_stack:
-                    errors.append(f"Line {line_num}: Unmatched closing brace")
-                else:
-                    brace_stack.pop()
-                    current_block_type = None
+        Returns:
+            Dict with 'valid', 'errors' and 'method'
+        """
+        match_block = self.patterns['block'].match
+        match_list = self.patterns['list'].match
+        line = self._line_counter(content)
+        # Expression blocks starting after the last ;; cannot be terminated
+        last_terminator = content.rfind(';;')
+
+        errors: List[str] = []
+        # Open '{' and '[' with the position they were opened at
+        stack: List[tuple] = []
+        in_list = False
+        position = 0
+
+        while True:
+            token = match_list(content, position) if in_list else match_block(content, position)
+            kind = token.lastgroup
+            position = token.end()
+
+            if kind == 'run' or kind == 'items':
                 continue
+            elif kind == 'opener':
+                stack.append((content[position - 1], position - 1))
+                in_list = content[position - 1] == '['
+            elif kind == 'statement':
+                opening = token.group('opening')
+                if opening is not None:
+                    stack.append((opening, position - 1))
+                    in_list = opening == '['
+                elif token.group('value') is None:
+                    if content.startswith('"', position):
+                        errors.append(f"Line {line(position)}: Unterminated string")
+                        break
+                    errors.append(f"Line {line(token.start(kind))}: Missing value for '{token.group('name')}'")
+            elif kind == 'expression':
+                position = self._skip_expression(content, position, token.start(kind), last_terminator, line, errors)
+            elif kind == 'closing':
+                char = token.group(kind)
+                opening = '{' if char == '}' else '['
+                if not stack:
+                    errors.append(f"Line {line(position - 1)}: Unmatched closing {'brace' if char == '}' else 'bracket'}")
+                    continue
+                if stack[-1][0] != opening:
+                    opened_at = line(stack[-1][1])
+                    errors.append(f"Line {line(position - 1)}: '{char}' closes '{stack[-1][0]}' opened at line {opened_at}")
+                stack.pop()
+                in_list = bool(stack) and stack[-1][0] == '['
+            elif kind == 'opening':
+                stack.append((token.group(kind), position - 1))
+                in_list = token.group(kind) == '['
+            elif kind == 'end':
+                break
+            elif kind == 'key':
+                errors.append(f"Line {line(token.start(kind))}: Expected ':' after '{token.group(kind)}'")
+            elif token.group(kind) == '"':
+                errors.append(f"Line {line(position - 1)}: Unterminated string")
+                break
+            else:
+                errors.append(f"Line {line(position - 1)}: Unexpected character '{token.group(kind)}'")
+
+        if stack:
+            unmatched_lines = [str(line(opened_at)) for _, opened_at in stack]
+            errors.append(f"Unmatched opening braces at lines: {', '.join(unmatched_lines)}")
 
-            # Check for SQL-like declarations that need ;;
-            if any(stripped.startswith(prefix) for prefix in ['sql_table_name:', 'sql:', 'html:', 'expr:']):
-                if not stripped.endswith(';;'):
-                    # Look ahead to see if ;; is on next lines
-                    found_terminator = False
-                    for next_line_num in range(line_num, min(line_num + 10, len(lines))):
-                        if next_line_num < len(lines) and ';;' in lines[next_line_num]:
-                            found_terminator = True
-                            break
-
-                    if not found_terminator:
-                        errors.append(f"Line {line_num}: SQL/HTML/Expression block should end with ;;")
-                continue
+        return {'valid': len(errors) == 0, 'errors': errors, 'method': 'state_machine'}
 
-            # Basic property validation for simple properties
-            if ':' in stripped and '{' not in stripped and '}' not in stripped:
-                # This is a simple property declaration - should be valid
-                continue
+    def _skip_expression(
+        self, content: str, position: int, key_position: int, last_terminator: int, line: Callable[[int], int], errors: List[str]
+    ) -> int:
+        """Scan a ;;-terminated SQL/HTML/expression block, checking the ${} references inside it.
 
-        # Check for unmatched braces
-        if brace_stack:
-            unmatched_lines = [str(line_num) for line_num, _ in brace_stack]
-            errors.append(f"Unmatched opening braces at lines: {', '.join(unmatched_lines)}")
+        The body ends at the first ;;, as lkml reads it, wherever it is: quotes are
+        not reliable in HTML and SQL comments. A ${ reference is closed by the next
+        '}', on any line; one still open at the ;; is reported. Without a ;; ahead,
+        the block is reported as unterminated and the body is scanned for the end of
+        the enclosing block: the first '}' outside quoted strings, ${ references and
+        braces opened in the body, such as Liquid {{ }} and {% %} tags.
 
-        return {'valid': len(errors) == 0, 'errors': errors, 'method': 'regex'}
+        Returns:
+            The position after the block
+        """
+        if position <= last_terminator:
+            end = content.find(';;', position)
+            while (reference := content.find('${', position, end)) != -1:
+                position = content.find('}', reference + 2, end) + 1
+                if position == 0:
+                    errors.append(f"Line {line(reference)}: Unclosed ${{ reference")
+                    break
+            return end + 2
+
+        errors.append(f"Line {line(key_position)}: SQL/HTML/Expression block should end with ;;")
+        search = self.patterns['expression_special'].search
+        depth = 0
+        quote = None
+        in_reference = False
+        while (special := search(content, position)) is not None:
+            char = special.group()
+            position = special.end()
+            if in_reference:
+                in_reference = char != '}'
+            elif char == '$':
+                in_reference = content.startswith('{', position)
+                position += in_reference
+            elif char == '\\':
+                # An escaped quote or backslash does not change the state
+                if content[position : position + 1] in ('\'', '"', '\\'):
+                    position += 1
+            elif char in '\'"':
+                if quote is None:
+                    quote = char
+                elif char == quote:
+                    quote = None
+            elif quote is not None:
+                continue
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                if depth == 0:
+                    # The closing brace of the enclosing block
+                    return position - 1
+                depth -= 1
+        return len(content)
 
     def validate_lookml_string(self, content: str, file_path: Optional[str] = None) -> Dict[str, Any]:
         """
-        Validate a LookML string using comprehensive regex patterns.
+        Validate a LookML string in a single pass.
 
         Args:
             content: LookML content to validate
@@ -124,8 +314,7 @@ class LookMLValidator:
         Returns:
             Dict with validation results
         """
-        # Use only regex validation - fast and comprehensive
-        result = self._validate_with_regex(content, file_path)
+        result = self._validate_with_state_machine(content, file_path)
         result['file'] = file_path or 'Unknown file'
         result['methods_used'] = [result['method']]
 
@@ -147,13 +336,20 @@ class LookMLValidator:
         except Exception as e:
             return {'valid': False, 'errors': [f"Failed to read file {file_path}: {str(e)}"], 'parsed': None}
 
-    def validate_directory(self, directory: Path, pattern: str = "*.lkml") -> Dict[str, Any]:
+    def validate_directory(
+        self, directory: Path, pattern: str = "*.lkml", jobs: Optional[int] = None, use_cache: bool = True
+    ) -> Dict[str, Any]:
         """
-        Validate all LookML files in a directory.
+        Validate all LookML files in a directory and its subdirectories.
+
+        Files whose content already validated clean in an earlier run, according
+        to the VALIDATION_CACHE_FILE sidecar in the directory, are not validated again.
 
         Args:
             directory: Directory containing LookML files
             pattern: File pattern to match (default: "*.lkml")
+            jobs: Number of worker processes (default: number of CPUs, 1 validates in-process)
+            use_cache: Whether to skip files that validated clean before and update the cache
 
         Returns:
             Dict with validation results:
@@ -162,7 +358,7 @@ class LookMLValidator:
                 'total_files': int,
                 'valid_files': int,
                 'invalid_files': int,
-                'results': Dict[str, Dict] - per-file results
+                'results': List[Dict] - per-file results in path order
             }
         """
         if not directory.exists():
@@ -175,54 +371,93 @@ class LookMLValidator:
                 'errors': [f"Directory does not exist: {directory}"],
             }
 
-        files = list(directory.glob(pattern))
-        if not files:
-            # Also check subdirectories
-            files = list(directory.rglob(pattern))
-
+        # One walk over the tree, sorted so results come back in path order
+        files = sorted(directory.rglob(pattern))
         if not files:
             return {'valid': True, 'total_files': 0, 'valid_files': 0, 'invalid_files': 0, 'results': []}
 
-        results = []
-        valid_count = 0
-        invalid_count = 0
+        if use_cache:
+            results = self._validate_files_with_cache(files, directory, jobs)
+        else:
+            results = list(self.iter_directory_results(files, directory, jobs))
+        valid_count = sum(1 for result in results if result['valid'])
+
+        return {
+            'valid': valid_count == len(results),
+            'total_files': len(files),
+            'valid_files': valid_count,
+            'invalid_files': len(results) - valid_count,
+            'results': results,
+        }
 
-        # Use concurrent processing with 4 workers for better performance
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            # Submit all validation tasks
-            future_to_file = {executor.submit(self._validate_single_file, file_path, directory): file_path for file_path in files}
+    def iter_directory_results(self, files: List[Path], directory: Path, jobs: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Validate files across a process pool, yielding results in the order of files.
 
-            # Collect results as they complete
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    result = future.result()
-                    results.append(result)
+        Files are split into contiguous chunks, one task per chunk, so each worker
+        amortizes its start-up over many files. Results of a chunk are yielded as
+        soon as it and all chunks before it are done.
 
-                    if result['valid']:
-                        valid_count += 1
-                    else:
-                        invalid_count += 1
+        Args:
+            files: Files to validate
+            directory: Directory the reported file paths are relative to
+            jobs: Number of worker processes (default: number of CPUs, 1 validates in-process)
 
+        Yields:
+            Per-file validation results
+        """
+        jobs = min(jobs or os.cpu_count() or 1, -(-len(files) // MIN_FILES_PER_JOB))
+        if jobs <= 1:
+            for file_path in files:
+                yield self._validate_single_file(file_path, directory)
+            return
+
+        # A few chunks per worker keeps them busy when file sizes vary
+        chunk_size = -(-len(files) // (jobs * 4))
+        chunks = [files[start : start + chunk_size] for start in range(0, len(files), chunk_size)]
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [executor.submit(_validate_files, chunk, directory) for chunk in chunks]
+            for future, chunk in zip(futures, chunks):
+                try:
+                    yield from future.result()
                 except Exception as e:
                     # Handle worker errors
-                    relative_path = str(file_path.relative_to(directory))
-                    error_result = {
-                        'valid': False,
-                        'errors': [f"Validation error: {str(e)}"],
-                        'file': relative_path,
-                        'methods_used': ['error'],
-                    }
-                    results.append(error_result)
-                    invalid_count += 1
+                    for file_path in chunk:
+                        yield {
+                            'valid': False,
+                            'errors': [f"Validation error: {str(e)}"],
+                            'file': str(file_path.relative_to(directory)),
+                            'methods_used': ['error'],
+                        }
+
+    def _validate_files_with_cache(self, files: List[Path], directory: Path, jobs: Optional[int]) -> List[Dict[str, Any]]:
+        """Validate only files not known to be clean, returning results for all files in order."""
+        validation_cache = ValidationCache(directory / VALIDATION_CACHE_FILE, self.version)
+        hashes = [validation_cache.file_hash(file_path) for file_path in files]
+        cached = [validation_cache.is_clean(content_hash) for content_hash in hashes]
+        fresh_results = self.iter_directory_results(
+            [file_path for file_path, is_cached in zip(files, cached) if not is_cached], directory, jobs
+        )
 
-        return {
-            'valid': invalid_count == 0,
-            'total_files': len(files),
-            'valid_files': valid_count,
-            'invalid_files': invalid_count,
-            'results': results,
-        }
+        results = []
+        for file_path, content_hash, is_cached in zip(files, hashes, cached):
+            if is_cached:
+                result = {
+                    'valid': True,
+                    'errors': [],
+                    'method': 'cache',
+                    'file': str(file_path.relative_to(directory)),
+                    'methods_used': ['cache'],
+                }
+            else:
+                result = next(fresh_results)
+                if result['valid']:
+                    validation_cache.mark_clean(content_hash)
+            results.append(result)
+        fresh_results.close()
+
+        validation_cache.save()
+        return results
 
     def _validate_single_file(self, file_path: Path, directory: Path) -> Dict[str, Any]:
         """Validate a single file and return result with relative path."""
@@ -259,19 +494,339 @@ class LookMLValidator:
                         logger.warning(f"  - {error}")
 
 
-def validate_generated_lookml(output_directory: Path, verbose: bool = False) -> bool:
+class LookMLStructureValidator:
+    """Validates the generated LookML dict before it is serialized.
+
+    Checks what the text validator can only infer from the dumped file, directly
+    on the ``{'view': [...], 'explore': {...}}`` structure: required keys,
+    expression values that lkml will terminate with ``;;``, field name
+    uniqueness within a view and the views and fields joins refer to. It is a
+    single walk over the dict, cheap enough to run on every generated model.
+    """
+
+    # Bump when the validation rules change, so cached results are discarded
+    version = 'structure-1'
+
+    # Keys every object of a kind needs, on top of 'name'
+    required_keys = {
+        'dimension_group': ('type',),
+        'measure': ('type',),
+    }
+    field_kinds = (('dimensions', 'dimension'), ('dimension_groups', 'dimension_group'), ('measures', 'measure'))
+    reference_pattern = re.compile(r'\$\{([^.}]+)\.([^}]+)\}')
+
+    def validate(self, lookml: Dict[str, Any], file_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Validate a generated LookML dict.
+
+        Args:
+            lookml: Generated LookML with 'view' and optionally 'explore'
+            file_path: Optional file path for error reporting
+
+        Returns:
+            Dict with validation results, in the same format as LookMLValidator
+        """
+        errors: List[str] = []
+        views = lookml.get('view')
+        if not isinstance(views, list) or not views:
+            errors.append("LookML must contain at least one view")
+            views = []
+
+        # Field names of each view, used to resolve join references
+        view_fields: Dict[str, set] = {}
+        for view in views:
+            name = self._check_object(view, 'view', errors)
+            if name is None:
+                continue
+            fields = self._check_fields(view, name, errors)
+            if name in view_fields:
+                errors.append(f"Duplicate view name '{name}'")
+                continue
+            view_fields[name] = fields
+
+        explore = lookml.get('explore')
+        if explore is not None:
+            self._check_explore(explore, view_fields, errors)
+
+        return {
+            'valid': len(errors) == 0,
+            'errors': errors,
+            'method': 'structure',
+            'file': file_path or 'Unknown file',
+            'methods_used': ['structure'],
+        }
+
+    def _check_object(self, lookml_object: Any, kind: str, errors: List[str], context: str = '') -> Optional[str]:
+        """Check the name, required keys and expressions of an object.
+
+        Returns:
+            The name of the object, or None if it has no usable name
+        """
+        if not isinstance(lookml_object, dict):
+            errors.append(f"{kind.capitalize()}{context} must be a dict, got {type(lookml_object).__name__}")
+            return None
+        name = lookml_object.get('name')
+        if not isinstance(name, str) or not name:
+            errors.append(f"{kind.capitalize()}{context} is missing a name")
+            return None
+
+        label = f"{kind} '{name}'{context}"
+        for key in self.required_keys.get(kind, ()):
+            if not lookml_object.get(key):
+                errors.append(f"{label.capitalize()} is missing '{key}'")
+        for key in EXPR_BLOCK_KEYS:
+            value = lookml_object.get(key)
+            if value is None:
+                continue
+            if not isinstance(value, str) or not value.strip():
+                errors.append(f"{label.capitalize()} has an empty '{key}'")
+            elif ';;' in value:
+                errors.append(f"{label.capitalize()} has ';;' inside '{key}', which would end the expression early")
+        return name
+
+    def _check_fields(self, view: Dict[str, Any], view_name: str, errors: List[str]) -> set:
+        """Check the fields of a view.
+
+        Returns:
+            Names the fields can be referenced by, including dimension group timeframes
+        """
+        names: set = set()
+        referenceable: set = set()
+        for plural, kind in self.field_kinds:
+            for field in view.get(plural) or []:
+                name = self._check_object(field, kind, errors, f" in view '{view_name}'")
+                if name is None:
+                    continue
+                if name in names:
+                    errors.append(f"Duplicate field name '{name}' in view '{view_name}'")
+                names.add(name)
+                referenceable.update(field_reference_names(field))
+        return referenceable
+
+    def _check_explore(self, explore: Any, view_fields: Dict[str, set], errors: List[str]) -> None:
+        """Check an explore and the views and fields its joins refer to."""
+        name = self._check_object(explore, 'explore', errors)
+        if name is None:
+            return
+
+        # Aliases available in the explore's SQL, mapped to the view they stand for
+        aliases = {name: explore.get('from') or name}
+        joins = explore.get('joins') or []
+        for join in joins:
+            join_name = self._check_object(join, 'join', errors, f" in explore '{name}'")
+            if join_name is None:
+                continue
+            if join_name in aliases:
+                errors.append(f"Duplicate join name '{join_name}' in explore '{name}'")
+            aliases[join_name] = join.get('from') or join_name
+
+        for alias, view_name in aliases.items():
+            if view_name not in view_fields:
+                errors.append(f"Explore '{name}' refers to view '{view_name}' which is not defined")
+
+        for join in joins:
+            if not isinstance(join, dict):
+                continue
+            for required_join in join.get('required_joins') or []:
+                if required_join not in aliases:
+                    errors.append(f"Join '{join.get('name')}' requires unknown join '{required_join}'")
+            for key in ('sql', 'sql_on'):
+                for alias, field in self.reference_pattern.findall(join.get(key) or ''):
+                    fields = view_fields.get(aliases.get(alias))
+                    if fields is None:
+                        errors.append(f"Join '{join.get('name')}' refers to unknown view '{alias}'")
+                    elif field not in fields:
+                        errors.append(f"Join '{join.get('name')}' refers to unknown field '{alias}.{field}'")
+
+
+def _named(lookml_objects: Any) -> List[Dict[str, Any]]:
+    """Get the objects of a generated list that are dicts with a name, skipping malformed ones."""
+    if not isinstance(lookml_objects, list):
+        return []
+    return [lookml_object for lookml_object in lookml_objects if isinstance(lookml_object, dict) and lookml_object.get('name')]
+
+
+def field_reference_names(field: Dict[str, Any]) -> List[str]:
+    """Get the names a field can be referenced by.
+
+    Args:
+        field: A dimension, dimension group or measure dict
+
+    Returns:
+        The field name, plus one name per timeframe of a time dimension group
+        or per interval of a duration dimension group
+    """
+    name = field['name']
+    if field.get('type') == 'duration':
+        return [name] + [f"{interval}s_{name}" for interval in field.get('intervals') or []]
+    return [name] + [f"{name}_{timeframe}" for timeframe in field.get('timeframes') or []]
+
+
+@dataclass
+class FieldReference:
+    """A ${view.field} (or same-view ${field}) reference found in generated LookML."""
+
+    file: str
+    location: str
+    view: str
+    field: str
+    # Whether the view may also be the name of a dbt model, as in meta.looker.joins
+    names_model: bool = False
+
+    def __str__(self) -> str:
+        return f"{self.file}: {self.location} refers to ${{{self.view}.{self.field}}}"
+
+
+@dataclass
+class DanglingReference:
+    """A field reference that does not resolve to a generated view and field."""
+
+    reference: FieldReference
+    reason: str
+
+    def __str__(self) -> str:
+        return f"{self.reference} ({self.reason})"
+
+
+class FieldReferenceIndex:
+    """Symbol index of all generated views and the field references between them.
+
+    Files are added one by one as they are generated: each view registers the
+    names its fields can be referenced by, and every ${view.field} reference in
+    SQL expressions, join conditions, measure filters and ``meta.looker.joins``
+    is recorded with the view it names. Once all files are added,
+    ``dangling`` resolves each reference with two dictionary lookups, so the
+    post-pass is linear in the number of references.
+    """
+
+    # ${view.field} and ${field}; ${TABLE} and ${view.SQL_TABLE_NAME} are not field references
+    reference_pattern = re.compile(r'\$\{(?:(\w+)\.)?(\w+)\}')
+    non_field_names = {'TABLE', 'EXTENDED', 'SQL_TABLE_NAME'}
+
+    def __init__(self):
+        """Create an empty index."""
+        self._view_fields: Dict[str, set] = {}
+        # dbt model name -> main view name, for meta.looker.joins that name a model
+        self._model_views: Dict[str, str] = {}
+        self._references: List[FieldReference] = []
+
+    def __len__(self) -> int:
+        return len(self._references)
+
+    def add(self, file_path: str, lookml: Dict[str, Any], model: Optional['DbtModel'] = None) -> None:
+        """Index the views and references of a generated file.
+
+        Args:
+            file_path: Path of the generated file, for reporting
+            lookml: Generated LookML with 'view' and optionally 'explore'
+            model: The dbt model the file was generated from, for its meta.looker.joins
+        """
+        views = _named(lookml.get('view'))
+        for view in views:
+            view_name = view['name']
+            fields = self._view_fields.setdefault(view_name, set())
+            for plural in ('dimensions', 'dimension_groups', 'measures'):
+                for field in _named(view.get(plural)):
+                    fields.update(field_reference_names(field))
+            for plural in ('dimensions', 'dimension_groups', 'measures'):
+                for field in _named(view.get(plural)):
+                    location = f"{plural[:-1]} '{view_name}.{field['name']}'"
+                    self._add_expressions(file_path, location, field, {}, view_name)
+                    for field_filter in field.get('filters') or []:
+                        self._add_filter(file_path, location, field_filter, view_name)
+
+        explore = lookml.get('explore')
+        if isinstance(explore, dict) and explore.get('name'):
+            explore_name = explore['name']
+            aliases = {explore_name: explore.get('from') or explore_name}
+            joins = _named(explore.get('joins'))
+            for join in joins:
+                aliases[join['name']] = join.get('from') or join['name']
+            self._add_expressions(file_path, f"explore '{explore_name}'", explore, aliases)
+            for join in joins:
+                self._add_expressions(file_path, f"join '{join['name']}' in explore '{explore_name}'", join, aliases)
+
+        from dbt2lookml.models.dbt import DbtModel
+
+        if isinstance(model, DbtModel) and views:
+            main_view = views[0]['name']
+            self._model_views[model.name] = main_view
+            for meta_join in (model.meta.looker.joins if model.meta.looker else None) or []:
+                if meta_join.sql_on:
+                    location = f"meta.looker.joins '{meta_join.join_model}' of model '{model.name}'"
+                    self._add_references(file_path, location, meta_join.sql_on, {}, main_view, names_model=True)
+
+    def _add_expressions(
+        self, file_path: str, location: str, lookml_object: Dict[str, Any], aliases: Dict[str, str], view_name: str = None
+    ) -> None:
+        """Record the references in the expressions of an object."""
+        for key in EXPR_BLOCK_KEYS:
+            value = lookml_object.get(key)
+            if isinstance(value, str) and '${' in value:
+                self._add_references(file_path, location, value, aliases, view_name)
+
+    def _add_references(
+        self,
+        file_path: str,
+        location: str,
+        expression: str,
+        aliases: Dict[str, str],
+        view_name: Optional[str],
+        names_model: bool = False,
+    ) -> None:
+        """Record the references in an expression, resolving explore aliases and same-view references."""
+        for view, field in self.reference_pattern.findall(expression):
+            if field in self.non_field_names or (not view and view_name is None):
+                continue
+            view = aliases.get(view, view) if view else view_name
+            self._references.append(FieldReference(file_path, location, view, field, names_model))
+
+    def _add_filter(self, file_path: str, location: str, field_filter: Any, view_name: str) -> None:
+        """Record the field a measure filter applies to."""
+        field = field_filter.get('field') if isinstance(field_filter, dict) else None
+        if not field:
+            return
+        view, _, name = field.rpartition('.')
+        self._references.append(FieldReference(file_path, location, view or view_name, name))
+
+    def dangling(self) -> List[DanglingReference]:
+        """Resolve all references and get the ones that do not resolve.
+
+        Returns:
+            Dangling references in the order they were added
+        """
+        dangling = []
+        for reference in self._references:
+            fields = self._view_fields.get(reference.view)
+            if fields is None and reference.names_model and reference.view in self._model_views:
+                fields = self._view_fields.get(self._model_views[reference.view])
+            if fields is None:
+                dangling.append(DanglingReference(reference, f"unknown view '{reference.view}'"))
+            elif reference.field not in fields:
+                dangling.append(DanglingReference(reference, f"unknown field '{reference.field}'"))
+        return dangling
+
+
+def _validate_files(files: List[Path], directory: Path) -> List[Dict[str, Any]]:
+    """Validate a chunk of files in a worker process."""
+    validator = LookMLValidator()
+    return [validator._validate_single_file(file_path, directory) for file_path in files]
+
+
+def validate_generated_lookml(output_directory: Path, verbose: bool = False, jobs: Optional[int] = None) -> bool:
     """
     Validate all generated LookML files in the output directory.
 
     Args:
         output_directory: Path to the directory containing generated LookML
         verbose: Whether to show detailed error messages
+        jobs: Number of worker processes (default: number of CPUs)
 
     Returns:
         True if all files are valid, False otherwise
     """
     validator = LookMLValidator()
-    result = validator.validate_directory(output_directory)
+    result = validator.validate_directory(output_directory, jobs=jobs)
     validator.print_validation_report(result, verbose)
 
     return result['valid']
@@ -287,6 +842,10 @@ if __name__ == "__main__":
     parser.add_argument("path", help="Path to LookML file or directory")
     parser.add_argument("--verbose", "-v", action="store_true", help="Show detailed error messages")
     parser.add_argument("--pattern", default="*.lkml", help="File pattern to match (default: *.lkml)")
+    parser.add_argument("--no-cache", action="store_true", help="Validate every file, ignoring and not updating the cache")
+    parser.add_argument(
+        "--jobs", "-j", type=int, default=None, help="Number of worker processes for directories (default: number of CPUs)"
+    )
 
     args = parser.parse_args()
     path = Path(args.path)
@@ -298,7 +857,7 @@ if __name__ == "__main__":
         validator.print_validation_report(result, args.verbose)
         sys.exit(0 if result['valid'] else 1)
     elif path.is_dir():
-        result = validator.validate_directory(path, args.pattern)
+        result = validator.validate_directory(path, args.pattern, args.jobs, not args.no_cache)
         validator.print_validation_report(result, args.verbose)
         sys.exit(0 if result['valid'] else 1)
     else:
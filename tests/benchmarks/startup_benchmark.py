@@ -0,0 +1,54 @@
+"""Startup time benchmark of the dbt2lookml entry point.
+
+Usage:
+    python tests/benchmarks/startup_benchmark.py [--repeat N] [--budget-ms MS]
+
+Runs --help and --version in fresh interpreters and prints the best wall time of
+each next to a bare interpreter start. Exits with status 1 if --help exceeds the
+budget, so it can guard against startup regressions in CI. --version is reported
+only: it also pays for importing importlib.metadata to look up the version.
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+ENTRY_POINT = "import sys; from dbt2lookml.cli import main; sys.argv = ['dbt2lookml'] + sys.argv[1:]; main()"
+COMMANDS = {
+    'python -c pass': [sys.executable, '-c', 'pass'],
+    'dbt2lookml --help': [sys.executable, '-c', ENTRY_POINT, '--help'],
+    'dbt2lookml --version': [sys.executable, '-c', ENTRY_POINT, '--version'],
+}
+BUDGETED = ('dbt2lookml --help',)
+
+
+def best_time_ms(command: list, repeat: int) -> float:
+    """Run a command repeatedly and return its best wall time in milliseconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, capture_output=True)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark dbt2lookml startup time')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--budget-ms', type=float, default=100.0, help='Maximum best time of --help')
+    args = parser.parse_args()
+
+    over_budget = []
+    for name, command in COMMANDS.items():
+        elapsed = best_time_ms(command, args.repeat)
+        print(f"{name}: best {elapsed:.1f} ms")
+        if name in BUDGETED and elapsed > args.budget_ms:
+            over_budget.append(name)
+    if over_budget:
+        print(f"Over the {args.budget_ms:.0f} ms budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
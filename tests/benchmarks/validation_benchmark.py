@@ -0,0 +1,44 @@
+"""Throughput benchmark of the LookML validator.
+
+Usage:
+    python tests/benchmarks/validation_benchmark.py [file.lkml ...] [--repeat N]
+
+Defaults to the largest expected fixture, d_item_v3.view.lkml.
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+from dbt2lookml.validation import LookMLValidator
+
+DEFAULT_FILE = Path(__file__).parents[1] / 'fixtures' / 'expected' / 'd_item_v3.view.lkml'
+
+
+def benchmark(path: Path, repeat: int) -> None:
+    """Validate a file repeatedly and print the best time and throughput."""
+    content = path.read_text()
+    validator = LookMLValidator()
+    result = validator.validate_lookml_string(content, str(path))
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validator.validate_lookml_string(content, str(path))
+        best = min(best, time.perf_counter() - start)
+
+    size_mb = len(content.encode()) / 1_000_000
+    print(f"{path.name}: {size_mb * 1000:.1f} KB, valid={result['valid']}, best {best * 1000:.2f} ms, {size_mb / best:.1f} MB/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the LookML validator')
+    parser.add_argument('files', nargs='*', type=Path, default=[DEFAULT_FILE])
+    parser.add_argument('--repeat', type=int, default=200)
+    args = parser.parse_args()
+    for path in args.files:
+        benchmark(path, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Fixtures shared by the integration tests."""
+
+import json
+import os
+
+import pytest
+
+# Catalog columns of every model: a dimension group, and a repeated record giving a nested view and a join
+ORDER_COLUMNS = {
+    'id': 'INT64',
+    'created_at': 'TIMESTAMP',
+    'items': 'ARRAY<STRUCT<sku STRING, price NUMERIC>>',
+    'items.sku': 'STRING',
+    'items.price': 'NUMERIC',
+}
+
+
+def _build_artifacts(names, schema='shop', extra_columns=None, tags=None, table=None):
+    """Build the manifest and the catalog of BigQuery models.
+
+    Args:
+        names: Names of the models, in manifest order
+        schema: Schema of the models, also their project and directory
+        extra_columns: Types by name of the catalog columns after ORDER_COLUMNS of the model at a position of names
+        tags: Tags of the model at a position of names, none if None
+        table: Table read by every model, each model its own if None
+
+    Returns:
+        The manifest and the catalog
+    """
+    nodes = {}
+    catalog_nodes = {}
+    for i, name in enumerate(names):
+        unique_id = f'model.{schema}.{name}'
+        nodes[unique_id] = {
+            'resource_type': 'model',
+            'name': name,
+            'schema': schema,
+            'database': 'db',
+            'relation_name': f'`db`.`{schema}`.`{table or name}`',
+            'unique_id': unique_id,
+            'tags': tags(i) if tags else [],
+            'description': name,
+            'columns': {'id': {'name': 'id', 'data_type': 'INT64', 'description': 'Id'}},
+            'path': f'{schema}/{name}.sql',
+            'meta': {},
+        }
+        column_types = {**ORDER_COLUMNS, **(extra_columns(i) if extra_columns else {})}
+        catalog_nodes[unique_id] = {
+            'metadata': {'type': 'table', 'schema': schema, 'name': name, 'database': 'db'},
+            'columns': {
+                column: {'type': column_type, 'name': column, 'index': index}
+                for index, (column, column_type) in enumerate(column_types.items(), 1)
+            },
+        }
+    manifest = {'metadata': {'adapter_type': 'bigquery'}, 'nodes': nodes, 'sources': {}, 'exposures': {}}
+    return manifest, {'nodes': catalog_nodes}
+
+
+def _write_artifacts(target_dir, artifacts):
+    """Write a manifest and a catalog as manifest.json and catalog.json, replacing earlier ones."""
+    manifest, catalog = artifacts
+    target_dir.mkdir(exist_ok=True)
+    (target_dir / 'manifest.json').write_text(json.dumps(manifest))
+    catalog_path = target_dir / 'catalog.json'
+    previous = catalog_path.stat().st_mtime_ns if catalog_path.exists() else 0
+    catalog_path.write_text(json.dumps(catalog))
+    # Coarse file system timestamps must not hide a change
+    os.utime(catalog_path, ns=(previous + 10**9, previous + 10**9))
+
+
+@pytest.fixture
+def build_artifacts():
+    """Build the manifest and the catalog of BigQuery models, see _build_artifacts."""
+    return _build_artifacts
+
+
+@pytest.fixture
+def write_artifacts():
+    """Write artifacts to a target directory, see _write_artifacts."""
+    return _write_artifacts
@@ -0,0 +1,197 @@
+"""The programmatic API must yield the files the CLI writes, one model at a time."""
+
+import asyncio
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dbt2lookml.api import GenerateOptions, ViewStats, agenerate_views, generate_views
+from dbt2lookml.cli import Cli
+from dbt2lookml.exceptions import CliError
+from dbt2lookml.parsers import DbtParser
+
+
+@pytest.fixture
+def artifacts(build_artifacts):
+    """Three models, all reading the table shop.orders."""
+    return build_artifacts(['orders', 'orders_copy', 'orders_archive'], table='orders')
+
+
+def cli_files(monkeypatch, tmp_path, target_dir, *args):
+    output_dir = tmp_path / 'cli'
+    monkeypatch.setattr(sys, 'argv', ['dbt2lookml', '--target-dir', str(target_dir), '--output-dir', str(output_dir), *args])
+    Cli().run()
+    return {str(path.relative_to(output_dir)): path.read_text() for path in output_dir.rglob('*.lkml')}
+
+
+@pytest.mark.parametrize('use_table_name', [False, True])
+def test_yields_the_files_the_cli_writes(tmp_path, monkeypatch, artifacts, write_artifacts, use_table_name):
+    target_dir = tmp_path / 'target'
+    write_artifacts(target_dir, artifacts)
+    expected = cli_files(monkeypatch, tmp_path, target_dir, *(['--use-table-name'] if use_table_name else []))
+
+    views = list(
+        generate_views(
+            target_dir / 'manifest.json', str(target_dir / 'catalog.json'), GenerateOptions(use_table_name=use_table_name)
+        )
+    )
+    assert {relative_path: lookml_text for relative_path, lookml_text, _ in views} == expected
+    assert len(views) == 3
+
+
+def test_stats(artifacts):
+    view = next(generate_views(*artifacts, GenerateOptions(select='orders')))
+    assert view.relative_path == 'shop/orders.view.lkml'
+    assert isinstance(view.stats, ViewStats)
+    assert view.stats.unique_id == 'model.shop.orders'
+    assert view.stats.views == 2
+    assert view.stats.dimension_groups == 1
+    assert view.stats.joins == 1
+    assert view.stats.dimensions >= 3
+    assert view.stats.seconds >= 0
+
+
+def test_generates_one_model_at_a_time(monkeypatch, artifacts):
+    rendered = []
+    render_model = Cli._render_model
+    monkeypatch.setattr(
+        Cli,
+        '_render_model',
+        staticmethod(lambda args, model, cache: rendered.append(model.name) or render_model(args, model, cache)),
+    )
+    views = generate_views(*artifacts)
+    assert rendered == []
+    next(views)
+    assert len(rendered) == 1
+    assert len(list(views)) == 2
+    assert len(rendered) == 3
+
+
+def test_writes_nothing(tmp_path, monkeypatch, artifacts):
+    monkeypatch.chdir(tmp_path)
+    list(generate_views(*artifacts, GenerateOptions(validate=True)))
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_errors_stop_generation_unless_continuing(monkeypatch, artifacts):
+    render_model = Cli._render_model
+
+    def render_or_fail(args, model, cache):
+        if model.name == 'orders_copy':
+            raise ValueError('cannot render')
+        return render_model(args, model, cache)
+
+    monkeypatch.setattr(Cli, '_render_model', staticmethod(render_or_fail))
+    with pytest.raises(ValueError, match='cannot render'):
+        list(generate_views(*artifacts))
+    views = list(generate_views(*artifacts, GenerateOptions(continue_on_error=True)))
+    assert [view.stats.model_name for view in views] == ['orders', 'orders_archive']
+
+
+def test_missing_artifact(tmp_path, artifacts):
+    with pytest.raises(CliError, match='Could not find file'):
+        list(generate_views(tmp_path / 'missing.json', artifacts[1]))
+
+
+class RecordingRenderer:
+    """Wraps Cli._render_model, recording the models rendered and the threads rendering them."""
+
+    def __init__(self, monkeypatch):
+        self.models = []
+        self.threads = set()
+        render_model = Cli._render_model
+
+        def render(args, model, cache):
+            self.models.append(model.name)
+            self.threads.add(threading.current_thread())
+            return render_model(args, model, cache)
+
+        monkeypatch.setattr(Cli, '_render_model', staticmethod(render))
+
+
+class TestAsync:
+    def test_yields_what_generate_views_yields(self, artifacts):
+        async def collect():
+            return [view async for view in agenerate_views(*artifacts, batch_size=2)]
+
+        views = asyncio.run(collect())
+        expected = list(generate_views(*artifacts))
+        assert [(view.relative_path, view.lookml_text) for view in views] == [(v.relative_path, v.lookml_text) for v in expected]
+
+    def test_generates_in_the_executor(self, monkeypatch, artifacts):
+        renderer = RecordingRenderer(monkeypatch)
+
+        async def collect():
+            return [view async for view in agenerate_views(*artifacts)]
+
+        assert len(asyncio.run(collect())) == 3
+        assert threading.main_thread() not in renderer.threads
+
+    def test_generates_at_most_one_batch_ahead(self, monkeypatch, artifacts):
+        renderer = RecordingRenderer(monkeypatch)
+        closed = []
+        monkeypatch.setattr(DbtParser, 'close', lambda self: closed.append(self))
+
+        async def take_one(executor):
+            views = agenerate_views(*artifacts, executor=executor, batch_size=1)
+            await views.__anext__()
+            await asyncio.sleep(0.2)
+            await views.aclose()
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            asyncio.run(take_one(executor))
+        assert renderer.models == ['orders', 'orders_copy']
+        assert len(closed) == 1
+
+    def test_cancelling_stops_generation(self, monkeypatch, artifacts):
+        renderer = RecordingRenderer(monkeypatch)
+        closed = []
+        monkeypatch.setattr(DbtParser, 'close', lambda self: closed.append(self))
+        consumed = []
+
+        async def consume_and_cancel(executor):
+            async def consume():
+                async for view in agenerate_views(*artifacts, executor=executor, batch_size=1):
+                    consumed.append(view)
+                    await asyncio.sleep(10)
+
+            task = asyncio.create_task(consume())
+            while not consumed:
+                await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            asyncio.run(consume_and_cancel(executor))
+        assert len(consumed) == 1
+        assert len(renderer.models) < 3
+        assert len(closed) == 1
+
+    def test_views_generated_before_an_error_are_yielded(self, monkeypatch, artifacts):
+        render_model = Cli._render_model
+
+        def render_or_fail(args, model, cache):
+            if model.name == 'orders_copy':
+                raise ValueError('cannot render')
+            return render_model(args, model, cache)
+
+        monkeypatch.setattr(Cli, '_render_model', staticmethod(render_or_fail))
+        consumed = []
+
+        async def collect():
+            async for view in agenerate_views(*artifacts, batch_size=3):
+                consumed.append(view.stats.model_name)
+
+        with pytest.raises(ValueError, match='cannot render'):
+            asyncio.run(collect())
+        assert consumed == ['orders']
+
+    def test_errors_are_raised_in_the_consumer(self, tmp_path, artifacts):
+        async def collect():
+            return [view async for view in agenerate_views(tmp_path / 'missing.json', artifacts[1])]
+
+        with pytest.raises(CliError, match='Could not find file'):
+            asyncio.run(collect())
@@ -1,3 +1,4 @@
+import json
 import os
 from unittest.mock import Mock, call, patch
 
@@ -5,7 +6,8 @@ import pytest
 import yaml
 
 from dbt2lookml.cli import Cli
-from dbt2lookml.exceptions import CliError
+from dbt2lookml.exceptions import CliError, ModelTimeoutError
+from dbt2lookml.sharding import ShardReport
 
 
 def test_create_parser_default_args():
@@ -53,7 +55,7 @@ def test_parse_args_all_options():
     assert args.generate_locale is True
 
 
-@patch('dbt2lookml.cli.DbtParser')
+@patch('dbt2lookml.parsers.DbtParser')
 @patch('dbt2lookml.cli.FileHandler')
 def test_cli_parse(mock_file_handler, mock_dbt_parser):
     """Test CLI parse method with different argument combinations"""
@@ -85,8 +87,8 @@ def test_cli_parse(mock_file_handler, mock_dbt_parser):
     assert result == ['model1', 'model2']
 
 
-@patch('dbt2lookml.cli.LookmlGenerator')
-def test_cli_generate_with_args(mock_generator):
+@patch('dbt2lookml.generators.LookmlGenerator')
+def test_cli_generate_with_args(mock_generator, tmp_path):
     """Test generate method creates generator correctly"""
     # Mock generator
     mock_generator_instance = Mock()
@@ -96,7 +98,7 @@ def test_cli_generate_with_args(mock_generator):
         {'view': {'name': 'test'}},
     )
     cli = Cli()
-    args = Mock(output_dir='output')
+    args = Mock(output_dir=str(tmp_path))
     cli.generate(args, [Mock()])
     mock_generator.assert_called_with(args)
 
@@ -112,7 +114,7 @@ def test_continue_on_error_flag():
     assert args.continue_on_error is True
 
 
-@patch('dbt2lookml.cli.LookmlGenerator')
+@patch('dbt2lookml.generators.LookmlGenerator')
 @patch('dbt2lookml.cli.FileHandler')
 def test_generate_with_empty_models(mock_file_handler, mock_generator):
     """Test generate method with empty models list"""
@@ -128,9 +130,9 @@ def test_generate_with_empty_models(mock_file_handler, mock_generator):
     mock_file_handler_instance.write.assert_not_called()
 
 
-@patch('dbt2lookml.cli.LookmlGenerator')
+@patch('dbt2lookml.generators.LookmlGenerator')
 @patch('dbt2lookml.cli.FileHandler')
-def test_generate_with_continue_on_error(mock_file_handler, mock_generator):
+def test_generate_with_continue_on_error(mock_file_handler, mock_generator, tmp_path):
     """Test generate method with --continue-on-error when some models fail"""
     # Setup mocks
     mock_generator_instance = Mock()
@@ -145,27 +147,28 @@ def test_generate_with_continue_on_error(mock_file_handler, mock_generator):
         Exception("Model generation failed"),
     ]
     # Create test models
-    models = [Mock(name='model1'), Mock(name='model2')]
+    models = [Mock(name='model1', unique_id='model.test.model1'), Mock(name='model2', unique_id='model.test.model2')]
     cli = Cli()
-    args = Mock(output_dir='output', continue_on_error=True)  # Enable continue on error
+    args = Mock(output_dir=str(tmp_path), continue_on_error=True)  # Enable continue on error
     # Mock successful file write
     mock_file_handler_instance.write.return_value = None
     # Should not raise exception, should continue processing
     views = cli.generate(args, models)
     # Should have one successful view
     assert len(views) == 1
-    expected_path = os.path.join('output', 'model1', 'test1.view.lkml')
+    expected_path = os.path.join(str(tmp_path), 'model1', 'test1.view.lkml')
     # Both models should have been attempted
     assert mock_generator_instance.generate.call_count == 2
-    # File write should be called once for the successful model
-    mock_file_handler_instance.write.assert_called_once()
+    # File write should be called once for the successful model, the other writes are sidecar files
+    lookml_writes = [call.args for call in mock_file_handler_instance.write.call_args_list if str(call.args[0]).endswith('.lkml')]
+    assert len(lookml_writes) == 1
     # Verify the write call arguments
-    write_args = mock_file_handler_instance.write.call_args[0]
+    write_args = lookml_writes[0]
     assert write_args[0] == expected_path  # normalize path for Windows
 
 
 @patch('dbt2lookml.cli.FileHandler')
-def test_write_lookml_file_handles_errors(mock_file_handler):
+def test_write_lookml_file_handles_errors(mock_file_handler, tmp_path):
     """Test _write_lookml_file error handling"""
     mock_file_handler_instance = Mock()
     mock_file_handler.return_value = mock_file_handler_instance
@@ -173,12 +176,12 @@ def test_write_lookml_file_handles_errors(mock_file_handler):
     mock_file_handler_instance.write.side_effect = OSError("Permission denied")
     cli = Cli()
     with pytest.raises(CliError) as exc_info:
-        cli._write_lookml_file('output', 'test.view.lkml', 'content')
+        cli._write_lookml_file(str(tmp_path), 'test.view.lkml', 'content')
     assert "Failed to write file" in str(exc_info.value)
     assert "Permission denied" in str(exc_info.value)
 
 
-@patch('dbt2lookml.cli.DbtParser')
+@patch('dbt2lookml.parsers.DbtParser')
 @patch('dbt2lookml.cli.FileHandler')
 def test_parse_handles_missing_files(mock_file_handler, mock_dbt_parser):
     """Test parse method handles missing manifest/catalog files"""
@@ -193,7 +196,7 @@ def test_parse_handles_missing_files(mock_file_handler, mock_dbt_parser):
     assert "manifest.json not found" in str(exc_info.value)
 
 
-@patch('dbt2lookml.cli.LookmlGenerator')
+@patch('dbt2lookml.generators.LookmlGenerator')
 @patch('dbt2lookml.cli.FileHandler')
 def test_generate_without_continue_on_error(mock_file_handler, mock_generator):
     """Test generate method without --continue-on-error when a model fails"""
@@ -205,7 +208,7 @@ def test_generate_without_continue_on_error(mock_file_handler, mock_generator):
     args = Mock(output_dir='output', continue_on_error=False)  # Disable continue on error
     # Should raise exception immediately
     with pytest.raises(Exception) as exc_info:
-        cli.generate(args, [Mock(name='model1')])
+        cli.generate(args, [Mock(name='model1', unique_id='model.test.model1')])
     assert "Model generation failed" in str(exc_info.value)
     assert mock_generator_instance.generate.call_count == 1
 
@@ -347,7 +350,7 @@ def test_merge_config_with_args():
 
 
 @patch('dbt2lookml.cli.logging')
-@patch('dbt2lookml.cli.DbtParser')
+@patch('dbt2lookml.parsers.DbtParser')
 @patch('dbt2lookml.cli.FileHandler')
 def test_run_with_config_file(mock_file_handler, mock_dbt_parser, mock_logging):
     """Test run method with configuration file"""
@@ -359,7 +362,7 @@ def test_run_with_config_file(mock_file_handler, mock_dbt_parser, mock_logging):
     # Mock parser
     mock_parser_instance = Mock()
     mock_dbt_parser.return_value = mock_parser_instance
-    mock_parser_instance.get_models.return_value = []
+    mock_parser_instance.select_models.return_value = []
 
     # Mock config loading
     cli = Cli()
@@ -384,3 +387,173 @@ def test_run_with_config_file(mock_file_handler, mock_dbt_parser, mock_logging):
     # Verify config was loaded and merged
     cli._load_config.assert_called_once_with('/path/to/config.yaml')
     cli._merge_config_with_args.assert_called_once()
+    mock_parser_instance.close.assert_called_once()
+
+
+@patch('dbt2lookml.generators.LookmlGenerator')
+def test_validate_skips_unchanged_output(mock_generator, tmp_path, monkeypatch):
+    """Test --validate only validates generated files that changed since the last run"""
+    monkeypatch.chdir(tmp_path)
+    mock_generator_instance = Mock()
+    mock_generator_instance.view_generator._generate_model_header_comment = Mock(return_value='')
+    mock_generator_instance.generate.return_value = ('test.view.lkml', {'view': [{'name': 'test'}]})
+    mock_generator.return_value = mock_generator_instance
+    cli = Cli()
+    args = cli._init_argparser().parse_args(['--target-dir', 'target', '--output-dir', 'output', '--validate'])
+
+    with patch('dbt2lookml.validation.LookMLStructureValidator') as mock_validator:
+        mock_validator.version = 'test'
+        mock_validator.return_value.validate.return_value = {'valid': True, 'errors': []}
+        cli.generate(args, [Mock(name='model1', unique_id='model.test.model1')])
+        cli.generate(args, [Mock(name='model1', unique_id='model.test.model1')])
+        assert mock_validator.return_value.validate.call_count == 1
+
+        mock_generator_instance.generate.return_value = ('test.view.lkml', {'view': [{'name': 'changed'}]})
+        cli.generate(args, [Mock(name='model1', unique_id='model.test.model1')])
+        assert mock_validator.return_value.validate.call_count == 2
+
+
+def test_write_lookml_file_to_absolute_output_dir(tmp_path):
+    """Test files are written inside an absolute output directory"""
+    written = Cli()._write_lookml_file(str(tmp_path), 'schema//orders.view.lkml', 'view: orders {}\n')
+    assert written == os.path.join(str(tmp_path), 'schema', 'orders.view.lkml')
+    assert (tmp_path / 'schema' / 'orders.view.lkml').read_text() == 'view: orders {}\n'
+
+
+@patch('dbt2lookml.generators.LookmlGenerator')
+def test_generate_records_shard_report(mock_generator, tmp_path):
+    """Test generated files are recorded in the shard report relative to the output directory"""
+    mock_generator_instance = Mock()
+    mock_generator_instance.view_generator._generate_model_header_comment = Mock(return_value='')
+    mock_generator_instance.generate.return_value = ('sales/orders.view.lkml', {'view': [{'name': 'orders'}]})
+    mock_generator.return_value = mock_generator_instance
+    cli = Cli()
+    args = cli._init_argparser().parse_args(['--output-dir', str(tmp_path), '--shard', '1/2'])
+    model = Mock(unique_id='model.test.orders', columns={})
+    model.name = 'orders'
+
+    shard_report = ShardReport(*args.shard)
+    cli.generate(args, [model], shard_report)
+    cli._write_shard_report(args, shard_report)
+
+    report = json.loads((tmp_path / '.dbt2lookml_shard_1_of_2.json').read_text())
+    assert report['shard'] == {'index': 1, 'count': 2}
+    assert report['models'] == [
+        {
+            'unique_id': 'model.test.orders',
+            'name': 'orders',
+            'weight': 1,
+            'status': 'written',
+            'file_path': os.path.join('sales', 'orders.view.lkml'),
+        }
+    ]
+
+
+@patch('dbt2lookml.generators.LookmlGenerator')
+def test_generate_releases_models_once_written(mock_generator, tmp_path):
+    """Test every model is passed to release after its file is written"""
+    mock_generator_instance = Mock()
+    mock_generator_instance.view_generator._generate_model_header_comment = Mock(return_value='')
+    mock_generator_instance.generate.side_effect = lambda model: (
+        f'sales/{model.name}.view.lkml',
+        {'view': [{'name': model.name}]},
+    )
+    mock_generator.return_value = mock_generator_instance
+    cli = Cli()
+    args = cli._init_argparser().parse_args(['--output-dir', str(tmp_path)])
+    models = [Mock(unique_id=f'model.test.{name}', columns={}) for name in ('orders', 'customers')]
+    for model, name in zip(models, ('orders', 'customers')):
+        model.name = name
+
+    released = []
+    cli.generate(
+        args,
+        models,
+        release=lambda model: released.append((model.name, (tmp_path / 'sales' / f'{model.name}.view.lkml').exists())),
+    )
+
+    assert released == [('orders', True), ('customers', True)]
+
+
+@patch('dbt2lookml.generators.LookmlGenerator')
+def test_generate_locale_writes_labels_of_written_files(mock_generator, tmp_path):
+    """Test --generate-locale writes the labels of the generated views to en.strings.json"""
+    mock_generator_instance = Mock()
+    mock_generator_instance.view_generator._generate_model_header_comment = Mock(return_value='')
+    mock_generator_instance.generate.return_value = (
+        'sales/orders.view.lkml',
+        {'view': [{'name': 'orders', 'label': 'Orders', 'dimensions': [{'name': 'id', 'label': 'Order ID'}]}]},
+    )
+    mock_generator.return_value = mock_generator_instance
+    cli = Cli()
+    args = cli._init_argparser().parse_args(['--output-dir', str(tmp_path), '--generate-locale'])
+    model = Mock(unique_id='model.test.orders', columns={})
+    model.name = 'orders'
+
+    cli.generate(args, [model])
+
+    assert json.loads((tmp_path / 'en.strings.json').read_text()) == {'Order ID': 'Order ID', 'Orders': 'Orders'}
+
+
+@patch('dbt2lookml.generators.LookmlGenerator')
+def test_table_name_suffixes_do_not_depend_on_generation_order(mock_generator, tmp_path):
+    """Test models sharing a table name keep their numbered file names when scheduled in another order"""
+    mock_generator_instance = Mock()
+    mock_generator_instance.view_generator._generate_model_header_comment = Mock(return_value='')
+    mock_generator_instance.generate.return_value = ('sales/orders.view.lkml', {'view': [{'name': 'orders'}]})
+    mock_generator_instance._get_file_path.return_value = 'sales/orders.view.lkml'
+    mock_generator.return_value = mock_generator_instance
+    cli = Cli()
+    args = cli._init_argparser().parse_args(['--output-dir', str(tmp_path), '--use-table-name'])
+    first = Mock(unique_id='model.test.orders', columns={})
+    first.name = 'orders'
+    second = Mock(unique_id='model.test.orders_v2', columns={})
+    second.name = 'orders_v2'
+
+    suffixes = cli._table_name_suffixes(args, [first, second])
+    assert suffixes == {'model.test.orders': 0, 'model.test.orders_v2': 1}
+
+    views = cli.generate(args, [second, first], table_name_suffixes=suffixes)
+    assert views == [
+        os.path.join(str(tmp_path), 'sales', 'orders.view_1.lkml'),
+        os.path.join(str(tmp_path), 'sales', 'orders.view.lkml'),
+    ]
+
+
+class TimingOutPool:
+    """Pool stand-in whose first model exceeds its time budget."""
+
+    held_back = 0
+
+    def render(self, models):
+        for index, model in enumerate(models):
+            if index == 0:
+                yield model, ModelTimeoutError(f'Generation of model {model.name} exceeded the time budget of 5s')
+            else:
+                yield model, (f'sales/{model.name}.view.lkml', {'view': [{'name': model.name}]}, f'view: {model.name} {{}}\n')
+
+
+def test_generate_records_timed_out_models(tmp_path):
+    """Test a timed out model is recorded as timeout and the run goes on with --continue-on-error"""
+    cli = Cli()
+    args = cli._init_argparser().parse_args(['--output-dir', str(tmp_path), '--continue-on-error', '--shard', '1/1'])
+    models = [Mock(unique_id=f'model.test.{name}', columns={}) for name in ('stuck', 'orders')]
+    for model, name in zip(models, ('stuck', 'orders')):
+        model.name = name
+
+    shard_report = ShardReport(1, 1)
+    views = cli.generate(args, models, shard_report, pool=TimingOutPool())
+
+    assert views == [os.path.join(str(tmp_path), 'sales', 'orders.view.lkml')]
+    assert [(model['name'], model['status']) for model in shard_report.models] == [('stuck', 'timeout'), ('orders', 'written')]
+
+
+def test_generate_stops_on_timeout_without_continue_on_error(tmp_path):
+    """Test a timed out model ends the run without --continue-on-error"""
+    cli = Cli()
+    args = cli._init_argparser().parse_args(['--output-dir', str(tmp_path)])
+    model = Mock(unique_id='model.test.stuck', columns={})
+    model.name = 'stuck'
+
+    with pytest.raises(ModelTimeoutError):
+        cli.generate(args, [model], pool=TimingOutPool())
@@ -0,0 +1,142 @@
+"""The daemon must answer with the files the CLI writes, and follow changes of the artifacts."""
+
+import os
+import socket
+import socketserver
+import stat
+import sys
+import threading
+
+import pytest
+
+from dbt2lookml.api import GenerateOptions
+from dbt2lookml.cli import Cli
+from dbt2lookml.daemon import ViewServer, ViewService, request_view
+from dbt2lookml.exceptions import CliError
+
+pytestmark = pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason='Unix sockets only')
+
+NAMES = ['orders', 'customers']
+
+
+@pytest.fixture
+def write_project(build_artifacts, write_artifacts):
+    """Write the project to a target directory, with a number of extra columns in every model."""
+
+    def write(target_dir, extra_columns=0):
+        write_artifacts(
+            target_dir, build_artifacts(NAMES, extra_columns=lambda i: {f'extra_{k}': 'STRING' for k in range(extra_columns)})
+        )
+
+    return write
+
+
+@pytest.fixture
+def target_dir(tmp_path, write_project):
+    target_dir = tmp_path / 'target'
+    write_project(target_dir)
+    return target_dir
+
+
+@pytest.fixture
+def service(target_dir):
+    service = ViewService(str(target_dir / 'manifest.json'), str(target_dir / 'catalog.json'), GenerateOptions())
+    yield service
+    service.close()
+
+
+def cli_files(monkeypatch, tmp_path, target_dir):
+    output_dir = tmp_path / 'cli'
+    monkeypatch.setattr(sys, 'argv', ['dbt2lookml', '--target-dir', str(target_dir), '--output-dir', str(output_dir)])
+    Cli().run()
+    return {str(path.relative_to(output_dir)): path.read_text() for path in output_dir.rglob('*.lkml')}
+
+
+class TestViewService:
+    def test_generates_the_files_the_cli_writes(self, tmp_path, monkeypatch, target_dir, service):
+        expected = cli_files(monkeypatch, tmp_path, target_dir)
+        views = [service.generate(name) for name in NAMES]
+        assert {view.relative_path: view.lookml_text for view in views} == expected
+
+    def test_finds_models_by_unique_id(self, service):
+        assert service.generate('model.shop.orders') == service.generate('orders')
+
+    def test_unknown_model(self, service):
+        with pytest.raises(CliError, match='Unknown model missing'):
+            service.generate('missing')
+
+    def test_closed(self, service):
+        service.close()
+        with pytest.raises(CliError, match='closed'):
+            service.generate('orders')
+
+    def test_reloads_changed_artifacts(self, target_dir, service, write_project):
+        assert 'extra_0' not in service.generate('orders').lookml_text
+        assert not service.reload_if_changed()
+        write_project(target_dir, extra_columns=1)
+        assert 'extra_0' in service.generate('orders').lookml_text
+
+    def test_keeps_the_loaded_artifacts_while_they_are_written(self, target_dir, service, write_project):
+        text = service.generate('orders').lookml_text
+        (target_dir / 'catalog.json').write_text('{"nodes": ')
+        with pytest.raises(CliError, match='Invalid JSON'):
+            service.generate('orders')
+        write_project(target_dir)
+        assert service.generate('orders').lookml_text == text
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    # Unix socket paths are limited to about 100 characters
+    return os.path.join(os.path.relpath(tmp_path), 'd.sock')
+
+
+@pytest.fixture
+def server(socket_path, service):
+    server = ViewServer(socket_path, service)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+class TestViewServer:
+    def test_answers_requests(self, socket_path, server, service):
+        view = request_view('orders', socket_path)
+        assert view == service.generate('orders')
+
+    def test_reports_errors(self, socket_path, server):
+        with pytest.raises(CliError, match='Unknown model missing'):
+            request_view('missing', socket_path)
+
+    def test_refuses_a_second_daemon(self, socket_path, server, service):
+        with pytest.raises(CliError, match='already listening'):
+            ViewServer(socket_path, service)
+
+    def test_replaces_a_stale_socket(self, socket_path, service):
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+        server = ViewServer(socket_path, service)
+        server.server_close()
+        assert not os.path.exists(socket_path)
+
+    def test_socket_is_private_from_its_creation(self, monkeypatch, socket_path, service):
+        modes = []
+        server_bind = socketserver.UnixStreamServer.server_bind
+
+        def bind(server):
+            server_bind(server)
+            modes.append(stat.S_IMODE(os.stat(server.server_address).st_mode))
+
+        monkeypatch.setattr(socketserver.UnixStreamServer, 'server_bind', bind)
+        server = ViewServer(socket_path, service)
+        server.server_close()
+        assert len(modes) == 1
+        assert modes[0] & 0o077 == 0
+
+    def test_no_daemon(self, socket_path):
+        with pytest.raises(CliError, match='No dbt2lookml daemon'):
+            request_view('orders', socket_path)
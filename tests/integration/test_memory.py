@@ -0,0 +1,58 @@
+"""Peak memory of a run must not grow with the number of selected models."""
+
+import subprocess
+import sys
+
+import pytest
+
+MODELS = 400
+CATALOG_COLUMNS = 50
+FEW_MODELS = 20
+
+# Runs the CLI in a fresh interpreter and prints its peak RSS in KB (Linux reports ru_maxrss in KB)
+RUN_AND_MEASURE = """
+import resource, sys
+from dbt2lookml.cli import main
+sys.argv = ['dbt2lookml'] + sys.argv[1:]
+main()
+print('PEAK_RSS_KB', resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def write_project(target_dir, build_artifacts, write_artifacts):
+    """Write a project where most columns only exist in the catalog, so every model creates new columns."""
+
+    def catalog_columns(i):
+        return {f'Column_{i}_{j}': ('STRING', 'INT64', 'TIMESTAMP', 'NUMERIC')[j % 4] for j in range(CATALOG_COLUMNS)}
+
+    def tags(i):
+        return ['few'] if i < FEW_MODELS else []
+
+    names = [f'model_{i}' for i in range(MODELS)]
+    write_artifacts(target_dir, build_artifacts(names, schema='big', extra_columns=catalog_columns, tags=tags))
+
+
+def peak_rss_mb(target_dir, output_dir, *args):
+    result = subprocess.run(
+        [sys.executable, '-c', RUN_AND_MEASURE, '--target-dir', str(target_dir), '--output-dir', str(output_dir), *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    peak_lines = [line for line in result.stdout.splitlines() if line.startswith('PEAK_RSS_KB')]
+    assert peak_lines, result.stdout + result.stderr
+    return int(peak_lines[-1].split()[1]) / 1024
+
+
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='ru_maxrss is reported in KB on Linux only')
+def test_peak_memory_does_not_grow_with_selected_models(tmp_path, build_artifacts, write_artifacts):
+    target_dir = tmp_path / 'target'
+    write_project(target_dir, build_artifacts, write_artifacts)
+
+    few = peak_rss_mb(target_dir, tmp_path / 'few', '--tag', 'few')
+    everything = peak_rss_mb(target_dir, tmp_path / 'all')
+
+    assert len(list((tmp_path / 'all').rglob('*.view.lkml'))) == MODELS
+    # Selecting 20x as many models may only cost per-model bookkeeping (paths, field names) and the bounded fragment cache;
+    # keeping every model with its catalog columns alive costs about 60 MB here
+    assert everything - few < 25, f'peak RSS {few:.1f} MB for {FEW_MODELS} models, {everything:.1f} MB for {MODELS}'
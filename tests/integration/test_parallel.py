@@ -0,0 +1,71 @@
+"""Generating in worker processes or threads must write the same files as generating in the main process."""
+
+import sys
+import tempfile
+
+import pytest
+
+from dbt2lookml.cli import Cli
+
+MODELS = 8
+
+
+def write_project(target_dir, build_artifacts, write_artifacts):
+    """Write a project of models with nested arrays of increasing width."""
+
+    def attributes(i):
+        return {f'attribute_{j}': 'STRING' for j in range(i * 10)}
+
+    write_artifacts(target_dir, build_artifacts([f'orders_{i}' for i in range(MODELS)], extra_columns=attributes))
+
+
+def run_cli(monkeypatch, *args):
+    monkeypatch.setattr(sys, 'argv', ['dbt2lookml', *args])
+    Cli().run()
+
+
+def lookml_files(output_dir):
+    return {str(path.relative_to(output_dir)): path.read_text() for path in sorted(output_dir.rglob('*.lkml'))}
+
+
+@pytest.mark.parametrize(
+    'pool_args', [['--workers', '2'], ['--workers', '3', '--max-tasks-per-worker', '1', '--memory-limit', '150']]
+)
+def test_workers_write_the_same_files(tmp_path, monkeypatch, build_artifacts, write_artifacts, pool_args):
+    target_dir = tmp_path / 'target'
+    write_project(target_dir, build_artifacts, write_artifacts)
+    # The catalog index of the worker processes is built in, and removed from, the temporary directory
+    index_dir = tmp_path / 'tmp'
+    index_dir.mkdir()
+    monkeypatch.setattr(tempfile, 'tempdir', str(index_dir))
+
+    run_cli(monkeypatch, '--target-dir', str(target_dir), '--output-dir', str(tmp_path / 'sequential'))
+    run_cli(monkeypatch, '--target-dir', str(target_dir), '--output-dir', str(tmp_path / 'parallel'), *pool_args)
+
+    sequential = lookml_files(tmp_path / 'sequential')
+    assert len(sequential) == MODELS
+    assert lookml_files(tmp_path / 'parallel') == sequential
+    assert list(index_dir.iterdir()) == []
+
+
+def test_threads_write_the_same_files_run_after_run(tmp_path, monkeypatch, build_artifacts, write_artifacts):
+    """Stress the threads backend: more threads than models share one parser, catalog index and fragment caches."""
+    target_dir = tmp_path / 'target'
+    write_project(target_dir, build_artifacts, write_artifacts)
+
+    run_cli(monkeypatch, '--target-dir', str(target_dir), '--output-dir', str(tmp_path / 'sequential'))
+    sequential = lookml_files(tmp_path / 'sequential')
+    for run in range(5):
+        output_dir = tmp_path / f'threads_{run}'
+        run_cli(
+            monkeypatch,
+            '--target-dir',
+            str(target_dir),
+            '--output-dir',
+            str(output_dir),
+            '--backend',
+            'threads',
+            '--workers',
+            str(MODELS + 4),
+        )
+        assert lookml_files(output_dir) == sequential
@@ -0,0 +1,35 @@
+"""The entry point must not import heavy dependencies until they are needed."""
+
+import subprocess
+import sys
+
+# Imported lazily by the CLI, each costs tens of milliseconds at startup
+HEAVY_MODULES = ('yaml', 'rich', 'lkml', 'pydantic', 'dbt2lookml.generators', 'dbt2lookml.validation', 'importlib.metadata')
+
+LOADED_AFTER_HELP = """
+import sys
+from dbt2lookml.cli import main
+sys.argv = ['dbt2lookml', '--help']
+try:
+    main()
+except SystemExit:
+    pass
+print('LOADED', ' '.join(sorted(sys.modules)))
+"""
+
+
+def test_help_does_not_import_heavy_modules():
+    result = subprocess.run([sys.executable, '-c', LOADED_AFTER_HELP], capture_output=True, text=True, check=True)
+    loaded = set(result.stdout.split('LOADED', 1)[1].split())
+    assert not loaded & set(HEAVY_MODULES)
+
+
+def test_importing_models_defers_schema_building():
+    code = (
+        "from dbt2lookml.models.dbt import DbtModel, DbtManifest\n"
+        "print(DbtModel.__pydantic_complete__, DbtManifest.__pydantic_complete__)\n"
+        "DbtModel(name='m', unique_id='model.p.m', relation_name='m', schema='s', description='', columns={}, tags=[], path='m.sql')\n"
+        "print(DbtModel.__pydantic_complete__)"
+    )
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ['False', 'False', 'True']
@@ -0,0 +1,71 @@
+"""Tests for the label table written to the locale strings file."""
+
+import json
+
+from dbt2lookml.locale_strings import LabelTable
+
+LOOKML = {
+    'view': [
+        {
+            'name': 'orders',
+            'label': 'Orders',
+            'dimensions': [
+                {'name': 'id', 'label': 'Order ID'},
+                {'name': 'items__sku', 'label': 'Sku', 'group_label': 'Items', 'group_item_label': 'Sku'},
+            ],
+            'dimension_groups': [{'name': 'created', 'label': 'Created', 'group_label': 'Created'}],
+            'measures': [{'name': 'count', 'type': 'count'}],
+        },
+        {'name': 'orders__items', 'label': 'Orders: Items'},
+    ],
+    'explore': {'name': 'orders', 'label': 'Orders', 'joins': [{'name': 'orders__items', 'view_label': 'Orders: Items'}]},
+}
+
+
+class TestLabelTable:
+    def test_collects_labels_of_views_fields_explores_and_joins_once(self, tmp_path):
+        table = LabelTable(str(tmp_path))
+        table.add_lookml(LOOKML)
+        table.add_lookml(LOOKML)
+        table.write()
+        assert json.loads((tmp_path / 'en.strings.json').read_text()) == {
+            'Created': 'Created',
+            'Items': 'Items',
+            'Order ID': 'Order ID',
+            'Orders': 'Orders',
+            'Orders: Items': 'Orders: Items',
+            'Sku': 'Sku',
+        }
+
+    def test_written_file_is_sorted_json(self, tmp_path):
+        table = LabelTable(str(tmp_path))
+        for label in ('Zeta "quoted"', 'Ünïcode', 'Alpha'):
+            table.add(label)
+        table.add('')
+        table.add(None)
+        table.write()
+        text = (tmp_path / 'en.strings.json').read_text(encoding='utf-8')
+        assert list(json.loads(text)) == ['Alpha', 'Zeta "quoted"', 'Ünïcode']
+        assert 'Ünïcode' in text
+        assert not (tmp_path / 'en.strings.json.tmp').exists()
+
+    def test_empty_table(self, tmp_path):
+        LabelTable(str(tmp_path)).write()
+        assert json.loads((tmp_path / 'en.strings.json').read_text()) == {}
+
+    def test_incremental_runs_merge_the_earlier_file(self, tmp_path):
+        (tmp_path / 'en.strings.json').write_text(json.dumps({'Orders': 'Customer orders', 'Customers': 'Customers'}))
+        table = LabelTable(str(tmp_path))
+        assert table.previous_count == 2
+        table.add_lookml(LOOKML)
+        table.write()
+        strings = json.loads((tmp_path / 'en.strings.json').read_text())
+        assert strings['Orders'] == 'Customer orders'
+        assert strings['Customers'] == 'Customers'
+        assert strings['Order ID'] == 'Order ID'
+        assert len(table) == 7
+
+    def test_unreadable_earlier_file_is_ignored(self, tmp_path):
+        (tmp_path / 'en.strings.json').write_text('{not json')
+        table = LabelTable(str(tmp_path))
+        assert len(table) == 0
@@ -0,0 +1,109 @@
+"""Tests for queue-based logging, its formatters and rate limiting."""
+
+import json
+import logging
+
+import pytest
+
+from dbt2lookml.logs import JsonLinesFormatter, QueueLogging, RateLimitFilter
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def make_record(msg, *args, lineno=10, level=logging.INFO, **attributes):
+    record = logging.LogRecord('dbt2lookml', level, '/src/cli.py', lineno, msg, args, None)
+    record.__dict__.update(attributes)
+    return record
+
+
+@pytest.fixture
+def queue_logging():
+    handler = CollectingHandler()
+    queue_logging = QueueLogging(handler, rate_limit=2)
+    logger = logging.getLogger('dbt2lookml.test_logs')
+    logger.setLevel(logging.DEBUG)
+    queue_logging.start()
+    yield logger, handler, queue_logging
+    queue_logging.stop()
+
+
+class TestJsonLinesFormatter:
+    def test_formats_one_json_object_per_record(self):
+        line = JsonLinesFormatter().format(make_record('Generated %s', 'a\nb.view.lkml', level=logging.WARNING))
+        assert '\n' not in line
+        entry = json.loads(line)
+        assert entry['level'] == 'WARNING'
+        assert entry['logger'] == 'dbt2lookml'
+        assert entry['message'] == 'Generated a\nb.view.lkml'
+        assert entry['time'].endswith('+00:00')
+
+
+class TestRateLimitFilter:
+    def test_limits_each_call_site(self):
+        rate_limit = RateLimitFilter(limit=2)
+        passed = [rate_limit.filter(make_record('Model %s', i)) for i in range(5)]
+        assert passed == [True, True, False, False, False]
+        assert rate_limit.filter(make_record('Other', lineno=11))
+        assert rate_limit.suppressed == {'cli:10': 3}
+        assert rate_limit.templates == {'cli:10': 'Model %s'}
+
+    def test_explicit_category(self):
+        rate_limit = RateLimitFilter(limit=1)
+        assert rate_limit.filter(make_record('a', category='model_1'))
+        assert rate_limit.filter(make_record('b', category='model_2'))
+        assert not rate_limit.filter(make_record('c', category='model_1'))
+
+    def test_warnings_and_errors_are_never_suppressed(self):
+        rate_limit = RateLimitFilter(limit=1)
+        assert rate_limit.filter(make_record('Model %s', 0))
+        for level in (logging.WARNING, logging.ERROR, logging.CRITICAL):
+            assert all(rate_limit.filter(make_record('Failed to generate %s', i, level=level)) for i in range(5))
+        assert not rate_limit.filter(make_record('Model %s', 1))
+        assert rate_limit.suppressed == {'cli:10': 1}
+
+    def test_window_resets(self):
+        rate_limit = RateLimitFilter(limit=1, interval=0)
+        assert all(rate_limit.filter(make_record('Model %s', i)) for i in range(3))
+
+
+class TestQueueLogging:
+    def test_records_reach_the_handler_by_the_time_it_stops(self, queue_logging):
+        logger, handler, queue_logging = queue_logging
+        logger.info('Generated %s', 'orders.view.lkml')
+        queue_logging.stop()
+        assert [record.getMessage() for record in handler.records] == ['Generated orders.view.lkml']
+
+    def test_message_is_rendered_when_logged(self, queue_logging):
+        logger, handler, queue_logging = queue_logging
+        dimension = {'name': 'id'}
+        logger.debug('Created dimension %s', dimension)
+        dimension['name'] = 'changed'
+        queue_logging.stop()
+        assert handler.records[0].getMessage() == "Created dimension {'name': 'id'}"
+
+    def test_suppressed_records_are_summarized(self, queue_logging):
+        logger, handler, queue_logging = queue_logging
+        for i in range(5):
+            logger.info('Dangling reference %s', i)
+        queue_logging.stop()
+        messages = [record.getMessage() for record in handler.records]
+        assert messages[:2] == ['Dangling reference 0', 'Dangling reference 1']
+        assert len(messages) == 3
+        assert messages[2].startswith("Suppressed 3 log records from test_logs:")
+        assert "('Dangling reference %s')" in messages[2]
+
+    def test_errors_are_never_suppressed(self, queue_logging):
+        logger, handler, queue_logging = queue_logging
+        for i in range(5):
+            logger.error('Failed to generate view for model model_%s', i)
+        queue_logging.stop()
+        assert [record.getMessage() for record in handler.records] == [
+            f'Failed to generate view for model model_{i}' for i in range(5)
+        ]
@@ -0,0 +1,83 @@
+"""Tests for the output manifest used to find stale files."""
+
+import json
+
+import pytest
+
+from dbt2lookml.output_manifest import OUTPUT_MANIFEST_FILE, OutputManifest
+
+
+@pytest.fixture
+def output_dir(tmp_path):
+    for file_path in ('sub/orders.view.lkml', 'sub/customers.view.lkml', 'sub/items.view.lkml'):
+        (tmp_path / file_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file_path).write_text('view: x {}\n')
+    manifest = OutputManifest(str(tmp_path))
+    manifest.record('model.p.orders', 'sub/orders.view.lkml')
+    manifest.record('model.p.customers', 'sub//customers.view.lkml')
+    manifest.record('model.p.items', 'sub/items.view.lkml')
+    manifest.save()
+    return tmp_path
+
+
+class TestOutputManifest:
+    def test_saved_files_are_keyed_by_unique_id(self, output_dir):
+        saved = json.loads((output_dir / OUTPUT_MANIFEST_FILE).read_text())
+        assert saved == {
+            'files': {
+                'model.p.customers': 'sub/customers.view.lkml',
+                'model.p.items': 'sub/items.view.lkml',
+                'model.p.orders': 'sub/orders.view.lkml',
+            },
+            'stale': [],
+        }
+
+    def test_renamed_and_deleted_models_leave_stale_files(self, output_dir):
+        manifest = OutputManifest(str(output_dir))
+        manifest.record('model.p.orders', 'sub/orders_v2.view.lkml')
+        # customers was deleted from the dbt project, items was filtered out of this run
+        known_unique_ids = {'model.p.orders', 'model.p.items'}
+        assert manifest.stale_files(known_unique_ids) == ['sub/customers.view.lkml', 'sub/orders.view.lkml']
+
+    def test_without_known_models_only_renamed_files_are_stale(self, output_dir):
+        manifest = OutputManifest(str(output_dir))
+        manifest.record('model.p.orders', 'sub/orders_v2.view.lkml')
+        assert manifest.stale_files() == ['sub/orders.view.lkml']
+
+    def test_reported_stale_files_are_reported_again_until_removed(self, output_dir):
+        manifest = OutputManifest(str(output_dir))
+        manifest.record('model.p.orders', 'sub/orders_v2.view.lkml')
+        stale_files = manifest.stale_files()
+        manifest.save(stale_files=stale_files)
+
+        manifest = OutputManifest(str(output_dir))
+        manifest.record('model.p.orders', 'sub/orders_v2.view.lkml')
+        stale_files = manifest.stale_files()
+        assert stale_files == ['sub/orders.view.lkml']
+        assert manifest.remove_files(stale_files) == stale_files
+        assert not (output_dir / 'sub' / 'orders.view.lkml').exists()
+        manifest.save(stale_files=[])
+
+        assert OutputManifest(str(output_dir)).stale_files() == []
+
+    def test_unreadable_manifest_is_ignored(self, tmp_path):
+        (tmp_path / OUTPUT_MANIFEST_FILE).write_text('not json')
+        assert OutputManifest(str(tmp_path)).stale_files() == []
+
+    def test_absolute_paths_outside_output_dir_are_not_removed(self, output_dir, tmp_path_factory, caplog):
+        outside = tmp_path_factory.mktemp('outside') / 'orders.view.lkml'
+        outside.write_text('view: x {}\n')
+        manifest = OutputManifest(str(output_dir))
+        assert manifest.remove_files([str(outside), 'sub/items.view.lkml']) == ['sub/items.view.lkml']
+        assert outside.exists()
+        assert not (output_dir / 'sub' / 'items.view.lkml').exists()
+        assert 'outside of the output directory' in caplog.text
+
+    def test_relative_paths_escaping_output_dir_are_not_removed(self, output_dir, caplog):
+        project_dir = output_dir / 'project'
+        (project_dir / 'output').mkdir(parents=True)
+        (project_dir / 'dbt_project.yml').write_text('name: p\n')
+        manifest = OutputManifest(str(project_dir / 'output'))
+        assert manifest.remove_files(['../dbt_project.yml', '..']) == []
+        assert (project_dir / 'dbt_project.yml').exists()
+        assert caplog.text.count('outside of the output directory') == 2
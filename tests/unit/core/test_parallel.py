@@ -0,0 +1,225 @@
+"""Tests for admission control and error handling of the generation pool."""
+
+import logging
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from dbt2lookml import parallel
+from dbt2lookml.exceptions import ModelTimeoutError
+from dbt2lookml.parallel import WORKER_BASE_MEMORY, GenerationPool, estimated_memory
+
+
+def make_model(name, cost):
+    return SimpleNamespace(unique_id=f'model.p.{name}', name=name, cost=cost)
+
+
+class RecordingRenderer:
+    """Stand-in for the worker function, tracking the estimated memory rendered at once."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.started = []
+        self.stuck_for = 0
+
+    def __call__(self, args, model):
+        if model.name == 'broken':
+            raise ValueError('cannot render')
+        if model.name == 'stuck':
+            time.sleep(self.stuck_for)
+        with self.lock:
+            self.started.append(model.name)
+            self.in_flight += estimated_memory(model.cost)
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(0.02 if model.cost > 1000 else 0.005)
+        with self.lock:
+            self.in_flight -= estimated_memory(model.cost)
+        return (f'{model.name}.view.lkml', {}, '')
+
+
+@pytest.fixture
+def renderer(monkeypatch):
+    renderer = RecordingRenderer()
+    monkeypatch.setattr(parallel, '_render_in_worker', renderer)
+    # Threads stand in for worker processes, so the test renderer needs no pickling
+    monkeypatch.setattr(GenerationPool, '_start_executor', lambda self: ThreadPoolExecutor(max_workers=self._workers))
+    return renderer
+
+
+def memory_limit_mb(workers, budget):
+    return -(-(workers * WORKER_BASE_MEMORY + budget) // (1024 * 1024))
+
+
+class TestGenerationPool:
+    def test_renders_every_model(self, renderer):
+        models = [make_model(f'm{i}', 10) for i in range(20)]
+        pool = GenerationPool(None, 4, lambda model: model.cost)
+        results = dict((model.name, result) for model, result in pool.render(models))
+        assert sorted(results) == sorted(model.name for model in models)
+        assert results['m3'] == ('m3.view.lkml', {}, '')
+
+    def test_stays_within_the_memory_limit(self, renderer):
+        large = [make_model(f'large_{i}', 2000) for i in range(4)]
+        small = [make_model(f'small_{i}', 10) for i in range(20)]
+        # Room for two large models at a time
+        limit = memory_limit_mb(4, estimated_memory(2000) * 2 + estimated_memory(10) * 4)
+        pool = GenerationPool(None, 4, lambda model: model.cost, memory_limit_mb=limit)
+        assert len(list(pool.render(large + small))) == 24
+        assert renderer.peak <= estimated_memory(2000) * 2 + estimated_memory(10) * 4
+        assert pool.held_back > 0
+
+    def test_smaller_models_go_ahead_of_held_back_ones(self, renderer):
+        models = [make_model('large_0', 2000), make_model('large_1', 2000), make_model('small_0', 10), make_model('small_1', 10)]
+        limit = memory_limit_mb(2, estimated_memory(2000) + estimated_memory(10))
+        pool = GenerationPool(None, 2, lambda model: model.cost, memory_limit_mb=limit)
+        list(pool.render(models))
+        assert renderer.started[:2] == ['large_0', 'small_0']
+        assert renderer.peak <= estimated_memory(2000) + estimated_memory(10)
+
+    def test_model_above_the_limit_runs_alone(self, renderer):
+        models = [make_model('huge', 100000), make_model('small', 10)]
+        pool = GenerationPool(None, 2, lambda model: model.cost, memory_limit_mb=memory_limit_mb(2, 0) + 1)
+        assert [model.name for model, _ in pool.render(models)] == ['huge', 'small']
+        assert renderer.peak == estimated_memory(100000)
+
+    def test_errors_are_yielded_with_their_model(self, renderer):
+        models = [make_model('ok', 10), make_model('broken', 10)]
+        results = dict((model.name, result) for model, result in GenerationPool(None, 2, lambda model: 1).render(models))
+        assert isinstance(results['broken'], ValueError)
+        assert results['ok'][0] == 'ok.view.lkml'
+
+    def test_models_over_the_time_budget_time_out(self, renderer):
+        models = [make_model('stuck', 10), make_model('ok', 10)]
+        renderer.stuck_for = 0.5
+        pool = GenerationPool(None, 2, lambda model: 1, model_timeout=0.1)
+        results = dict((model.name, result) for model, result in pool.render(models))
+        assert isinstance(results['stuck'], ModelTimeoutError)
+        assert 'time budget of 0.1s' in str(results['stuck'])
+        assert results['ok'][0] == 'ok.view.lkml'
+
+
+class TestThreadsBackend:
+    def test_renders_in_threads(self, monkeypatch):
+        renderer = RecordingRenderer()
+        monkeypatch.setattr(parallel, '_render_in_worker', renderer)
+        models = [make_model(f'm{i}', 10) for i in range(12)]
+        pool = GenerationPool(None, 4, lambda model: model.cost, max_tasks_per_worker=1, backend='threads')
+        assert sorted(model.name for model, _ in pool.render(models)) == sorted(model.name for model in models)
+        assert renderer.peak > estimated_memory(10)
+
+    def test_timed_out_models_are_reported_and_the_others_finish(self, monkeypatch):
+        renderer = RecordingRenderer()
+        renderer.stuck_for = 0.5
+        monkeypatch.setattr(parallel, '_render_in_worker', renderer)
+        models = [make_model('stuck', 10)] + [make_model(f'm{i}', 10) for i in range(3)]
+        pool = GenerationPool(None, 2, lambda model: 1, model_timeout=0.2, backend='threads')
+        results = dict((model.name, result) for model, result in pool.render(models))
+        assert isinstance(results['stuck'], ModelTimeoutError)
+        assert [results[f'm{i}'][0] for i in range(3)] == ['m0.view.lkml', 'm1.view.lkml', 'm2.view.lkml']
+
+    def test_the_process_exits_without_waiting_for_timed_out_models(self):
+        script = textwrap.dedent("""
+            import time
+            from types import SimpleNamespace
+            from dbt2lookml import parallel
+
+            def render(args, model):
+                time.sleep(120 if model.name == 'stuck' else 0)
+                return (f'{model.name}.view.lkml', {}, '')
+
+            parallel._render_in_worker = render
+            models = [SimpleNamespace(unique_id=f'model.p.{name}', name=name) for name in ['stuck', 'm0', 'm1']]
+            pool = parallel.GenerationPool(None, 2, lambda model: 1, model_timeout=0.2, backend='threads')
+            print(sorted(type(result).__name__ for _, result in pool.render(models)))
+            """)
+        start = time.monotonic()
+        completed = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, timeout=60)
+        assert time.monotonic() - start < 30
+        assert completed.returncode == 0, completed.stderr
+        assert completed.stdout.strip() == "['ModelTimeoutError', 'tuple', 'tuple']"
+
+    def test_every_thread_keeps_its_own_fragment_cache(self, monkeypatch):
+        from dbt2lookml.cli import Cli
+
+        caches = []
+        monkeypatch.setattr(Cli, '_render_model', staticmethod(lambda args, model, fragment_cache: caches.append(fragment_cache)))
+        barrier = threading.Barrier(3)
+
+        def render():
+            barrier.wait()
+            parallel._render_in_worker(None, make_model('m', 1))
+            parallel._render_in_worker(None, make_model('m', 1))
+
+        threads = [threading.Thread(target=render) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(caches) == 6
+        assert len(set(map(id, caches))) == 3
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match='Unknown backend fibers'):
+            GenerationPool(None, 2, lambda model: 1, backend='fibers')
+
+
+# Spawned workers import this module for its worker functions: a slow import stands in for slowly starting workers
+if os.environ.get('DBT2LOOKML_TEST_WORKER_IMPORT_DELAY'):
+    time.sleep(float(os.environ['DBT2LOOKML_TEST_WORKER_IMPORT_DELAY']))
+
+
+def render_or_hang(args, model):
+    """Worker function of the process test, importable by spawned workers."""
+    if model.name == 'stuck':
+        time.sleep(120)
+    return (f'{model.name}.view.lkml', {}, '')
+
+
+def test_timed_out_workers_are_terminated(monkeypatch):
+    monkeypatch.setattr(parallel, '_render_in_worker', render_or_hang)
+    models = [make_model('stuck', 10)] + [make_model(f'm{i}', 10) for i in range(3)]
+    pool = GenerationPool(None, 2, lambda model: 1, model_timeout=2)
+    start = time.monotonic()
+    results = dict((model.name, result) for model, result in pool.render(models))
+    assert time.monotonic() - start < 60
+    assert isinstance(results['stuck'], ModelTimeoutError)
+    assert [results[f'm{i}'][0] for i in range(3)] == ['m0.view.lkml', 'm1.view.lkml', 'm2.view.lkml']
+
+
+def test_time_budget_starts_when_a_worker_starts_the_model(monkeypatch):
+    monkeypatch.setenv('DBT2LOOKML_TEST_WORKER_IMPORT_DELAY', '3')
+    monkeypatch.setattr(parallel, '_render_in_worker', render_or_hang)
+    pool = GenerationPool(None, 2, lambda model: 1, model_timeout=1.5)
+    results = dict((model.name, result) for model, result in pool.render([make_model(f'm{i}', 10) for i in range(3)]))
+    assert [results[f'm{i}'][0] for i in range(3)] == ['m0.view.lkml', 'm1.view.lkml', 'm2.view.lkml']
+
+
+def render_and_log(args, model):
+    """Worker function of the logging test, importable by spawned workers."""
+    logging.getLogger('dbt2lookml.worker').debug('Rendering %s', model.name)
+    logging.getLogger('dbt2lookml.worker').warning('Odd column in %s', model.name)
+    return (f'{model.name}.view.lkml', {}, '')
+
+
+def test_worker_records_are_logged_in_the_main_process(monkeypatch, caplog):
+    monkeypatch.setattr(parallel, '_render_in_worker', render_and_log)
+    caplog.set_level(logging.DEBUG)
+    pool = GenerationPool(None, 2, lambda model: 1, model_timeout=60)
+    assert len(list(pool.render([make_model(f'm{i}', 10) for i in range(3)]))) == 3
+    records = [record for record in caplog.records if record.name == 'dbt2lookml.worker']
+    assert sorted(record.getMessage() for record in records if record.levelno == logging.DEBUG) == [
+        'Rendering m0',
+        'Rendering m1',
+        'Rendering m2',
+    ]
+    assert len([record for record in records if record.levelno == logging.WARNING]) == 3
+    assert all(record.process != os.getpid() for record in records)
@@ -0,0 +1,107 @@
+"""Tests for the cost model and largest-first schedule."""
+
+import logging
+from types import SimpleNamespace
+
+from dbt2lookml.models.column_collections import ColumnCollections, ColumnCostStats
+from dbt2lookml.scheduling import estimate_cost, schedule_models
+
+
+def make_model(name, column_types):
+    return SimpleNamespace(unique_id=f'model.p.{name}', name=name, column_types=column_types)
+
+
+def flat(columns):
+    return {f'c{i}': 'STRING' for i in range(columns)}
+
+
+def item_master(arrays, fields_per_array):
+    column_types = {'id': 'INT64'}
+    for a in range(arrays):
+        column_types[f'records_{a}'] = 'ARRAY'
+        column_types.update({f'records_{a}.attributes.field_{i}': 'STRING' for i in range(fields_per_array)})
+    return column_types
+
+
+class TestCostStats:
+    def test_counts_arrays_nesting_and_columns(self):
+        stats = ColumnCollections.cost_stats(
+            {'id': 'INT64', 'items': 'ARRAY', 'items.sku': 'STRING', 'items.price.amount': 'NUMERIC', 'address': None}
+        )
+        assert stats == ColumnCostStats(columns=5, arrays=1, nested_columns=2, max_depth=2)
+
+    def test_flat_models(self):
+        assert ColumnCollections.cost_stats(flat(3)) == ColumnCostStats(3, 0, 0, 0)
+
+
+class TestEstimateCost:
+    def test_grows_with_columns_arrays_and_depth(self):
+        assert estimate_cost(ColumnCostStats(0, 0, 0, 0)) == 1
+        flat_cost = estimate_cost(ColumnCostStats(100, 0, 0, 0))
+        nested_cost = estimate_cost(ColumnCostStats(100, 0, 50, 1))
+        deeper_cost = estimate_cost(ColumnCostStats(100, 0, 50, 4))
+        array_cost = estimate_cost(ColumnCostStats(100, 5, 50, 4))
+        assert flat_cost < nested_cost < deeper_cost < array_cost
+
+
+class TestSchedule:
+    def test_dispatches_the_most_expensive_models_first(self):
+        models = [make_model(f'small_{i}', flat(20)) for i in range(10)]
+        models.insert(3, make_model('item_master', item_master(30, 130)))
+        models.append(make_model('medium', flat(400)))
+        schedule = schedule_models(models, lambda model: model.column_types)
+        assert [model.name for model in schedule.models[:2]] == ['item_master', 'medium']
+        assert sorted(schedule.models, key=lambda model: model.name) == sorted(models, key=lambda model: model.name)
+
+    def test_order_does_not_depend_on_input_order(self):
+        models = [make_model(f'm{i}', flat(10 + i % 3)) for i in range(12)]
+        forward = schedule_models(models, lambda model: model.column_types).models
+        backward = schedule_models(list(reversed(models)), lambda model: model.column_types).models
+        assert forward == backward
+
+    def test_records_decisions(self):
+        models = [make_model('small', flat(2)), make_model('nested', item_master(1, 3))]
+        schedule = schedule_models(models, lambda model: model.column_types)
+        assert schedule.decisions() == [
+            {
+                'position': 1,
+                'unique_id': 'model.p.nested',
+                'name': 'nested',
+                'cost': schedule.cost(models[1]),
+                'columns': 5,
+                'arrays': 1,
+                'nested_columns': 3,
+                'max_depth': 2,
+            },
+            {
+                'position': 2,
+                'unique_id': 'model.p.small',
+                'name': 'small',
+                'cost': 2,
+                'columns': 2,
+                'arrays': 0,
+                'nested_columns': 0,
+                'max_depth': 0,
+            },
+        ]
+
+    def test_logs_decisions_at_debug_level(self, caplog):
+        models = [make_model('small', flat(2)), make_model('nested', item_master(1, 3))]
+        schedule = schedule_models(models, lambda model: model.column_types)
+        with caplog.at_level(logging.INFO):
+            schedule.log_decisions()
+        assert caplog.messages == []
+        with caplog.at_level(logging.DEBUG):
+            schedule.log_decisions()
+        assert caplog.messages == [
+            f'Schedule 1: nested, cost {schedule.cost(models[1])} (5 columns, 1 arrays, 3 nested columns, depth 2)',
+            'Schedule 2: small, cost 2 (2 columns, 0 arrays, 0 nested columns, depth 0)',
+        ]
+
+    def test_narrowed_schedule_keeps_order_and_estimates(self):
+        models = [make_model(f'm{i}', flat(i + 1)) for i in range(6)]
+        schedule = schedule_models(models, lambda model: model.column_types)
+        narrowed = schedule.only(models[::2])
+        assert [model.name for model in narrowed.models] == ['m4', 'm2', 'm0']
+        assert [decision['position'] for decision in narrowed.decisions()] == [1, 2, 3]
+        assert narrowed.cost(models[4]) == schedule.cost(models[4])
@@ -0,0 +1,112 @@
+"""Tests for deterministic sharding and shard report merging."""
+
+import argparse
+import json
+import random
+from types import SimpleNamespace
+
+import pytest
+
+from dbt2lookml.sharding import ShardReport, assign_shards, merge_shard_reports, shard_models, shard_spec
+
+
+def make_model(name, columns):
+    return SimpleNamespace(unique_id=f'model.p.{name}', name=name, columns={f'c{i}': None for i in range(columns)})
+
+
+@pytest.fixture
+def models():
+    return [make_model(f'm{i}', (i * 7) % 23) for i in range(40)]
+
+
+class TestShardSpec:
+    def test_parses_index_and_count(self):
+        assert shard_spec('2/4') == (2, 4)
+
+    @pytest.mark.parametrize('value', ['2', '0/4', '5/4', '1/0', 'a/b', '1/2/3'])
+    def test_rejects_invalid_specs(self, value):
+        with pytest.raises(argparse.ArgumentTypeError):
+            shard_spec(value)
+
+
+class TestShardModels:
+    def test_shards_partition_the_models(self, models):
+        shards = [shard_models(models, index, 3) for index in (1, 2, 3)]
+        unique_ids = [model.unique_id for shard in shards for model in shard]
+        assert sorted(unique_ids) == sorted(model.unique_id for model in models)
+
+    def test_assignment_does_not_depend_on_model_order(self, models):
+        shuffled = list(models)
+        random.Random(0).shuffle(shuffled)
+        assert assign_shards(shuffled, 4) == assign_shards(models, 4)
+
+    def test_shard_keeps_original_order(self, models):
+        shard = shard_models(models, 2, 3)
+        assert shard == [model for model in models if model in shard]
+
+    def test_shards_are_balanced_by_column_count(self, models):
+        weights = [sum(max(1, len(model.columns)) for model in shard_models(models, index, 4)) for index in range(1, 5)]
+        assert max(weights) - min(weights) <= max(max(1, len(model.columns)) for model in models)
+
+    def test_more_shards_than_models(self):
+        models = [make_model('a', 3), make_model('b', 1)]
+        assert [len(shard_models(models, index, 4)) for index in range(1, 5)] == [1, 1, 0, 0]
+
+
+class TestShardReport:
+    def test_weights_are_the_ones_shards_were_balanced_by(self, models):
+        def cost(model):
+            return 3 * len(model.columns) + 2
+
+        shard = shard_models(models, 1, 2, cost)
+        report = ShardReport(1, 2, cost)
+        for model in shard:
+            report.record(model, 'written')
+        assert [model['weight'] for model in report.models] == [cost(model) for model in shard]
+        assert report.to_dict()['totals']['weight'] == sum(cost(model) for model in shard)
+
+
+class TestMergeShardReports:
+    def write_reports(self, tmp_path, outcomes, count=2):
+        reports = []
+        for index, models in outcomes.items():
+            report = ShardReport(index, count)
+            for name, status, file_path in models:
+                report.record(make_model(name, 2), status, file_path)
+            path = tmp_path / f'shard_{index}.json'
+            report.write(str(path))
+            reports.append(json.loads(path.read_text()))
+        return reports
+
+    def test_merges_consistent_shards(self, tmp_path):
+        reports = self.write_reports(
+            tmp_path,
+            {
+                1: [('orders', 'written', 'sales/orders.view.lkml')],
+                2: [('items', 'written', 'sales/items.view.lkml'), ('broken', 'failed', None)],
+            },
+        )
+        merged = merge_shard_reports(reports)
+        assert merged['totals'] == {'models': 3, 'written': 2, 'failed': 1}
+        assert [model['name'] for model in merged['models']] == ['orders', 'items', 'broken']
+        assert merged['collisions'] == {}
+        assert merged['missing_shards'] == []
+        assert merged['duplicate_models'] == {}
+
+    def test_detects_cross_shard_path_collisions(self, tmp_path):
+        reports = self.write_reports(
+            tmp_path,
+            {
+                1: [('orders', 'written', 'sales/orders.view.lkml')],
+                2: [('orders_v2', 'written', 'sales/orders.view.lkml')],
+            },
+        )
+        assert merge_shard_reports(reports)['collisions'] == {'sales/orders.view.lkml': ['model.p.orders', 'model.p.orders_v2']}
+
+    def test_detects_missing_and_overlapping_shards(self, tmp_path):
+        reports = self.write_reports(tmp_path, {1: [('orders', 'written', 'a.view.lkml')]}, count=3)
+        reports += reports
+        merged = merge_shard_reports(reports)
+        assert merged['missing_shards'] == [2, 3]
+        assert merged['duplicate_shards'] == [1]
+        assert merged['duplicate_models'] == {'model.p.orders': [1, 1]}
@@ -0,0 +1,385 @@
+"""Tests for the single-pass LookML validator."""
+
+import time
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from dbt2lookml.generators import LookmlGenerator
+from dbt2lookml.models.dbt import DbtModel
+from dbt2lookml.validation import VALIDATION_CACHE_FILE, FieldReferenceIndex, LookMLStructureValidator, LookMLValidator
+
+FIXTURES_DIR = Path(__file__).parents[2] / 'fixtures' / 'expected'
+
+
+@pytest.fixture
+def validator():
+    return LookMLValidator()
+
+
+def failing_worker(files, directory):
+    raise RuntimeError('worker died')
+
+
+def errors_of(validator, content):
+    return validator.validate_lookml_string(content)['errors']
+
+
+class TestLookMLValidator:
+    @pytest.mark.parametrize('path', sorted(FIXTURES_DIR.glob('*.lkml')), ids=lambda path: path.name)
+    def test_expected_fixtures_are_valid(self, validator, path):
+        result = validator.validate_lookml_string(path.read_text())
+        assert result['valid'] and result['errors'] == []
+
+    def test_set_blocks_and_lists(self, validator):
+        content = '''view: orders {
+  # Fields shown in drill downs
+  set: detail {
+    fields: [id, customer.name, "label with { brace"]
+  }
+  dimension: id {
+    filters: [status: "-cancelled", amount: ">0"]
+    sql: ${TABLE}.id ;;
+  }
+}
+'''
+        assert errors_of(validator, content) == []
+
+    def test_braces_and_comments_inside_sql_are_ignored(self, validator):
+        content = '''view: orders {
+  derived_table: {
+    sql: SELECT STRUCT(1 AS a) AS s, '}' AS b -- }
+      FROM t # {
+      WHERE x = '{' ;;
+  }
+}
+'''
+        assert errors_of(validator, content) == []
+
+    def test_missing_sql_terminator(self, validator):
+        content = '''view: orders {
+  dimension: id {
+    sql: ${TABLE}.id
+  }
+}
+'''
+        assert errors_of(validator, content) == ["Line 3: SQL/HTML/Expression block should end with ;;"]
+
+    def test_unclosed_reference(self, validator):
+        content = 'view: orders {\n  dimension: id {\n    sql: ${TABLE.id ;;\n  }\n}\n'
+        assert errors_of(validator, content) == ["Line 3: Unclosed ${ reference"]
+
+    def test_braces_and_quotes_spanning_lines_in_expressions(self, validator):
+        content = """view: orders {
+  dimension: amount {
+    html: {% if value > 0 %}
+      <b>{{ rendered_value
+}}</b>
+{% endif %} ;;
+    sql: CONCAT('a
+}
+b', ${
+      TABLE}.amount) ;;
+  }
+  dimension: note {
+    html: <p>Don't {{ value }}</p>
+      <style>.x { color: red;
+}</style> ;;
+  }
+}
+"""
+        assert errors_of(validator, content) == []
+
+    def test_unclosed_reference_spanning_lines(self, validator):
+        content = 'view: orders {\n  dimension: id {\n    sql: ${TABLE}.id + ${\n  other ;;\n  }\n}\n'
+        assert errors_of(validator, content) == ["Line 3: Unclosed ${ reference"]
+
+    def test_missing_terminator_resumes_at_the_enclosing_block(self, validator):
+        content = 'view: orders {\n  dimension: id {\n    html: {{ value\n}} <i>bold</i>\n  }\n}\n'
+        assert errors_of(validator, content) == ["Line 3: SQL/HTML/Expression block should end with ;;"]
+
+    @pytest.mark.parametrize(
+        'unit',
+        ['${a', 'a ', '}', '{{', "'", 'sql: x\n}\n', '# # ', 'a: "b" ', 'fields: [a, '],
+        ids=['references', 'keys', 'closing', 'braces', 'quotes', 'unterminated', 'comments', 'values', 'lists'],
+    )
+    def test_validation_is_linear_in_the_content(self, validator, unit):
+        """Validating 4 times the content of repeated tokens takes about 4 times as long, not 16."""
+
+        def best_time(repeat):
+            content = 'view: orders {\n  dimension: id {\n    sql: ' + unit * repeat + ' ;;\n  }\n}\n'
+            best = float('inf')
+            for _ in range(3):
+                start = time.perf_counter()
+                validator.validate_lookml_string(content)
+                best = min(best, time.perf_counter() - start)
+            return best
+
+        small, large = best_time(5000), best_time(20000)
+        assert large < max(small, 0.005) * 8
+
+    def test_unterminated_string(self, validator):
+        content = 'view: orders {\n  dimension: id {\n    label: "Order\n  }\n}\n'
+        assert errors_of(validator, content)[0] == "Line 3: Unterminated string"
+
+    def test_unmatched_closing_brace(self, validator):
+        content = 'view: orders {\n  dimension: id {\n    type: string\n  }\n}\n}\n'
+        assert errors_of(validator, content) == ["Line 6: Unmatched closing brace"]
+
+    def test_unmatched_opening_brace(self, validator):
+        content = 'view: orders {\n  dimension: id {\n    type: string\n}\n'
+        assert errors_of(validator, content) == ["Unmatched opening braces at lines: 1"]
+
+    def test_mismatched_bracket(self, validator):
+        content = 'view: orders {\n  set: detail {\n    fields: [id}\n  }\n}\n'
+        assert errors_of(validator, content)[0] == "Line 3: '}' closes '[' opened at line 3"
+
+    def test_missing_value_and_colon(self, validator):
+        content = 'view: orders {\n  dimension: id {\n    type:\n  }\n  hidden\n}\n'
+        assert errors_of(validator, content) == [
+            "Line 3: Missing value for 'type'",
+            "Line 5: Expected ':' after 'hidden'",
+        ]
+
+
+class TestValidateDirectory:
+    @pytest.fixture
+    def lookml_dir(self, tmp_path):
+        for index in range(20):
+            folder = tmp_path / f"schema_{index % 3}"
+            folder.mkdir(exist_ok=True)
+            content = f'view: view_{index} {{\n  dimension: id {{\n    sql: ${{TABLE}}.id ;;\n  }}\n}}\n'
+            if index % 7 == 0:
+                content += '}\n'
+            (folder / f"view_{index:02d}.view.lkml").write_text(content)
+        (tmp_path / 'top.view.lkml').write_text('view: top {}\n')
+        return tmp_path
+
+    def test_walks_subdirectories_once_in_path_order(self, validator, lookml_dir):
+        result = validator.validate_directory(lookml_dir, jobs=1)
+        files = [file_result['file'] for file_result in result['results']]
+        assert files == sorted(str(path.relative_to(lookml_dir)) for path in lookml_dir.rglob('*.lkml'))
+        assert (result['total_files'], result['valid_files'], result['invalid_files']) == (21, 18, 3)
+        assert not result['valid']
+
+    def test_process_pool_matches_in_process_results(self, validator, lookml_dir):
+        in_process = validator.validate_directory(lookml_dir, jobs=1, use_cache=False)
+        assert validator.validate_directory(lookml_dir, jobs=2, use_cache=False) == in_process
+
+    def test_only_new_or_changed_files_are_validated_again(self, validator, lookml_dir):
+        first = validator.validate_directory(lookml_dir, jobs=1)
+        changed = lookml_dir / 'schema_1' / 'view_01.view.lkml'
+        changed.write_text('view: changed {}\n')
+
+        with patch.object(validator, '_validate_single_file', wraps=validator._validate_single_file) as validate_file:
+            second = validator.validate_directory(lookml_dir, jobs=1)
+
+        # The changed file and the three invalid ones
+        validated = sorted(str(call.args[0].relative_to(lookml_dir)) for call in validate_file.call_args_list)
+        assert validated == [
+            'schema_0/view_00.view.lkml',
+            'schema_1/view_01.view.lkml',
+            'schema_1/view_07.view.lkml',
+            'schema_2/view_14.view.lkml',
+        ]
+        assert [result['file'] for result in second['results']] == [result['file'] for result in first['results']]
+        assert [result['valid'] for result in second['results']] == [result['valid'] for result in first['results']]
+
+    def test_cache_is_discarded_when_validator_version_changes(self, validator, lookml_dir):
+        validator.validate_directory(lookml_dir, jobs=1)
+        assert (lookml_dir / VALIDATION_CACHE_FILE).exists()
+
+        validator.version = 'next'
+        with patch.object(validator, '_validate_single_file', wraps=validator._validate_single_file) as validate_file:
+            validator.validate_directory(lookml_dir, jobs=1)
+        assert validate_file.call_count == 21
+
+    def test_worker_errors_are_reported_per_file(self, validator, lookml_dir):
+        files = sorted(lookml_dir.rglob('*.lkml'))
+        with patch('dbt2lookml.validation._validate_files', failing_worker):
+            results = list(validator.iter_directory_results(files, lookml_dir, jobs=2))
+        assert len(results) == len(files)
+        assert all(result['errors'] == ['Validation error: worker died'] for result in results)
+
+
+class TestLookMLStructureValidator:
+    @pytest.fixture
+    def lookml(self):
+        return {
+            'view': [
+                {
+                    'name': 'orders',
+                    'sql_table_name': '`project.dataset.orders`',
+                    'dimensions': [
+                        {'name': 'id', 'type': 'string', 'sql': '${TABLE}.id'},
+                        {'name': 'items', 'sql': '${TABLE}.items', 'hidden': 'yes'},
+                    ],
+                    'dimension_groups': [
+                        {'name': 'created', 'type': 'time', 'timeframes': ['raw', 'date'], 'sql': '${TABLE}.created'}
+                    ],
+                    'measures': [{'name': 'count', 'type': 'count'}],
+                },
+                {'name': 'orders__items', 'dimensions': [{'name': 'sku', 'type': 'string', 'sql': '${TABLE}.sku'}]},
+            ],
+            'explore': {
+                'name': 'orders',
+                'from': 'orders',
+                'joins': [
+                    {
+                        'name': 'orders__items',
+                        'relationship': 'one_to_many',
+                        'sql': 'LEFT JOIN UNNEST(${orders.items}) AS orders__items',
+                        'type': 'left_outer',
+                    }
+                ],
+            },
+        }
+
+    def test_valid_structure(self, lookml):
+        result = LookMLStructureValidator().validate(lookml, 'orders.view.lkml')
+        assert result['valid'], result['errors']
+        assert result['file'] == 'orders.view.lkml'
+
+    def test_generated_lookml_is_valid(self):
+        args = Namespace(
+            use_table_name=False,
+            include_iso_fields=False,
+            timeframes={},
+            include_models=None,
+            exclude_models=None,
+            target_dir='.',
+            output_dir='.',
+            skip_explore=False,
+            generate_locale=False,
+        )
+        model = DbtModel(
+            name='orders',
+            unique_id='model.test.orders',
+            relation_name='`project`.`dataset`.`orders`',
+            schema='dataset',
+            description='Orders',
+            path='models/orders.sql',
+            tags=[],
+            columns={
+                'Id': {'name': 'Id', 'data_type': 'STRING', 'meta': {'looker': {'measures': [{'type': 'count_distinct'}]}}},
+                'CreatedAt': {'name': 'CreatedAt', 'data_type': 'TIMESTAMP'},
+                'Items': {'name': 'Items', 'data_type': 'ARRAY<STRUCT<Sku STRING>>'},
+                'Items.Sku': {'name': 'Items.Sku', 'data_type': 'STRING'},
+            },
+        )
+        _, lookml = LookmlGenerator(args).generate(model)
+        assert LookMLStructureValidator().validate(lookml)['errors'] == []
+
+    def test_missing_required_keys(self, lookml):
+        del lookml['view'][0]['dimension_groups'][0]['type']
+        lookml['view'][0]['measures'].append({'type': 'sum', 'sql': '${TABLE}.amount'})
+        assert LookMLStructureValidator().validate(lookml)['errors'] == [
+            "Dimension_group 'created' in view 'orders' is missing 'type'",
+            "Measure in view 'orders' is missing a name",
+        ]
+
+    def test_sql_expressions_are_checked(self, lookml):
+        lookml['view'][0]['dimensions'][0]['sql'] = '${TABLE}.id ;;'
+        lookml['view'][1]['dimensions'][0]['sql'] = ' '
+        assert LookMLStructureValidator().validate(lookml)['errors'] == [
+            "Dimension 'id' in view 'orders' has ';;' inside 'sql', which would end the expression early",
+            "Dimension 'sku' in view 'orders__items' has an empty 'sql'",
+        ]
+
+    def test_duplicate_names(self, lookml):
+        lookml['view'][0]['measures'].append({'name': 'id', 'type': 'count_distinct', 'sql': '${id}'})
+        lookml['view'].append({'name': 'orders'})
+        errors = LookMLStructureValidator().validate(lookml)['errors']
+        assert errors == ["Duplicate field name 'id' in view 'orders'", "Duplicate view name 'orders'"]
+
+    def test_join_references(self, lookml):
+        joins = lookml['explore']['joins']
+        joins[0]['sql'] = 'LEFT JOIN UNNEST(${orders.tags}) AS orders__items ON ${orders.created_date} IS NOT NULL'
+        joins.append({'name': 'orders__tags', 'sql': 'LEFT JOIN UNNEST(${order.tags}) AS orders__tags'})
+        joins.append({'name': 'orders__items', 'required_joins': ['orders__labels'], 'sql': '${orders.id}'})
+        assert LookMLStructureValidator().validate(lookml)['errors'] == [
+            "Duplicate join name 'orders__items' in explore 'orders'",
+            "Explore 'orders' refers to view 'orders__tags' which is not defined",
+            "Join 'orders__items' refers to unknown field 'orders.tags'",
+            "Join 'orders__tags' refers to unknown view 'order'",
+            "Join 'orders__items' requires unknown join 'orders__labels'",
+        ]
+
+
+class TestFieldReferenceIndex:
+    def test_resolves_references_across_files_in_any_order(self):
+        index = FieldReferenceIndex()
+        index.add(
+            'customers.view.lkml',
+            {
+                'view': [
+                    {
+                        'name': 'customers',
+                        'dimensions': [{'name': 'id', 'sql': '${TABLE}.id'}],
+                        'measures': [
+                            {
+                                'name': 'order_total',
+                                'type': 'sum',
+                                'sql': '${orders.amount} + ${orders.tax} + ${missing.id}',
+                                'filters': [
+                                    {'field': 'orders.created_date', 'value': '7 days'},
+                                    {'field': 'name', 'value': '-x'},
+                                ],
+                            },
+                            {'name': 'distinct', 'type': 'count_distinct', 'sql': '${id}', 'sql_distinct_key': '${orders.id}'},
+                        ],
+                    }
+                ]
+            },
+        )
+        index.add(
+            'orders.view.lkml',
+            {
+                'view': [
+                    {
+                        'name': 'orders',
+                        'dimensions': [{'name': 'id', 'sql': '${TABLE}.id'}, {'name': 'amount', 'sql': '${TABLE}.amount'}],
+                        'dimension_groups': [{'name': 'created', 'type': 'time', 'timeframes': ['date'], 'sql': '${TABLE}.ts'}],
+                    }
+                ]
+            },
+        )
+        assert len(index) == 7
+        assert [str(dangling) for dangling in index.dangling()] == [
+            "customers.view.lkml: measure 'customers.order_total' refers to ${orders.tax} (unknown field 'tax')",
+            "customers.view.lkml: measure 'customers.order_total' refers to ${missing.id} (unknown view 'missing')",
+            "customers.view.lkml: measure 'customers.order_total' refers to ${customers.name} (unknown field 'name')",
+        ]
+
+    def test_explore_aliases_and_meta_joins(self):
+        model = DbtModel(
+            name='orders_model',
+            unique_id='model.test.orders_model',
+            relation_name='`project`.`dataset`.`orders`',
+            schema='dataset',
+            description='Orders',
+            path='models/orders.sql',
+            tags=[],
+            columns={},
+            meta={'looker': {'joins': [{'join_model': 'customers', 'sql_on': '${customers.id} = ${orders_model.customer_id}'}]}},
+        )
+        index = FieldReferenceIndex()
+        index.add(
+            'orders.view.lkml',
+            {
+                'view': [{'name': 'orders', 'dimensions': [{'name': 'items', 'sql': '${TABLE}.items'}]}],
+                'explore': {
+                    'name': 'all_orders',
+                    'from': 'orders',
+                    'joins': [{'name': 'orders__items', 'sql': 'LEFT JOIN UNNEST(${all_orders.items}) AS orders__items'}],
+                },
+            },
+            model,
+        )
+        index.add('customers.view.lkml', {'view': [{'name': 'customers', 'dimensions': [{'name': 'id'}]}]})
+        assert [str(dangling) for dangling in index.dangling()] == [
+            "orders.view.lkml: meta.looker.joins 'customers' of model 'orders_model' refers to ${orders_model.customer_id} "
+            "(unknown field 'customer_id')"
+        ]
@@ -0,0 +1,107 @@
+"""Tests for the run-wide LookML fragment cache."""
+
+from argparse import Namespace
+
+import pytest
+
+from dbt2lookml.generators import LookmlGenerator
+from dbt2lookml.generators.fragment_cache import FragmentCache
+from dbt2lookml.models.dbt import DbtModel
+
+
+def make_model(name):
+    return DbtModel(
+        name=name,
+        unique_id=f"model.test.{name}",
+        relation_name=f"`project`.`dataset`.`{name}`",
+        schema="dataset",
+        description=name,
+        path=f"models/{name}.sql",
+        tags=[],
+        columns={
+            "LoadedAt": {"name": "LoadedAt", "data_type": "TIMESTAMP", "description": "Load time"},
+            "Amount": {
+                "name": "Amount",
+                "data_type": "NUMERIC",
+                "description": "Amount",
+                "meta": {"looker": {"measures": [{"type": "sum"}]}},
+            },
+            "Audit.UpdatedBy": {"name": "Audit.UpdatedBy", "data_type": "STRING", "description": "Updated by"},
+        },
+    )
+
+
+@pytest.fixture
+def cli_args():
+    return Namespace(
+        use_table_name=False,
+        include_iso_fields=False,
+        timeframes={},
+        include_models=None,
+        exclude_models=None,
+        target_dir='.',
+        output_dir='.',
+        skip_explore=False,
+        generate_locale=False,
+    )
+
+
+class TestFragmentCache:
+    def test_hits_and_misses_per_kind(self):
+        cache = FragmentCache()
+        assert cache.get_or_build('dimension', 'a', lambda: {'name': 'a'}) == {'name': 'a'}
+        assert cache.get_or_build('dimension', 'a', lambda: pytest.fail('should be cached')) == {'name': 'a'}
+        cache.get_or_build('measure', 'a', lambda: {'name': 'm'})
+        assert cache.stats() == {
+            'dimension': {'hits': 1, 'misses': 1, 'hit_rate': 0.5},
+            'measure': {'hits': 0, 'misses': 1, 'hit_rate': 0.0},
+        }
+
+    def test_returns_independent_copies(self):
+        cache = FragmentCache()
+        built = cache.get_or_build('dimension', 'a', lambda: {'tags': ['array'], 'group': ({'x': 1}, None)})
+        built['tags'].append('changed')
+        first = cache.get_or_build('dimension', 'a', lambda: None)
+        first['tags'].append('again')
+        first['group'][0]['x'] = 2
+        assert cache.get_or_build('dimension', 'a', lambda: None) == {'tags': ['array'], 'group': ({'x': 1}, None)}
+
+    def test_evicts_least_recently_used(self):
+        cache = FragmentCache(maxsize=2)
+        cache.get_or_build('dimension', 'a', lambda: 1)
+        cache.get_or_build('dimension', 'b', lambda: 2)
+        cache.get_or_build('dimension', 'a', lambda: 1)
+        cache.get_or_build('dimension', 'c', lambda: 3)
+        assert len(cache) == 2
+        assert cache.get_or_build('dimension', 'b', lambda: 'rebuilt') == 'rebuilt'
+
+
+class TestFragmentCacheInGeneration:
+    def test_identical_columns_are_shared_across_models(self, cli_args):
+        names = ('orders', 'refunds')
+        expected = [LookmlGenerator(cli_args).generate(make_model(name)) for name in names]
+
+        cache = FragmentCache()
+        outputs = []
+        for name in names:
+            generator = LookmlGenerator(cli_args)
+            generator.use_fragment_cache(cache)
+            outputs.append(generator.generate(make_model(name)))
+
+        assert outputs == expected
+        assert outputs[0] != outputs[1]
+        stats = cache.stats()
+        assert stats['dimension']['hits'] >= 1
+        assert stats['dimension_group']['hits'] >= 1
+        assert stats['measure']['hits'] >= 1
+
+    def test_columns_without_description_are_not_cached(self, cli_args):
+        model = make_model('orders')
+        model.columns['amount'].description = None
+        cache = FragmentCache()
+        generator = LookmlGenerator(cli_args)
+        generator.use_fragment_cache(cache)
+        column = model.columns['amount']
+        generator.dimension_generator.create_dimension(column, '${TABLE}.Amount', model)
+        generator.dimension_generator.create_dimension(column, '${TABLE}.Amount', model)
+        assert 'dimension' not in cache.stats()
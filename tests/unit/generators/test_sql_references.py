@@ -0,0 +1,62 @@
+"""Tests for the per-model SQL reference resolver."""
+
+from unittest.mock import patch
+
+import pytest
+
+from dbt2lookml.generators.sql_references import SqlReferenceResolver, get_sql_reference_resolver
+from dbt2lookml.generators.utils import get_column_name
+from dbt2lookml.models.dbt import DbtModel
+
+
+@pytest.fixture
+def model():
+    return DbtModel(
+        name="orders",
+        unique_id="model.test.orders",
+        relation_name="`project`.`dataset`.`orders`",
+        schema="dataset",
+        description="Orders",
+        path="models/orders.sql",
+        tags=[],
+        columns={
+            "OrderId": {"name": "OrderId", "data_type": "STRING"},
+            "Items": {"name": "Items", "data_type": "ARRAY<STRUCT<Sku STRING, Parts ARRAY<STRUCT<Name STRING>>>>"},
+            "Items.Sku": {"name": "Items.Sku", "data_type": "STRING"},
+            "Items.Parts": {"name": "Items.Parts", "data_type": "ARRAY<STRUCT<Name STRING>>"},
+            "Items.Parts.Name": {"name": "Items.Parts.Name", "data_type": "STRING"},
+            "Customer.Full Name": {"name": "Customer.Full Name", "data_type": "STRING"},
+        },
+    )
+
+
+class TestSqlReferenceResolver:
+    def test_matches_get_column_name_in_every_view_context(self, model):
+        resolver = SqlReferenceResolver(model.columns)
+        contexts = [(False, None), (True, "items"), (True, "items.parts")]
+        for column in model.columns.values():
+            for is_nested_view, array_model_name in contexts:
+                expected = get_column_name(column, True, None, model.unique_id, is_nested_view, array_model_name)
+                assert resolver.resolve(column, is_nested_view, array_model_name) == expected
+
+    def test_nested_references_are_precomputed(self, model):
+        resolver = SqlReferenceResolver(model.columns)
+        with patch('dbt2lookml.generators.sql_references.get_column_name') as mock_get_column_name:
+            assert resolver.resolve(model.columns["orderid"]) == "${TABLE}.OrderId"
+            assert resolver.resolve(model.columns["items.sku"], True, "items") == "${TABLE}.Sku"
+            assert resolver.resolve(model.columns["items.parts.name"], True, "items") == "${TABLE}.Parts.Name"
+            assert resolver.resolve(model.columns["items.parts.name"], True, "items.parts") == "${TABLE}.Name"
+            assert resolver.resolve(model.columns["customer.full name"]) == "${TABLE}.`Customer.Full Name`"
+        mock_get_column_name.assert_not_called()
+
+    def test_renamed_column_is_resolved_again(self, model):
+        resolver = SqlReferenceResolver(model.columns)
+        column = model.columns["orderid"]
+        column.set_original_name("ORDERID")
+        assert resolver.resolve(column) == "${TABLE}.ORDERID"
+
+    def test_resolver_cached_per_columns_dict(self, model):
+        resolver = get_sql_reference_resolver(model)
+        assert get_sql_reference_resolver(model) is resolver
+        model.columns = dict(model.columns)
+        assert get_sql_reference_resolver(model) is not resolver
@@ -219,15 +219,14 @@ class TestTransformDateColumnNameComprehensive:
         assert mock_debug.called
         assert result == "items_item"  # Current behavior: doesn't strip prefix correctly
 
-    def test_camel_to_snake_integration(self):
-        """Test integration with camel_to_snake utility function."""
-        with patch('dbt2lookml.generators.dimension.camel_to_snake') as mock_camel_to_snake:
-            mock_camel_to_snake.return_value = "mocked_result"
+    def test_uses_precomputed_naming(self):
+        """Test that the date name comes from the column naming record."""
+        column = DbtModelColumn(name="TestCamelCaseDate", data_type="DATE")
+        assert column.naming.date_name == "test_camel_case"
 
-            column = DbtModelColumn(name="TestCamelCaseDate", data_type="DATE")
-            column.original_name = "TestCamelCaseDate"
+        with patch('dbt2lookml.models.column_naming.camel_to_snake') as mock_camel_to_snake:
             result = self.generator.transform_date_column_name(column)
 
-            # Should call camel_to_snake with "TestCamelCase" (Date suffix removed)
-            mock_camel_to_snake.assert_called_with("TestCamelCase")
-            assert result == "mocked_result"
+        # The name was converted at parse time, not again per dimension group
+        mock_camel_to_snake.assert_not_called()
+        assert result == "test_camel_case"
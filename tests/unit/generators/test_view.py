@@ -9,6 +9,7 @@ from dbt2lookml.generators.view import LookmlViewGenerator
 from dbt2lookml.models.dbt import (
     DbtModel,
     DbtModelColumn,
+    DbtModelHeaderMetadata,
     DbtModelMeta,
     DbtResourceType,
 )
@@ -505,3 +506,17 @@ class TestLookmlViewGenerator:
             assert isinstance(result, list)
             assert len(result) == 1
             assert result[0]['name'] == 'test_view'
+
+    def test_model_header_comment_with_header_metadata(self, cli_args, sample_model):
+        """Test the header comment shows the metadata extracted at parse time."""
+        generator = LookmlViewGenerator(cli_args)
+        sample_model.header_metadata = DbtModelHeaderMetadata(owner="data-team", contains_pii=True, group="finance")
+
+        assert generator._generate_model_header_comment(sample_model) == (
+            "# Model: test_model\n"
+            "# Description: Test model\n"
+            "# Tags: \n"
+            "# Owner: data-team\n"
+            "# PII: Yes\n"
+            "# Group: finance\n\n"
+        )
@@ -0,0 +1,71 @@
+"""Tests for the per-column naming record."""
+
+import pytest
+
+from dbt2lookml.models.column_naming import ColumnNaming, get_column_naming
+from dbt2lookml.models.column_record import ColumnRecord
+from dbt2lookml.models.dbt import DbtModelColumn
+
+
+class TestColumnNaming:
+    def test_nested_camel_case_names(self):
+        naming = ColumnNaming.from_names("classification.itemgroup.code", "Classification.ItemGroup.Code")
+        assert naming.snake_parts == ("classification", "item_group", "code")
+        assert naming.lookml_long_name == "classification__item_group__code"
+        assert naming.lookml_name == "code"
+        assert naming.dimension_name == "classification__item_group__code"
+        assert naming.group_label == "Classification Itemgroup"
+        assert naming.item_label == "Code"
+        assert naming.dimension_group_label == "Classification Item Group"
+        assert naming.sql_path == "Classification.ItemGroup.Code"
+
+    @pytest.mark.parametrize(
+        "original_name, date_name",
+        [
+            ("DeliveryStartDate", "delivery_start"),
+            ("deliverystartdate", "deliverystart"),
+            ("created_date", "created"),
+            ("Date", "date"),
+            ("format.period.EndDate", "format__period__end"),
+        ],
+    )
+    def test_date_name(self, original_name, date_name):
+        assert ColumnNaming.from_names(original_name.lower(), original_name).date_name == date_name
+
+    def test_sql_path_is_quoted_when_needed(self):
+        assert ColumnNaming.from_names("på lager", "På Lager").sql_path == "`På Lager`"
+
+    def test_naming_is_immutable(self):
+        naming = ColumnNaming.from_names("id")
+        with pytest.raises(AttributeError):
+            naming.lookml_name = "other"
+
+
+class TestColumnNamingOnColumns:
+    def test_column_names_derive_from_naming(self):
+        column = DbtModelColumn(name="Supplier.GTINId", data_type="STRING")
+        assert column.naming.lookml_long_name == column.lookml_long_name == "supplier__gtin_id"
+        assert column.naming.lookml_name == column.lookml_name == "gtin_id"
+        assert column.naming is column.naming
+
+    def test_set_original_name_keeps_names_in_sync(self):
+        column = DbtModelColumn(name="items.itemname", data_type="STRING")
+        assert column.lookml_long_name == "items__itemname"
+
+        column.set_original_name("Items.ItemName")
+
+        assert column.original_name == "Items.ItemName"
+        assert column.lookml_long_name == "items__item_name"
+        assert column.lookml_name == "item_name"
+        assert column.naming.item_label == "Item name"
+
+    def test_naming_rebuilt_after_direct_assignment(self):
+        column = DbtModelColumn(name="orderdate", data_type="DATE")
+        column.original_name = "OrderDate"
+        assert column.naming.date_name == "order"
+
+    def test_record_shares_column_naming(self):
+        column = DbtModelColumn(name="OrderId", data_type="STRING")
+        record = ColumnRecord.from_column(column)
+        assert record.naming is column.naming
+        assert get_column_naming(record) is column.naming
@@ -0,0 +1,110 @@
+"""Tests for the compact column records used during generation."""
+
+import tracemalloc
+
+import pytest
+
+from dbt2lookml.models.column_collections import ColumnCollections
+from dbt2lookml.models.column_record import ColumnRecord, get_column_records
+from dbt2lookml.models.dbt import DbtModel, DbtModelColumn, DbtModelColumnMeta
+
+WIDE_COLUMNS = 2000
+
+
+@pytest.fixture
+def model():
+    return DbtModel(
+        name="orders",
+        unique_id="model.test.orders",
+        relation_name="`project`.`dataset`.`orders`",
+        schema="dataset",
+        description="Orders",
+        path="models/orders.sql",
+        tags=[],
+        columns={
+            "OrderId": {
+                "name": "OrderId",
+                "data_type": "STRING",
+                "meta": {"looker": {"dimension": {"label": "Order"}, "measures": [{"type": "count_distinct"}]}},
+            },
+            "items": {"name": "items", "data_type": "ARRAY<STRUCT<sku STRING>>"},
+            "items.sku": {"name": "items.sku", "data_type": "STRING"},
+        },
+    )
+
+
+class TestColumnRecord:
+    def test_from_column_mirrors_column(self, model):
+        column = model.columns["orderid"]
+        record = ColumnRecord.from_column(column)
+        assert record.name == "orderid"
+        assert record.original_name == "OrderId"
+        assert record.data_type == "STRING"
+        assert record.lookml_name == column.lookml_name
+        assert record.lookml_long_name == column.lookml_long_name
+        assert record.nested is False
+        assert record.looker_dimension is column.meta.looker.dimension
+        assert record.looker_measures == tuple(column.meta.looker.measures)
+
+    def test_record_is_slotted_and_immutable(self, model):
+        record = ColumnRecord.from_column(model.columns["orderid"])
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.name = "other"
+        with pytest.raises(AttributeError):
+            del record.name
+
+    def test_records_built_once_per_columns_dict(self, model):
+        records = get_column_records(model)
+        assert get_column_records(model) is records
+        model.columns = dict(model.columns)
+        assert get_column_records(model) is not records
+
+    def test_column_collections_hold_records(self, model):
+        collections = ColumnCollections.from_model(model)
+        assert isinstance(collections.main_view_columns["orderid"], ColumnRecord)
+        assert collections.main_view_columns["orderid"] is get_column_records(model)["orderid"]
+        assert set(collections.nested_view_columns["items"]) == {"items", "items.sku"}
+
+
+def wide_model(columns):
+    return DbtModel(
+        name="wide",
+        unique_id="model.test.wide",
+        relation_name="`project`.`dataset`.`wide`",
+        schema="dataset",
+        description="Wide",
+        path="models/wide.sql",
+        tags=[],
+        columns=columns,
+    )
+
+
+def traced_bytes(build):
+    """Get the memory still held by what build returns."""
+    tracemalloc.start()
+    try:
+        kept = build()
+        current, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert kept is not None
+    return current
+
+
+class TestWideTableMemory:
+    def test_columns_with_records_take_less_memory_than_columns_with_their_own_meta(self):
+        # Build the schemas outside of the traced allocations
+        wide_model({"id": {"name": "id", "meta": {}}})
+        names = [f"Column_{i}" for i in range(WIDE_COLUMNS)]
+
+        def columns_with_own_meta():
+            return wide_model({name: DbtModelColumn(name=name, data_type="STRING", meta=DbtModelColumnMeta()) for name in names})
+
+        def columns_with_records():
+            model = wide_model({name: {"name": name, "data_type": "STRING", "meta": {}} for name in names})
+            return model, get_column_records(model)
+
+        own_meta = traced_bytes(columns_with_own_meta)
+        with_records = traced_bytes(columns_with_records)
+        assert with_records < 0.8 * own_meta, f"{with_records} bytes with records, {own_meta} bytes with a meta per column"
@@ -6,6 +6,7 @@ from dbt2lookml.models.dbt import (
     DbtModel,
     DbtModelColumn,
     DbtModelColumnMeta,
+    DbtModelHeaderMetadata,
     DbtModelMeta,
 )
 from dbt2lookml.models.looker import DbtMetaLooker, DbtMetaLookerBase, DbtMetaLookerDimension
@@ -57,6 +58,32 @@ class TestDbtModels:
         assert isinstance(model.columns["id"].meta.looker, DbtMetaLooker)
         assert isinstance(model.columns["id"].meta.looker.dimension, DbtMetaLookerDimension)
 
+    def test_columns_without_looker_meta_share_their_meta(self, sample_model_data):
+        """Test columns without Looker metadata share one meta instead of each building one"""
+        first = DbtModelColumn(name="first", meta={})
+        second = DbtModelColumn(name="second")
+        assert first.meta is second.meta
+        assert isinstance(first.meta.looker, DbtMetaLooker)
+        assert first.looker_dimension is None
+        assert first.looker_measures == []
+        model = DbtModel(**sample_model_data)
+        assert model.columns["id"].meta is not first.meta
+
+    def test_dbt_model_header_metadata(self, sample_model_data):
+        """Test header metadata is extracted from the raw node meta and group"""
+        sample_model_data["meta"] = {"owner": "data-team", "model_maturity": "high", "contains_pii": True}
+        sample_model_data["group"] = "finance"
+        model = DbtModel(**sample_model_data)
+        assert model.header_metadata == DbtModelHeaderMetadata(
+            owner="data-team", maturity="high", contains_pii=True, group="finance"
+        )
+
+    def test_dbt_model_header_metadata_defaults(self, sample_model_data):
+        """Test header metadata is empty without owner, maturity, pii or group"""
+        model = DbtModel(**sample_model_data)
+        assert model.header_metadata == DbtModelHeaderMetadata()
+        assert model.model_copy().header_metadata == DbtModelHeaderMetadata()
+
     def test_dbt_model_column_validation(self):
         """Test DbtModelColumn validation"""
         column = DbtModelColumn(
@@ -0,0 +1,85 @@
+"""Tests for the catalog updates of the DBT parser."""
+
+import os
+import tempfile
+from argparse import Namespace
+
+import pytest
+
+from dbt2lookml.models.column_record import get_column_records
+from dbt2lookml.parsers import DbtParser
+
+MANIFEST = {
+    'metadata': {'adapter_type': 'bigquery'},
+    'nodes': {
+        'model.p.orders': {
+            'resource_type': 'model',
+            'name': 'orders',
+            'schema': 'shop',
+            'database': 'db',
+            'relation_name': '`db`.`shop`.`orders`',
+            'unique_id': 'model.p.orders',
+            'tags': [],
+            'description': 'orders',
+            'columns': {'id': {'name': 'id', 'data_type': 'INT64', 'description': 'Id'}},
+            'path': 'shop/orders.sql',
+            'meta': {},
+        }
+    },
+    'sources': {},
+    'exposures': {},
+}
+CATALOG = {
+    'nodes': {
+        'model.p.orders': {
+            'metadata': {'type': 'table', 'schema': 'shop', 'name': 'orders', 'database': 'db'},
+            'columns': {
+                'id': {'type': 'INT64', 'name': 'id', 'index': 1},
+                'total': {'type': 'NUMERIC', 'name': 'total', 'index': 2},
+            },
+        }
+    }
+}
+
+
+@pytest.fixture
+def index_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, 'tempdir', str(tmp_path))
+    return tmp_path
+
+
+class TestDbtParserCatalog:
+    def test_models_read_the_raw_catalog_without_an_index_file(self, index_dir):
+        parser = DbtParser(Namespace(), MANIFEST, CATALOG)
+        [model] = parser.iter_models(parser.select_models())
+        assert model._catalog_data is CATALOG
+        parser.close()
+        assert os.listdir(index_dir) == []
+
+    def test_indexed_models_read_the_index_until_closed(self, index_dir):
+        parser = DbtParser(Namespace(), MANIFEST, CATALOG)
+        parser.index_catalog()
+        [model] = parser.iter_models(parser.select_models())
+        assert model._catalog_data['nodes']['model.p.orders'] == CATALOG['nodes']['model.p.orders']
+        assert len(os.listdir(index_dir)) == 1
+        parser.close()
+        assert os.listdir(index_dir) == []
+
+    def test_models_are_updated_in_place_until_released(self, index_dir):
+        parser = DbtParser(Namespace(), MANIFEST, CATALOG)
+        [selected] = parser.select_models()
+        manifest_columns = selected.columns
+        [model] = parser.iter_models([selected])
+        assert model is selected
+        assert list(model.columns) == ['id', 'total']
+        assert model.columns['id'] is manifest_columns['id']
+        assert list(get_column_records(model)) == ['id', 'total']
+
+        parser.release(model)
+        assert model.columns is manifest_columns
+        assert list(model.columns) == ['id']
+        assert model._column_records is None
+        # A released model can be updated again
+        [model] = parser.iter_models([selected])
+        assert list(model.columns) == ['id', 'total']
+        parser.close()
@@ -90,3 +90,38 @@ class TestCatalogParser:
         assert processed_model is not None
         assert processed_model.columns["id"].data_type == "INT64"
         assert processed_model.columns["id"].inner_types == ["INT64"]
+
+    def test_process_model_does_not_copy_columns(self):
+        """Test that a wide catalog is merged into the model without copying model or columns."""
+        column_count = 10000
+        raw_catalog = {
+            "nodes": {
+                "model.test.wide": {
+                    "metadata": {"type": "table", "schema": "test_schema", "name": "wide"},
+                    "columns": {f"Col{i}": {"name": f"Col{i}", "type": "STRING", "index": i} for i in range(column_count)},
+                }
+            }
+        }
+        catalog = DbtCatalog(**raw_catalog)
+        model = DbtModel(
+            name="wide",
+            unique_id="model.test.wide",
+            relation_name="wide",
+            schema="test_schema",
+            description="Wide model",
+            columns={"col0": {"name": "col0", "description": "First column"}},
+            path="models/wide.sql",
+            tags=[],
+        )
+        manifest_column = model.columns["col0"]
+
+        processed_model = CatalogParser(catalog, raw_catalog).process_model_columns(model)
+
+        assert processed_model is model
+        assert processed_model.columns["col0"] is manifest_column
+        assert manifest_column.data_type == "STRING"
+        assert manifest_column.original_name == "Col0"
+        assert len(processed_model.columns) == column_count
+        assert processed_model.columns["col9999"].original_name == "Col9999"
+        # Raw catalog input is left untouched by catalog validation
+        assert "original_name" not in raw_catalog["nodes"]["model.test.wide"]["columns"]["Col1"]
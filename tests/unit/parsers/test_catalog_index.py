@@ -0,0 +1,105 @@
+"""Tests for the memory-mapped catalog index."""
+
+import os
+import pickle
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dbt2lookml.generators.utils import get_catalog_column_info
+from dbt2lookml.parsers.catalog_index import CatalogIndex
+
+RAW_CATALOG = {
+    'metadata': {'dbt_version': '1.8.0'},
+    'nodes': {
+        f'model.test.model_{i}': {
+            'metadata': {'type': 'table', 'schema': 'test', 'name': f'model_{i}'},
+            'columns': {
+                'Id': {'name': 'Id', 'type': 'INT64', 'index': 1, 'comment': 'Identifiant ünique'},
+                'items': {'name': 'items', 'type': 'ARRAY<STRING>', 'index': 2},
+            },
+        }
+        for i in range(50)
+    },
+}
+
+
+@pytest.fixture
+def catalog_index(tmp_path):
+    index = CatalogIndex.build(RAW_CATALOG, str(tmp_path))
+    yield index
+    index.close()
+
+
+class TestCatalogIndex:
+    def test_reads_like_the_raw_catalog(self, catalog_index):
+        nodes = catalog_index['nodes']
+        assert len(nodes) == 50
+        assert 'model.test.model_7' in nodes
+        assert 'model.test.missing' not in nodes
+        assert nodes['model.test.model_7'] == RAW_CATALOG['nodes']['model.test.model_7']
+        assert catalog_index.get('metadata') is None
+        assert get_catalog_column_info('id', catalog_index, 'model.test.model_3', 'Id')['comment'] == 'Identifiant ünique'
+        assert get_catalog_column_info('id', catalog_index, 'model.test.missing', 'Id') is None
+
+    def test_repeated_lookups_share_the_decoded_node(self, catalog_index):
+        assert catalog_index.node('model.test.model_1') is catalog_index.node('model.test.model_1')
+        assert catalog_index.node('model.test.missing') is None
+
+    def test_lookups_from_many_threads(self, catalog_index):
+        unique_ids = [f'model.test.model_{i % 50}' for i in range(2000)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            names = list(executor.map(lambda unique_id: catalog_index.node(unique_id)['metadata']['name'], unique_ids))
+        assert names == [unique_id.split('.')[-1] for unique_id in unique_ids]
+
+    def test_pickles_as_its_path(self, catalog_index):
+        payload = pickle.dumps(catalog_index)
+        assert len(payload) < 200
+        assert pickle.loads(payload) is catalog_index
+
+    def test_other_processes_attach_to_the_file(self, catalog_index):
+        payload = pickle.dumps(catalog_index['nodes']._index)
+        script = (
+            "import pickle, sys; index = pickle.loads(sys.stdin.buffer.read()); "
+            "print(index['nodes']['model.test.model_42']['columns']['items']['type'])"
+        )
+        result = subprocess.run([sys.executable, '-c', script], input=payload, capture_output=True, check=True)
+        assert result.stdout.decode().strip() == 'ARRAY<STRING>'
+        # Attaching does not take ownership of the file
+        assert os.path.exists(catalog_index.path)
+
+    def test_other_processes_attach_once(self, catalog_index):
+        payload = pickle.dumps(catalog_index)
+        script = (
+            "import gc, pickle, sys\n"
+            "from dbt2lookml.parsers.catalog_index import CatalogIndex\n"
+            "payload = sys.stdin.buffer.read()\n"
+            "opened = []\n"
+            "init = CatalogIndex.__init__\n"
+            "CatalogIndex.__init__ = lambda self, *args, **kwargs: opened.append(args) or init(self, *args, **kwargs)\n"
+            "for i in range(3):\n"
+            "    pickle.loads(payload)['nodes'][f'model.test.model_{i}']\n"
+            "    gc.collect()\n"
+            "print(len(opened))\n"
+        )
+        result = subprocess.run([sys.executable, '-c', script], input=payload, capture_output=True, check=True)
+        assert result.stdout.decode().strip() == '1'
+
+    def test_close_removes_the_file(self, tmp_path):
+        index = CatalogIndex.build(RAW_CATALOG, str(tmp_path))
+        index.close()
+        index.close()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_empty_catalog(self, tmp_path):
+        index = CatalogIndex.build({}, str(tmp_path))
+        assert len(index['nodes']) == 0
+        index.close()
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / 'catalog.json'
+        path.write_text('{"nodes": {}}' + ' ' * 64)
+        with pytest.raises(ValueError):
+            CatalogIndex(str(path))
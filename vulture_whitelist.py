@@ -90,11 +90,5 @@ mock_logging
 lookml_v1
 lookml_v3
 
-# Compiled regex patterns used dynamically
-regex_patterns_compiled
-
-# Block type variables used in parsing
-current_block_type
-
 # Template variables
 msg_template